@@ -41,6 +41,10 @@ setup(
             "mypy>=1.5.0",
             "pre-commit>=3.3.0",
         ],
+        "perf": [
+            "numba>=0.58.0",
+            "orjson>=3.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,135 @@
+"""Numeric kernels for per-strike option chain scans.
+
+Numba is an optional dependency. When it is not installed the kernels run as
+plain Python functions with the same results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on optional dependency
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# Code -> label lookups for kernel outputs
+SIGNAL_LABELS = ("bullish", "bearish", "neutral")
+SIGNIFICANCE_LABELS = ("high", "medium", "low")
+
+
+@njit(cache=True, fastmath=True)
+def classify_strikes(
+    strike: np.ndarray,
+    ce_oi: np.ndarray,
+    pe_oi: np.ndarray,
+    spot: float,
+    range_w: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Classify every strike of an option chain in one pass.
+
+    Args:
+        strike: Strike prices
+        ce_oi: Call open interest per strike
+        pe_oi: Put open interest per strike
+        spot: Current underlying price
+        range_w: Width of range around the spot price
+
+    Returns:
+        Tuple of (in_range mask, signal codes, significance codes, PE/CE OI ratios).
+        Codes index into SIGNAL_LABELS and SIGNIFICANCE_LABELS.
+    """
+    n = strike.shape[0]
+    in_range = np.zeros(n, dtype=np.bool_)
+    signals = np.empty(n, dtype=np.int8)
+    significance = np.empty(n, dtype=np.int8)
+    ratios = np.zeros(n, dtype=np.float64)
+
+    lo = spot - range_w
+    hi = spot + range_w
+
+    for i in range(n):
+        ce = ce_oi[i]
+        pe = pe_oi[i]
+
+        in_range[i] = strike[i] >= lo and strike[i] <= hi
+
+        if ce > 0:
+            ratios[i] = pe / ce
+
+        # Strong put bias is bullish, strong call bias is bearish
+        if pe > ce * 1.2:
+            signals[i] = 0
+        elif ce > pe * 1.2:
+            signals[i] = 1
+        else:
+            signals[i] = 2
+
+        total = ce + pe
+        if total > 10_000_000:
+            significance[i] = 0
+        elif total > 5_000_000:
+            significance[i] = 1
+        else:
+            significance[i] = 2
+
+    return in_range, signals, significance, ratios
+
+
+@njit(cache=True)
+def scan_atm_window(
+    strike: np.ndarray,
+    ce_volume: np.ndarray,
+    ce_oi: np.ndarray,
+    pe_volume: np.ndarray,
+    pe_oi: np.ndarray,
+    spot: float,
+    window: float,
+    high_volume: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate volume and OI over the strikes near the spot price.
+
+    Written with whole-array expressions so the same code runs, and stays
+    fast, with or without numba. fastmath is left off so the window test
+    divides exactly like the scalar code it replaces.
+
+    Args:
+        strike: Strike prices
+        ce_volume: Call volume per strike
+        ce_oi: Call open interest per strike
+        pe_volume: Put volume per strike
+        pe_oi: Put open interest per strike
+        spot: Current underlying price
+        window: Relative distance from spot treated as near-ATM
+        high_volume: Volume above which an in-window option is flagged
+
+    Returns:
+        Tuple of (distance from spot, in-window mask, CE high-volume mask,
+        PE high-volume mask, totals). Totals hold the in-window CE volume,
+        PE volume, CE OI and PE OI in that order.
+    """
+    dist = np.abs(strike - spot)
+    atm = dist / spot <= window
+
+    ce_high = atm & (ce_volume > high_volume)
+    pe_high = atm & (pe_volume > high_volume)
+
+    totals = np.array([
+        ce_volume[atm].sum(),
+        pe_volume[atm].sum(),
+        ce_oi[atm].sum(),
+        pe_oi[atm].sum()
+    ])
+
+    return dist, atm, ce_high, pe_high, totals
@@ -11,7 +11,7 @@ import time
 
 from .trading_advisor import TradingAdvisor
 from ..api.chat_models import (
-    ChatMessage, ChatMessageType, ChatSession, 
+    ChatMessage, ChatSession, 
     ChatRequest, ChatResponse, AnalysisRequest, AnalysisResponse,
     StrategyRequest, StrategyResponse
 )
@@ -153,7 +153,7 @@ class ChatService:
         # Add welcome message
         welcome_message = ChatMessage(
             id=self._generate_message_id(),
-            type=ChatMessageType.ASSISTANT,
+            type="assistant",
             content="Hello! I'm your AI trading advisor. I can help you with options trading analysis, strategy suggestions, and market insights. What would you like to know?",
             timestamp=datetime.now()
         )
@@ -187,7 +187,7 @@ class ChatService:
             # Add user message to session
             user_message = ChatMessage(
                 id=self._generate_message_id(),
-                type=ChatMessageType.USER,
+                type="user",
                 content=request.message,
                 timestamp=datetime.now(),
                 metadata=request.context
@@ -207,7 +207,7 @@ class ChatService:
             # Create assistant message
             assistant_message = ChatMessage(
                 id=self._generate_message_id(),
-                type=ChatMessageType.ASSISTANT,
+                type="assistant",
                 content=ai_response_content,
                 timestamp=datetime.now(),
                 metadata={"market_data_used": market_data_used}
@@ -235,7 +235,7 @@ class ChatService:
             # Create error response
             error_message = ChatMessage(
                 id=self._generate_message_id(),
-                type=ChatMessageType.ASSISTANT,
+                type="assistant",
                 content=f"I apologize, but I encountered an error processing your request: {str(e)}",
                 timestamp=datetime.now()
             )
@@ -7,21 +7,84 @@ This service implements the specific OI-based trading algorithm:
 3. Generate bullish/bearish/neutral signals based on OI comparison
 """
 
+import bisect
 import logging
+import time
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
+
+from ._oi_kernels import SIGNAL_LABELS, SIGNIFICANCE_LABELS, classify_strikes
 from ..market_data.manager import MarketDataManager
 from ..api.client import DhanAPIClient
 from ..api.models import OptionChain, OptionChainStrike
 
 logger = logging.getLogger(__name__)
 
+# Strike significance levels worth calling out in the reasoning text
+_HIGH_MED = frozenset({"high", "medium"})
+
+# Signal label <-> integer code mapping for the enhanced signal decision table.
+# Indexing _CODE_SIGNALS with -1 yields "bearish".
+_SIGNAL_CODES = {"bullish": 1, "bearish": -1, "neutral": 0}
+_CODE_SIGNALS = ("neutral", "bullish", "bearish")
+
+# Upper-case display forms of the signal labels
+_UPPER = {"bullish": "BULLISH", "bearish": "BEARISH", "neutral": "NEUTRAL"}
+
+# Static sections of the comprehensive reasoning text
+_HDR_MAIN = "📊 **COMPREHENSIVE OI ANALYSIS for NIFTY at "
+_HDR_RANGE = "🎯 **RANGE ANALYSIS:**\n"
+_HDR_STRIKES = "🎯 **KEY STRIKE ANALYSIS:**\n"
+_HDR_BRACKET = "🎯 **BRACKETING STRIKES:**\n"
+_RANGE_TEMPLATE = (
+    _HDR_MAIN + "{price:.1f}**\n\n"
+    + _HDR_RANGE
+    + "• Range {rs:.0f}-{re:.0f}: **{sent}** sentiment\n"
+    "• Total PE OI: {pe_oi:,} | Total CE OI: {ce_oi:,}\n"
+    "• PE/CE Ratio: {ratio:.2f} | Confidence: {conf:.1%}\n"
+    "• {implications}\n\n"
+)
+_STRIKE_TEMPLATE = (
+    "• **{strike:.0f}** ({category}): {signal} "
+    "[PE: {pe_oi:,}, CE: {ce_oi:,}] - {significance} significance\n"
+)
+_BRACKET_TEMPLATE = (
+    _HDR_BRACKET
+    + "• Lower Strike {lower:.0f}: **{lower_signal}** "
+    "(PE: {lower_pe_oi:,}, CE: {lower_ce_oi:,})\n"
+    "• Upper Strike {upper:.0f}: **{upper_signal}** "
+    "(PE: {upper_pe_oi:,}, CE: {upper_ce_oi:,})\n\n"
+)
+_CONCL_BULL = (
+    "🟢 **BULLISH CONCLUSION:**\n"
+    "Multiple analysis layers suggest upward bias. Strong put interest indicates institutional support.\n"
+    "**Strategy:** Consider bullish positions with proper risk management.\n"
+)
+_CONCL_BEAR = (
+    "🔴 **BEARISH CONCLUSION:**\n"
+    "Multiple analysis layers suggest downward pressure. Strong call interest indicates institutional resistance.\n"
+    "**Strategy:** Consider bearish positions with proper risk management.\n"
+)
+_CONCL_NEUT = (
+    "🟡 **NEUTRAL/RANGE-BOUND CONCLUSION:**\n"
+    "Mixed signals across analysis layers suggest consolidation or indecision.\n"
+    "**Strategy:** Range-bound strategies or wait for clearer directional signals.\n"
+)
+
 
 @dataclass
 class IndividualStrikeAnalysis:
     """Detailed analysis for an individual strike."""
+    __slots__ = (
+        "strike", "ce_oi", "pe_oi", "ce_volume", "pe_volume", "pe_ce_oi_ratio",
+        "signal", "significance", "distance_from_spot", "distance_category",
+        "reasoning", "trading_implications", "data_available",
+    )
+
     strike: float
     ce_oi: int
     pe_oi: int
@@ -36,10 +99,23 @@ class IndividualStrikeAnalysis:
     trading_implications: str
     data_available: bool
 
+    def to_analysis_dict(self) -> Dict[str, Any]:
+        """Convert to the bracketing strike analysis dictionary used for backward compatibility."""
+        return _strike_oi_analysis(
+            self.strike, self.ce_oi, self.pe_oi, self.ce_volume, self.pe_volume,
+            abs(self.distance_from_spot)
+        )
+
 
 @dataclass
 class RangeOIAnalysis:
     """Range-based OI analysis around current price."""
+    __slots__ = (
+        "range_start", "range_end", "current_price", "total_ce_oi", "total_pe_oi",
+        "pe_ce_ratio", "range_sentiment", "confidence", "key_strikes",
+        "interpretation", "trading_implications",
+    )
+
     range_start: float
     range_end: float
     current_price: float
@@ -76,13 +152,113 @@ class OIRecommendation:
     # Combined interpretation
     reasoning: str
     risk_warning: str
-    timestamp: datetime
+    timestamp_ns: int  # Creation time as epoch nanoseconds (time.time_ns())
     ai_enhancement: Optional[str] = None
+    _timestamp: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a datetime, materialized on first access."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000)
+        return self._timestamp
+
+
+def _strike_oi_analysis(
+    strike_price: float,
+    ce_oi: int,
+    pe_oi: int,
+    ce_volume: int,
+    pe_volume: int,
+    distance_from_spot: float
+) -> Dict[str, Any]:
+    """Build the bracketing strike OI analysis dictionary from raw strike values."""
+    # Calculate PE/CE OI ratio
+    pe_ce_oi_ratio = pe_oi / ce_oi if ce_oi > 0 else float('inf') if pe_oi > 0 else 0
+
+    # Determine signal for this strike
+    if pe_oi > ce_oi:
+        signal = "bullish"  # More put OI indicates support
+    elif ce_oi > pe_oi:
+        signal = "bearish"  # More call OI indicates resistance
+    else:
+        signal = "neutral"
+
+    return {
+        "strike": strike_price,
+        "ce_oi": ce_oi,
+        "pe_oi": pe_oi,
+        "ce_volume": ce_volume,
+        "pe_volume": pe_volume,
+        "pe_ce_oi_ratio": pe_ce_oi_ratio,
+        "signal": signal,
+        "data_available": True,
+        "distance_from_spot": distance_from_spot
+    }
+
+
+def _clamp(x: float, hi: float) -> float:
+    """Clamp x to at most hi (scalar replacement for min(hi, x))."""
+    return x if x < hi else hi
+
+
+# Confidence formulas of the enhanced signal decision table
+_RULE_AGREE = 0        # Range and traditional agree on direction
+_RULE_TRADITIONAL = 1  # Range neutral, traditional has direction
+_RULE_RANGE = 2        # Range has direction, traditional neutral
+_RULE_MAJORITY = 3     # Individual strikes favor one direction
+_RULE_MIXED = 4        # Mixed or unclear signals
+
+
+def _build_decision_table() -> Dict[Tuple[int, int, int], Tuple[int, int]]:
+    """
+    Build the enhanced signal decision table.
+
+    Keys are (range_code, traditional_code, majority_code). Values are
+    (final_code, rule), where rule selects the formula in
+    _decision_confidence.
+    """
+    table = {}
+    for range_code in (-1, 0, 1):
+        for trad_code in (-1, 0, 1):
+            for majority_code in (-1, 0, 1):
+                if range_code == trad_code and range_code != 0:
+                    entry = (range_code, _RULE_AGREE)
+                elif range_code == 0 and trad_code != 0:
+                    entry = (trad_code, _RULE_TRADITIONAL)
+                elif range_code != 0 and trad_code == 0:
+                    entry = (range_code, _RULE_RANGE)
+                elif majority_code != 0:
+                    entry = (majority_code, _RULE_MAJORITY)
+                else:
+                    entry = (0, _RULE_MIXED)
+                table[(range_code, trad_code, majority_code)] = entry
+    return table
+
+
+def _decision_confidence(
+    rule: int, range_confidence: float, traditional_confidence: float, majority_share: float
+) -> float:
+    """Final confidence for a decision table rule."""
+    if rule == _RULE_AGREE:
+        # Agreement boosts confidence
+        return _clamp((range_confidence + traditional_confidence) / 2 + 0.1, 0.9)
+    if rule == _RULE_TRADITIONAL:
+        # Reduce confidence
+        return traditional_confidence * 0.7
+    if rule == _RULE_RANGE:
+        # Slight reduction
+        return range_confidence * 0.8
+    if rule == _RULE_MAJORITY:
+        return _clamp(majority_share, 0.7)
+    return 0.3
 
 
 class OIRecommendationService:
     """Service for generating OI-based trading recommendations."""
-    
+
+    _DECISION_TABLE = _build_decision_table()
+
     def __init__(self, market_data_manager: MarketDataManager, api_client: DhanAPIClient):
         """
         Initialize the OI recommendation service.
@@ -93,6 +269,12 @@ class OIRecommendationService:
         """
         self.market_data_manager = market_data_manager
         self.api_client = api_client
+
+        # Short-lived memo of enhanced recommendations:
+        # (scrip, expiry, range_width, price bucket) -> (monotonic time, recommendation)
+        self._reco_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, OIRecommendation]]" = OrderedDict()
+        self._reco_cache_ttl = 2.0  # seconds
+        self._reco_cache_size = 32
         logger.info("OI Recommendation Service initialized")
     
     def get_oi_recommendation(
@@ -162,7 +344,7 @@ class OIRecommendationService:
                 upper_strike_analysis=upper_analysis,
                 reasoning=reasoning,
                 risk_warning=risk_warning,
-                timestamp=datetime.now(),
+                timestamp_ns=time.time_ns(),
                 ai_enhancement=None
             )
             
@@ -174,7 +356,8 @@ class OIRecommendationService:
     def _find_bracketing_strikes(
         self,
         current_price: float,
-        strikes: Dict[str, OptionChainStrike]
+        strikes: Dict[str, OptionChainStrike],
+        strike_prices: Optional[List[float]] = None
     ) -> Tuple[float, float]:
         """
         Find two strikes that bracket the current price with approximately 100 points range.
@@ -184,62 +367,49 @@ class OIRecommendationService:
         Args:
             current_price: Current underlying price
             strikes: Dictionary of strike prices and data
+            strike_prices: Optional pre-sorted strike prices (avoids re-sorting the keys)
 
         Returns:
             Tuple of (lower_strike, upper_strike) approximately 100 points apart
         """
-        strike_prices = [float(strike) for strike in strikes.keys()]
-        strike_prices.sort()
+        if strike_prices is None:
+            strike_prices = sorted(float(strike) for strike in strikes.keys())
+
+        n = len(strike_prices)
 
         # Target range of 100 points - find the best combination
         target_range = 100
 
-        # Find all possible combinations that bracket the current price
-        valid_combinations = []
-
-        for i, lower in enumerate(strike_prices):
-            for j, upper in enumerate(strike_prices[i+1:], i+1):
-                # Check if this combination brackets the current price
-                if lower <= current_price <= upper:
-                    range_size = upper - lower
-                    range_diff = abs(range_size - target_range)
-
-                    # Prefer combinations closer to 100 points
-                    valid_combinations.append({
-                        'lower': lower,
-                        'upper': upper,
-                        'range': range_size,
-                        'diff_from_target': range_diff,
-                        'distance_from_center': abs((lower + upper) / 2 - current_price)
-                    })
-
-        if valid_combinations:
-            # Sort by: 1) closest to 100 points, 2) most centered around current price
-            valid_combinations.sort(key=lambda x: (x['diff_from_target'], x['distance_from_center']))
-
-            best = valid_combinations[0]
-            lower_strike = best['lower']
-            upper_strike = best['upper']
+        # Lower candidates are strikes <= price, upper candidates are strikes >= price
+        lower_end = bisect.bisect_right(strike_prices, current_price)
+        upper_start = bisect.bisect_left(strike_prices, current_price)
+
+        best_key = None
+        best_pair = None
+
+        for i in range(lower_end):
+            lower = strike_prices[i]
+            start = max(i + 1, upper_start)
+            if start >= n:
+                continue
+
+            # The upper strike closest to lower + 100 is next to its insertion point
+            pos = bisect.bisect_left(strike_prices, lower + target_range, start)
+            for j in range(max(start, pos - 1), min(n, pos + 2)):
+                upper = strike_prices[j]
+                # Prefer combinations closer to 100 points, then most centered
+                key = (abs((upper - lower) - target_range), abs((lower + upper) / 2 - current_price))
+                if best_key is None or key < best_key:
+                    best_key = key
+                    best_pair = (lower, upper)
+
+        if best_pair is not None:
+            lower_strike, upper_strike = best_pair
         else:
-            # Fallback to original logic if no valid combinations found
-            lower_strike = None
-            upper_strike = None
-
-            for strike in reversed(strike_prices):
-                if strike <= current_price:
-                    lower_strike = strike
-                    break
-
-            for strike in strike_prices:
-                if strike > current_price:
-                    upper_strike = strike
-                    break
-
-            # Handle edge cases
-            if lower_strike is None:
-                lower_strike = strike_prices[0]
-            if upper_strike is None:
-                upper_strike = strike_prices[-1]
+            # Fallback: nearest strike at or below and strictly above the price
+            above = bisect.bisect_right(strike_prices, current_price)
+            lower_strike = strike_prices[above - 1] if above > 0 else strike_prices[0]
+            upper_strike = strike_prices[above] if above < n else strike_prices[-1]
 
         return lower_strike, upper_strike
 
@@ -264,11 +434,12 @@ class OIRecommendationService:
         strike_key = f"{strike_price:.6f}"
         strike_data = strikes.get(strike_key)
 
-        # Debug logging
-        logger.info(f"Looking for strike {strike_price} with key '{strike_key}'")
-        logger.info(f"Available strikes: {list(strikes.keys())}")
-        if strike_data:
-            logger.info(f"Found strike data: CE OI={strike_data.ce.oi if strike_data.ce else 'None'}, PE OI={strike_data.pe.oi if strike_data.pe else 'None'}")
+        # Debug logging (listing every strike is a full pass, so only when enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Looking for strike {strike_price} with key '{strike_key}'")
+            logger.debug(f"Available strikes: {list(strikes.keys())}")
+            if strike_data:
+                logger.debug(f"Found strike data: CE OI={strike_data.ce.oi if strike_data.ce else 'None'}, PE OI={strike_data.pe.oi if strike_data.pe else 'None'}")
 
         if not strike_data:
             return {
@@ -289,28 +460,10 @@ class OIRecommendationService:
         ce_volume = strike_data.ce.volume if strike_data.ce else 0
         pe_volume = strike_data.pe.volume if strike_data.pe else 0
 
-        # Calculate PE/CE OI ratio
-        pe_ce_oi_ratio = pe_oi / ce_oi if ce_oi > 0 else float('inf') if pe_oi > 0 else 0
-
-        # Determine signal for this strike
-        if pe_oi > ce_oi:
-            signal = "bullish"  # More put OI indicates support
-        elif ce_oi > pe_oi:
-            signal = "bearish"  # More call OI indicates resistance
-        else:
-            signal = "neutral"
-
-        return {
-            "strike": strike_price,
-            "ce_oi": ce_oi,
-            "pe_oi": pe_oi,
-            "ce_volume": ce_volume,
-            "pe_volume": pe_volume,
-            "pe_ce_oi_ratio": pe_ce_oi_ratio,
-            "signal": signal,
-            "data_available": True,
-            "distance_from_spot": abs(strike_price - current_price)
-        }
+        return _strike_oi_analysis(
+            strike_price, ce_oi, pe_oi, ce_volume, pe_volume,
+            abs(strike_price - current_price)
+        )
 
     def _generate_signal(
         self,
@@ -387,8 +540,8 @@ Both key strikes show higher Call OI than Put OI, indicating strong institutiona
 🟡 **NEUTRAL/RANGE-BOUND SIGNAL**
 
 **Analysis for Nifty at {current_price:.0f}:**
-• Lower Strike {lower_strike:.0f}: {lower_signal.upper()} signal (PE: {lower_analysis['pe_oi']:,}, CE: {lower_analysis['ce_oi']:,})
-• Upper Strike {upper_strike:.0f}: {upper_signal.upper()} signal (PE: {upper_analysis['pe_oi']:,}, CE: {upper_analysis['ce_oi']:,})
+• Lower Strike {lower_strike:.0f}: {_UPPER[lower_signal]} signal (PE: {lower_analysis['pe_oi']:,}, CE: {lower_analysis['ce_oi']:,})
+• Upper Strike {upper_strike:.0f}: {_UPPER[upper_signal]} signal (PE: {upper_analysis['pe_oi']:,}, CE: {upper_analysis['ce_oi']:,})
 
 **Interpretation:**
 Mixed signals from the two key strikes suggest no clear directional bias. Market may be range-bound between these levels or awaiting a catalyst for direction.
@@ -461,7 +614,7 @@ Mixed signals from the two key strikes suggest no clear directional bias. Market
         else:
             volume_factor = 0.0
 
-        final_confidence = min(0.95, base_confidence + oi_factor + ratio_factor + volume_factor)
+        final_confidence = _clamp(base_confidence + oi_factor + ratio_factor + volume_factor, 0.95)
         return final_confidence
 
     def _generate_risk_warning(self, signal: str, confidence: float, current_price: float) -> str:
@@ -510,18 +663,162 @@ and maintain strict risk management protocols.
 {base_warning}
             """.strip()
 
-    def _analyze_oi_range(
+    def _build_strike_arrays(
+        self,
+        strikes: Dict[str, OptionChainStrike]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert option chain strikes into parallel NumPy arrays sorted by strike.
+
+        Args:
+            strikes: Dictionary of strike data
+
+        Returns:
+            Dictionary with "strike", "ce_oi", "pe_oi", "ce_volume" and "pe_volume" arrays
+        """
+        n = len(strikes)
+        strike_arr = np.empty(n, dtype=np.float64)
+        ce_oi = np.zeros(n, dtype=np.int64)
+        pe_oi = np.zeros(n, dtype=np.int64)
+        ce_volume = np.zeros(n, dtype=np.int64)
+        pe_volume = np.zeros(n, dtype=np.int64)
+
+        for i, (strike_key, strike_data) in enumerate(strikes.items()):
+            strike_arr[i] = float(strike_key)
+            if strike_data.ce:
+                ce_oi[i] = strike_data.ce.oi
+                ce_volume[i] = strike_data.ce.volume
+            if strike_data.pe:
+                pe_oi[i] = strike_data.pe.oi
+                pe_volume[i] = strike_data.pe.volume
+
+        order = np.argsort(strike_arr, kind="stable")
+        return {
+            "strike": strike_arr[order],
+            "ce_oi": ce_oi[order],
+            "pe_oi": pe_oi[order],
+            "ce_volume": ce_volume[order],
+            "pe_volume": pe_volume[order],
+        }
+
+    def _classify_strike_arrays(
+        self,
+        arrays: Dict[str, np.ndarray],
+        current_price: float,
+        range_width: int
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run the compiled classification kernel over the strike arrays.
+
+        Args:
+            arrays: Strike arrays from _build_strike_arrays
+            current_price: Current underlying price
+            range_width: Width of range around current price
+
+        Returns:
+            Strike arrays extended with "in_range", "signal", "significance"
+            and "pe_ce_ratio" arrays
+        """
+        in_range, signals, significance, ratios = classify_strikes(
+            arrays["strike"], arrays["ce_oi"], arrays["pe_oi"],
+            float(current_price), float(range_width)
+        )
+        return {
+            **arrays,
+            "in_range": in_range,
+            "signal": signals,
+            "significance": significance,
+            "pe_ce_ratio": ratios,
+        }
+
+    def _analyze_all(
         self,
         current_price: float,
         strikes: Dict[str, OptionChainStrike],
         range_width: int
+    ) -> Tuple[RangeOIAnalysis, List[IndividualStrikeAnalysis], float, float, Dict[str, Any], Dict[str, Any]]:
+        """
+        Run range, individual strike and bracketing analyses from a single pass over the chain.
+
+        The option chain objects are read once into strike arrays; every analysis is
+        then derived from those arrays instead of walking the strikes again.
+
+        Args:
+            current_price: Current underlying price
+            strikes: Dictionary of strike data
+            range_width: Width of range around current price
+
+        Returns:
+            Tuple of (range_analysis, individual_strikes, lower_strike, upper_strike,
+            lower_analysis, upper_analysis)
+        """
+        arrays = self._classify_strike_arrays(
+            self._build_strike_arrays(strikes), current_price, range_width
+        )
+
+        range_analysis = self._analyze_oi_range(current_price, arrays, range_width)
+        individual_strikes = self._analyze_individual_strikes(current_price, arrays)
+
+        strike_prices = arrays["strike"].tolist()
+        lower_strike, upper_strike = self._find_bracketing_strikes(
+            current_price, strikes, strike_prices
+        )
+
+        # Bracketing strikes are near ATM, so they are usually already analyzed
+        by_strike = {analysis.strike: analysis for analysis in individual_strikes}
+
+        lower_individual = by_strike.get(lower_strike)
+        if lower_individual is not None:
+            lower_analysis = lower_individual.to_analysis_dict()
+        else:
+            lower_analysis = self._strike_oi_analysis_at(
+                arrays, bisect.bisect_left(strike_prices, lower_strike), current_price
+            )
+
+        upper_individual = by_strike.get(upper_strike)
+        if upper_strike == lower_strike:
+            upper_analysis = dict(lower_analysis)
+        elif upper_individual is not None:
+            upper_analysis = upper_individual.to_analysis_dict()
+        else:
+            upper_analysis = self._strike_oi_analysis_at(
+                arrays, bisect.bisect_left(strike_prices, upper_strike), current_price
+            )
+
+        return (
+            range_analysis, individual_strikes, lower_strike, upper_strike,
+            lower_analysis, upper_analysis
+        )
+
+    def _strike_oi_analysis_at(
+        self,
+        arrays: Dict[str, np.ndarray],
+        idx: int,
+        current_price: float
+    ) -> Dict[str, Any]:
+        """Build the bracketing strike OI analysis for the strike at array index idx."""
+        strike_price = float(arrays["strike"][idx])
+        return _strike_oi_analysis(
+            strike_price,
+            int(arrays["ce_oi"][idx]),
+            int(arrays["pe_oi"][idx]),
+            int(arrays["ce_volume"][idx]),
+            int(arrays["pe_volume"][idx]),
+            abs(strike_price - current_price)
+        )
+
+    def _analyze_oi_range(
+        self,
+        current_price: float,
+        arrays: Dict[str, np.ndarray],
+        range_width: int
     ) -> RangeOIAnalysis:
         """
         Analyze OI across a range of strikes around current price.
 
         Args:
             current_price: Current underlying price
-            strikes: Dictionary of strike data
+            arrays: Classified strike arrays from _classify_strike_arrays
             range_width: Width of range around current price
 
         Returns:
@@ -530,21 +827,12 @@ and maintain strict risk management protocols.
         range_start = current_price - range_width
         range_end = current_price + range_width
 
-        total_ce_oi = 0
-        total_pe_oi = 0
-        key_strikes = []
-
         # Aggregate OI data for strikes within range
-        for strike_key, strike_data in strikes.items():
-            strike_price = float(strike_key)
-
-            if range_start <= strike_price <= range_end:
-                key_strikes.append(strike_price)
-
-                if strike_data.ce:
-                    total_ce_oi += strike_data.ce.oi
-                if strike_data.pe:
-                    total_pe_oi += strike_data.pe.oi
+        strike_arr = arrays["strike"]
+        mask = arrays["in_range"]
+        total_ce_oi = int(arrays["ce_oi"][mask].sum())
+        total_pe_oi = int(arrays["pe_oi"][mask].sum())
+        key_strikes = strike_arr[mask].tolist()
 
         # Calculate PE/CE ratio and determine sentiment
         pe_ce_ratio = total_pe_oi / total_ce_oi if total_ce_oi > 0 else 0
@@ -552,10 +840,10 @@ and maintain strict risk management protocols.
         # Determine range sentiment
         if pe_ce_ratio > 1.2:  # Strong put bias
             range_sentiment = "bullish"
-            confidence = min(0.8, pe_ce_ratio / 2)
+            confidence = _clamp(pe_ce_ratio / 2, 0.8)
         elif pe_ce_ratio < 0.8:  # Strong call bias
             range_sentiment = "bearish"
-            confidence = min(0.8, (2 - pe_ce_ratio) / 2)
+            confidence = _clamp((2 - pe_ce_ratio) / 2, 0.8)
         else:  # Balanced
             range_sentiment = "neutral"
             confidence = 0.3
@@ -570,8 +858,6 @@ and maintain strict risk management protocols.
             range_sentiment, confidence, current_price, range_start, range_end
         )
 
-        key_strikes.sort()
-
         return RangeOIAnalysis(
             range_start=range_start,
             range_end=range_end,
@@ -589,76 +875,57 @@ and maintain strict risk management protocols.
     def _analyze_individual_strikes(
         self,
         current_price: float,
-        strikes: Dict[str, OptionChainStrike],
-        range_width: int
+        arrays: Dict[str, np.ndarray]
     ) -> List[IndividualStrikeAnalysis]:
         """
         Analyze individual strikes within the range for detailed insights.
 
         Args:
             current_price: Current underlying price
-            strikes: Dictionary of strike data
-            range_width: Width of range around current price
+            arrays: Classified strike arrays from _classify_strike_arrays
 
         Returns:
             List of IndividualStrikeAnalysis for key strikes
         """
-        individual_analyses = []
-        range_start = current_price - range_width
-        range_end = current_price + range_width
-
-        # Get strikes within range and sort them
-        relevant_strikes = []
-        for strike_key, strike_data in strikes.items():
-            strike_price = float(strike_key)
-            if range_start <= strike_price <= range_end:
-                relevant_strikes.append((strike_price, strike_key, strike_data))
-
-        relevant_strikes.sort(key=lambda x: x[0])  # Sort by strike price
-
-        # Analyze each strike
-        for strike_price, strike_key, strike_data in relevant_strikes:
-            analysis = self._create_individual_strike_analysis(
-                strike_price, strike_data, current_price
+        # Strikes are already sorted, so the mask preserves strike order
+        mask = arrays["in_range"]
+
+        return [
+            self._create_individual_strike_analysis(
+                strike_price, ce_oi, pe_oi, ce_volume, pe_volume, ratio,
+                SIGNAL_LABELS[signal_code], SIGNIFICANCE_LABELS[significance_code],
+                current_price
             )
-            individual_analyses.append(analysis)
-
-        return individual_analyses
+            for (
+                strike_price, ce_oi, pe_oi, ce_volume, pe_volume, ratio,
+                signal_code, significance_code
+            ) in zip(
+                arrays["strike"][mask].tolist(),
+                arrays["ce_oi"][mask].tolist(),
+                arrays["pe_oi"][mask].tolist(),
+                arrays["ce_volume"][mask].tolist(),
+                arrays["pe_volume"][mask].tolist(),
+                arrays["pe_ce_ratio"][mask].tolist(),
+                arrays["signal"][mask].tolist(),
+                arrays["significance"][mask].tolist(),
+            )
+        ]
 
     def _create_individual_strike_analysis(
         self,
         strike_price: float,
-        strike_data: OptionChainStrike,
+        ce_oi: int,
+        pe_oi: int,
+        ce_volume: int,
+        pe_volume: int,
+        pe_ce_oi_ratio: float,
+        signal: str,
+        significance: str,
         current_price: float
     ) -> IndividualStrikeAnalysis:
         """Create detailed analysis for an individual strike."""
-        # Extract data
-        ce_oi = strike_data.ce.oi if strike_data.ce else 0
-        pe_oi = strike_data.pe.oi if strike_data.pe else 0
-        ce_volume = strike_data.ce.volume if strike_data.ce else 0
-        pe_volume = strike_data.pe.volume if strike_data.pe else 0
-
-        # Calculate metrics
-        pe_ce_oi_ratio = pe_oi / ce_oi if ce_oi > 0 else 0
         distance_from_spot = strike_price - current_price
 
-        # Determine signal
-        if pe_oi > ce_oi * 1.2:  # Strong put bias
-            signal = "bullish"
-        elif ce_oi > pe_oi * 1.2:  # Strong call bias
-            signal = "bearish"
-        else:
-            signal = "neutral"
-
-        # Determine significance based on total OI
-        total_oi = ce_oi + pe_oi
-        if total_oi > 10_000_000:  # 10M+
-            significance = "high"
-        elif total_oi > 5_000_000:  # 5M+
-            significance = "medium"
-        else:
-            significance = "low"
-
         # Determine distance category
         abs_distance = abs(distance_from_spot)
         if abs_distance <= 25:
@@ -795,6 +1062,14 @@ This suggests range-bound movement or indecision in the market.
         Returns:
             Tuple of (signal, confidence, reasoning)
         """
+        # No strikes in range (sparse option chain) - nothing to combine
+        if not individual_strikes:
+            reasoning = self._generate_comprehensive_reasoning(
+                "neutral", range_analysis, individual_strikes,
+                lower_analysis, upper_analysis, current_price, lower_strike, upper_strike
+            )
+            return "neutral", 0.3, reasoning
+
         # Get range sentiment and confidence
         range_sentiment = range_analysis.range_sentiment
         range_confidence = range_analysis.confidence
@@ -804,36 +1079,34 @@ This suggests range-bound movement or indecision in the market.
             lower_analysis, upper_analysis, current_price, lower_strike, upper_strike
         )
 
-        # Count individual strike signals
-        bullish_strikes = sum(1 for strike in individual_strikes if strike.signal == "bullish")
-        bearish_strikes = sum(1 for strike in individual_strikes if strike.signal == "bearish")
-        neutral_strikes = sum(1 for strike in individual_strikes if strike.signal == "neutral")
-
-        # Determine final signal by combining all factors
-        if range_sentiment == traditional_signal and range_sentiment != "neutral":
-            # Range and traditional agree on direction
-            final_signal = range_sentiment
-            final_confidence = min(0.9, (range_confidence + traditional_confidence) / 2 + 0.1)
-        elif range_sentiment == "neutral" and traditional_signal != "neutral":
-            # Range neutral, traditional has direction
-            final_signal = traditional_signal
-            final_confidence = traditional_confidence * 0.7  # Reduce confidence
-        elif range_sentiment != "neutral" and traditional_signal == "neutral":
-            # Range has direction, traditional neutral
-            final_signal = range_sentiment
-            final_confidence = range_confidence * 0.8  # Slight reduction
-        elif bullish_strikes > bearish_strikes and bullish_strikes > neutral_strikes:
-            # Individual strikes favor bullish
-            final_signal = "bullish"
-            final_confidence = min(0.7, bullish_strikes / len(individual_strikes))
+        # Count individual strike signals in a single pass
+        counts = {"bullish": 0, "bearish": 0, "neutral": 0}
+        for strike in individual_strikes:
+            counts[strike.signal] = counts.get(strike.signal, 0) + 1
+        bullish_strikes = counts["bullish"]
+        bearish_strikes = counts["bearish"]
+        neutral_strikes = counts["neutral"]
+        total_strikes = len(individual_strikes)
+
+        # Majority direction of the individual strikes
+        if bullish_strikes > bearish_strikes and bullish_strikes > neutral_strikes:
+            majority_code, majority_share = 1, bullish_strikes / total_strikes
         elif bearish_strikes > bullish_strikes and bearish_strikes > neutral_strikes:
-            # Individual strikes favor bearish
-            final_signal = "bearish"
-            final_confidence = min(0.7, bearish_strikes / len(individual_strikes))
+            majority_code, majority_share = -1, bearish_strikes / total_strikes
         else:
-            # Mixed or unclear signals
-            final_signal = "neutral"
-            final_confidence = 0.3
+            majority_code, majority_share = 0, 0.0
+
+        # Determine final signal by combining all factors
+        key = (
+            _SIGNAL_CODES.get(range_sentiment, 0),
+            _SIGNAL_CODES.get(traditional_signal, 0),
+            majority_code,
+        )
+        final_code, rule = self._DECISION_TABLE[key]
+        final_confidence = _decision_confidence(
+            rule, range_confidence, traditional_confidence, majority_share
+        )
+        final_signal = _CODE_SIGNALS[final_code]
 
         # Generate comprehensive reasoning
         reasoning = self._generate_comprehensive_reasoning(
@@ -856,47 +1129,58 @@ This suggests range-bound movement or indecision in the market.
     ) -> str:
         """Generate comprehensive reasoning combining all analysis types."""
 
-        # Header with current price
-        reasoning = f"📊 **COMPREHENSIVE OI ANALYSIS for NIFTY at {current_price:.1f}**\n\n"
-
-        # Range Analysis Section
-        reasoning += "🎯 **RANGE ANALYSIS:**\n"
-        reasoning += f"• Range {range_analysis.range_start:.0f}-{range_analysis.range_end:.0f}: **{range_analysis.range_sentiment.upper()}** sentiment\n"
-        reasoning += f"• Total PE OI: {range_analysis.total_pe_oi:,} | Total CE OI: {range_analysis.total_ce_oi:,}\n"
-        reasoning += f"• PE/CE Ratio: {range_analysis.pe_ce_ratio:.2f} | Confidence: {range_analysis.confidence:.1%}\n"
-        reasoning += f"• {range_analysis.trading_implications}\n\n"
-
-        # Individual Strikes Section
-        reasoning += "🎯 **KEY STRIKE ANALYSIS:**\n"
-        for strike in individual_strikes[:5]:  # Show top 5 strikes
-            if strike.significance in ["high", "medium"]:
-                reasoning += f"• **{strike.strike:.0f}** ({strike.distance_category}): {strike.signal.upper()} "
-                reasoning += f"[PE: {strike.pe_oi:,}, CE: {strike.ce_oi:,}] - {strike.significance} significance\n"
-
-        reasoning += "\n"
+        # Header and Range Analysis Section
+        parts = [_RANGE_TEMPLATE.format_map({
+            "price": current_price,
+            "rs": range_analysis.range_start,
+            "re": range_analysis.range_end,
+            "sent": _UPPER[range_analysis.range_sentiment],
+            "pe_oi": range_analysis.total_pe_oi,
+            "ce_oi": range_analysis.total_ce_oi,
+            "ratio": range_analysis.pe_ce_ratio,
+            "conf": range_analysis.confidence,
+            "implications": range_analysis.trading_implications,
+        })]
+
+        # Individual Strikes Section (top 5 strikes with high/medium significance)
+        top_strikes = [
+            strike for strike in individual_strikes[:5]
+            if strike.significance in _HIGH_MED
+        ]
+        if top_strikes:
+            parts.append(_HDR_STRIKES)
+            for strike in top_strikes:
+                parts.append(_STRIKE_TEMPLATE.format_map({
+                    "strike": strike.strike,
+                    "category": strike.distance_category,
+                    "signal": _UPPER[strike.signal],
+                    "pe_oi": strike.pe_oi,
+                    "ce_oi": strike.ce_oi,
+                    "significance": strike.significance,
+                }))
+            parts.append("\n")
 
         # Traditional Bracketing Analysis
-        reasoning += "🎯 **BRACKETING STRIKES:**\n"
-        reasoning += f"• Lower Strike {lower_strike:.0f}: **{lower_analysis['signal'].upper()}** "
-        reasoning += f"(PE: {lower_analysis['pe_oi']:,}, CE: {lower_analysis['ce_oi']:,})\n"
-        reasoning += f"• Upper Strike {upper_strike:.0f}: **{upper_analysis['signal'].upper()}** "
-        reasoning += f"(PE: {upper_analysis['pe_oi']:,}, CE: {upper_analysis['ce_oi']:,})\n\n"
+        parts.append(_BRACKET_TEMPLATE.format_map({
+            "lower": lower_strike,
+            "lower_signal": _UPPER[lower_analysis["signal"]],
+            "lower_pe_oi": lower_analysis["pe_oi"],
+            "lower_ce_oi": lower_analysis["ce_oi"],
+            "upper": upper_strike,
+            "upper_signal": _UPPER[upper_analysis["signal"]],
+            "upper_pe_oi": upper_analysis["pe_oi"],
+            "upper_ce_oi": upper_analysis["ce_oi"],
+        }))
 
         # Final Interpretation
         if final_signal == "bullish":
-            reasoning += "🟢 **BULLISH CONCLUSION:**\n"
-            reasoning += "Multiple analysis layers suggest upward bias. Strong put interest indicates institutional support.\n"
-            reasoning += "**Strategy:** Consider bullish positions with proper risk management.\n"
+            parts.append(_CONCL_BULL)
         elif final_signal == "bearish":
-            reasoning += "🔴 **BEARISH CONCLUSION:**\n"
-            reasoning += "Multiple analysis layers suggest downward pressure. Strong call interest indicates institutional resistance.\n"
-            reasoning += "**Strategy:** Consider bearish positions with proper risk management.\n"
+            parts.append(_CONCL_BEAR)
         else:
-            reasoning += "🟡 **NEUTRAL/RANGE-BOUND CONCLUSION:**\n"
-            reasoning += "Mixed signals across analysis layers suggest consolidation or indecision.\n"
-            reasoning += "**Strategy:** Range-bound strategies or wait for clearer directional signals.\n"
+            parts.append(_CONCL_NEUT)
 
-        return reasoning
+        return "".join(parts)
 
     def _create_simple_range_analysis(
         self,
@@ -1012,28 +1296,17 @@ This suggests range-bound movement or indecision in the market.
 
             current_price = option_chain.underlying_price
 
-            # Perform range-based OI analysis
-            range_analysis = self._analyze_oi_range(
-                current_price, option_chain.strikes, range_width
-            )
-
-            # Perform individual strike analysis for key strikes
-            individual_strikes = self._analyze_individual_strikes(
-                current_price, option_chain.strikes, range_width
-            )
+            # Reuse a recent recommendation for the same inputs
+            cache_key = (underlying_scrip, expiry, range_width, round(current_price, 1))
+            cached = self._get_cached_recommendation(cache_key)
+            if cached is not None:
+                return cached
 
-            # Find the two nearest strikes that bracket the current price (for backward compatibility)
-            lower_strike, upper_strike = self._find_bracketing_strikes(
-                current_price, option_chain.strikes
-            )
-
-            # Analyze OI at both strikes (for backward compatibility)
-            lower_analysis = self._analyze_strike_oi(
-                lower_strike, option_chain.strikes, current_price
-            )
-            upper_analysis = self._analyze_strike_oi(
-                upper_strike, option_chain.strikes, current_price
-            )
+            # Range, individual and bracketing (backward compatible) analyses in one pass
+            (
+                range_analysis, individual_strikes, lower_strike, upper_strike,
+                lower_analysis, upper_analysis
+            ) = self._analyze_all(current_price, option_chain.strikes, range_width)
 
             # Generate combined signal based on range and individual analysis
             signal, confidence, reasoning = self._generate_enhanced_signal(
@@ -1044,7 +1317,7 @@ This suggests range-bound movement or indecision in the market.
             # Generate risk warning
             risk_warning = self._generate_risk_warning(signal, confidence, current_price)
 
-            return OIRecommendation(
+            recommendation = OIRecommendation(
                 signal=signal,
                 confidence=confidence,
                 current_price=current_price,
@@ -1056,10 +1329,37 @@ This suggests range-bound movement or indecision in the market.
                 upper_strike_analysis=upper_analysis,
                 reasoning=reasoning,
                 risk_warning=risk_warning,
-                timestamp=datetime.now(),
+                timestamp_ns=time.time_ns(),
                 ai_enhancement=None  # Will be added if requested
             )
+            self._store_cached_recommendation(cache_key, recommendation)
+            return recommendation
 
         except Exception as e:
             logger.error(f"Error generating enhanced OI recommendation: {e}")
             return self._create_error_recommendation(str(e))
+
+    def _get_cached_recommendation(self, key: Tuple[Any, ...]) -> Optional[OIRecommendation]:
+        """Return a memoized recommendation if it is still within the TTL."""
+        entry = self._reco_cache.get(key)
+        if entry is None:
+            return None
+
+        created, recommendation = entry
+        if time.monotonic() - created > self._reco_cache_ttl:
+            self._reco_cache.pop(key, None)
+            return None
+
+        try:
+            self._reco_cache.move_to_end(key)
+        except KeyError:
+            # Evicted by a concurrent caller
+            pass
+        return recommendation
+
+    def _store_cached_recommendation(self, key: Tuple[Any, ...], recommendation: OIRecommendation) -> None:
+        """Memoize a recommendation, evicting the least recently used entries."""
+        self._reco_cache[key] = (time.monotonic(), recommendation)
+        self._reco_cache.move_to_end(key)
+        while len(self._reco_cache) > self._reco_cache_size:
+            self._reco_cache.popitem(last=False)
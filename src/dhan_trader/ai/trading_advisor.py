@@ -1,10 +1,23 @@
 """AI-powered trading advisor that integrates with market data and provides intelligent recommendations."""
 
 import logging
+import time
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone, time as dt_time
 import asyncio
-
+import functools
+import hashlib
+import heapq
+import math
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+
+import numpy as np
+
+from ._oi_kernels import scan_atm_window
 from .gemini_client import GeminiAIClient
 from .oi_recommendation_service import OIRecommendationService, OIRecommendation
 from ..market_data.manager import MarketDataManager
@@ -14,6 +27,90 @@ from ..api.models import OptionChain, OptionChainStrike
 logger = logging.getLogger(__name__)
 
 
+# NSE cash/F&O session hours. IST has no DST, so a fixed offset is exact and
+# needs no tz database (Windows has none without the tzdata package)
+_MARKET_TZ = timezone(timedelta(hours=5, minutes=30), "IST")
+_MARKET_OPEN = dt_time(9, 15)
+_MARKET_CLOSE = dt_time(15, 30)
+
+# Static fragments of the OI text responses
+_OI_CALL_HEADER = "**Call Options (CE):**\n"
+_OI_PUT_HEADER = "**Put Options (PE):**\n"
+_OI_ANALYSIS_HEADER = "**Analysis:**\n"
+_OI_SIGNAL_BULLISH = "• Signal: Bullish (High Put OI suggests support)\n"
+_OI_SIGNAL_BEARISH = "• Signal: Bearish (High Call OI suggests resistance)\n"
+_OI_SIGNAL_NEUTRAL = "• Signal: Neutral\n"
+
+# Threshold tables for bisect_right: values below the first bound map to the
+# first label, up to and including the upper bound to the second, above it
+# to the third. nextafter turns the "> upper" checks into half-open bounds.
+_PCR_SENTIMENT_BOUNDS = (0.7, math.nextafter(1.3, math.inf))
+_PCR_SENTIMENTS = ("bullish", "neutral", "bearish")
+_OI_RATIO_SIGNAL_BOUNDS = (0.7, math.nextafter(1.5, math.inf))
+_OI_RATIO_SIGNALS = (_OI_SIGNAL_BEARISH, _OI_SIGNAL_NEUTRAL, _OI_SIGNAL_BULLISH)
+
+_OI_CHANGE_HEADER = "📊 **Open Interest Change Analysis:**\n\n**Overall OI Flow:**\n"
+_OI_BIAS_BEARISH = "• **Bias: Bearish** (More Call writing/Put unwinding)\n\n"
+_OI_BIAS_BULLISH = "• **Bias: Bullish** (More Put writing/Call unwinding)\n\n"
+_OI_BIAS_NEUTRAL = "• **Bias: Neutral** (Balanced OI changes)\n\n"
+_OI_SIGNIFICANT_HEADER = "**Significant OI Changes (>15% or >100K contracts):**\n"
+_OI_NO_SIGNIFICANT = "**No significant OI changes detected.**\n\n"
+_OI_IMPLICATIONS_HEADER = "**Trading Implications:**\n"
+_OI_IMPLICATION_CALLS = "• High Call activity suggests resistance levels or bearish sentiment\n"
+_OI_IMPLICATION_PUTS = "• High Put activity suggests support levels or bullish sentiment\n"
+_OI_IMPLICATIONS_ACTIVE = (
+    "• Monitor these strikes for potential support/resistance\n"
+    "• Consider contrarian trades if OI build-up is excessive\n"
+)
+_OI_IMPLICATIONS_QUIET = (
+    "• Limited institutional activity detected\n"
+    "• Market may be in consolidation phase\n"
+)
+_OI_CHANGE_FOOTER = "\n*Analysis based on OI changes from previous trading session*"
+
+# Data quality result when there is nothing to assess; copied, then given its own issue list
+_EMPTY_DATA_QUALITY = {
+    "total_strikes": 0,
+    "liquid_strikes": 0,
+    "liquidity_ratio": 0,
+    "total_volume": 0,
+    "total_oi": 0,
+    "quality_issues": [],
+    "is_reliable": False
+}
+
+
+def _nearest_indices(dist: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k smallest distances, ordered as a stable sort would.
+
+    Uses a partial partition to find the k-th distance so only the
+    candidates at or below it are sorted.
+    """
+    if dist.size > k:
+        kth = np.partition(dist, k - 1)[k - 1]
+        idx = np.flatnonzero(dist <= kth)
+    else:
+        idx = np.arange(dist.size)
+    return idx[np.argsort(dist[idx], kind="stable")][:k]
+
+
+@dataclass
+class ScanResult:
+    """Aggregates collected in a single pass over an option chain."""
+    soa: Dict[str, Any]
+    dist: np.ndarray
+    atm_mask: np.ndarray
+    atm_index: Optional[int]
+    ce_volume_total: int
+    pe_volume_total: int
+    ce_oi_total: int
+    pe_oi_total: int
+    high_volume_strikes: List[Dict[str, Any]]
+    # Extracted (call_data, put_data) per strike index, filled on demand
+    option_data: Dict[int, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = field(default_factory=dict)
+
+
 class TradingAdvisor:
     """AI-powered trading advisor for options trading."""
     
@@ -30,33 +127,166 @@ class TradingAdvisor:
         self.ai_client = GeminiAIClient()
         self.oi_recommendation_service = OIRecommendationService(market_data_manager, api_client)
 
-        # Cache for recent analyses to avoid redundant API calls
-        self.analysis_cache = {}
+        # Cache for recent analyses to avoid redundant API calls, bounded and
+        # evicted least recently used first
+        self.analysis_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
         self.cache_duration = timedelta(minutes=5)
+        self.cache_max_size = 256
+
+        # Prepared market data for the most recent option chain
+        self._prepared_cache = None
+
+        # Short-lived market analysis cache shared by concurrent callers
+        self._market_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._market_locks: Dict[int, asyncio.Lock] = {}
+        self._market_cache_ttl = 10.0  # seconds, while the market is open
+        self._closed_market_cache_ttl = 300.0  # seconds, data doesn't change after close
+
+        # Bounded pool for blocking API and analysis calls made from coroutines
+        self._executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="trading-advisor")
+
+        # Limits concurrent Gemini requests from multi_analysis; created on first use
+        # so it binds to the running event loop
+        self._ai_semaphore: Optional[asyncio.Semaphore] = None
+        self._max_concurrent_ai_requests = 10
 
         logger.info("Trading advisor initialized")
     
-    async def analyze_current_market(self, underlying_scrip: int = 13) -> Dict[str, Any]:
+    async def analyze_current_market(self, underlying_scrip: int = 13, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Analyze current market conditions for the given underlying.
-        
+
+        Results are cached briefly per underlying, and concurrent callers
+        share a single fetch.
+
         Args:
             underlying_scrip: Security ID (default: 13 for NIFTY)
-            
+            force_refresh: Bypass the cache and fetch fresh data
+
         Returns:
             Market analysis data
         """
+        if not force_refresh:
+            cached = self._get_cached_market_analysis(underlying_scrip)
+            if cached is not None:
+                return cached
+
+        lock = self._market_locks.get(underlying_scrip)
+        if lock is None:
+            lock = self._market_locks[underlying_scrip] = asyncio.Lock()
+
+        async with lock:
+            # Another caller may have refreshed the analysis while we waited
+            if not force_refresh:
+                cached = self._get_cached_market_analysis(underlying_scrip)
+                if cached is not None:
+                    return cached
+
+            analysis = await self._fetch_market_analysis(underlying_scrip)
+            if "error" not in analysis:
+                self._market_cache[underlying_scrip] = (time.monotonic(), analysis)
+            return analysis
+
+    async def analyze_dashboard(self, scrips: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Analyze several underlyings concurrently.
+
+        Args:
+            scrips: Security IDs to analyze
+
+        Returns:
+            Market analysis data keyed by security ID
+        """
+        results = await asyncio.gather(*(self.analyze_current_market(scrip) for scrip in scrips))
+        return dict(zip(scrips, results))
+
+    async def multi_analysis(self, analysis_types: List[str], underlying_scrip: int = 13) -> List[str]:
+        """
+        Run several AI analyses concurrently against one market snapshot.
+
+        The market analysis is fetched once up front; every analysis is run
+        for the same underlying and reuses the cached snapshot instead of
+        fetching its own.
+
+        Args:
+            analysis_types: Analyses to run ("option_chain", "strategies",
+                "unusual_activity", "oi_changes" or a free-form topic)
+            underlying_scrip: Security ID (default: 13 for NIFTY)
+
+        Returns:
+            Analysis text for each requested type, in order
+        """
+        market_analysis = await self.analyze_current_market(underlying_scrip)
+        if "error" in market_analysis:
+            message = f"Unable to analyze market: {market_analysis['error']}"
+            return [message] * len(analysis_types)
+
+        if self._ai_semaphore is None:
+            self._ai_semaphore = asyncio.Semaphore(self._max_concurrent_ai_requests)
+
+        async def run(analysis_type: str) -> str:
+            async with self._ai_semaphore:
+                return await self._run_analysis(analysis_type, underlying_scrip)
+
+        results = await asyncio.gather(*(run(t) for t in analysis_types), return_exceptions=True)
+
+        analyses = []
+        for analysis_type, result in zip(analysis_types, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error running {analysis_type} analysis: {result}")
+                result = f"Sorry, I encountered an error running the {analysis_type} analysis: {str(result)}"
+            analyses.append(result)
+        return analyses
+
+    async def _run_analysis(self, analysis_type: str, underlying_scrip: int) -> str:
+        """Dispatch a single analysis type for multi_analysis."""
+        if analysis_type == "option_chain":
+            return await self.analyze_option_chain_ai(underlying_scrip)
+        if analysis_type == "strategies":
+            return await self.suggest_strategies(underlying_scrip=underlying_scrip)
+        if analysis_type == "unusual_activity":
+            return await self.detect_unusual_activity(underlying_scrip)
+        if analysis_type == "oi_changes":
+            return await self.analyze_oi_changes(underlying_scrip)
+        return await self.get_trading_recommendation(f"Provide {analysis_type} analysis", underlying_scrip)
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call in the advisor's worker pool without stalling the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def _get_cached_market_analysis(self, underlying_scrip: int) -> Optional[Dict[str, Any]]:
+        """Return the cached market analysis if it is still fresh."""
+        entry = self._market_cache.get(underlying_scrip)
+        if entry is None:
+            return None
+
+        ttl = self._market_cache_ttl if self._is_market_open() else self._closed_market_cache_ttl
+        if time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    @staticmethod
+    def _is_market_open() -> bool:
+        """Check whether it is a weekday between 09:15 and 15:30 IST (exchange holidays aren't tracked)."""
+        now = datetime.now(_MARKET_TZ)
+        return now.weekday() < 5 and _MARKET_OPEN <= now.time() <= _MARKET_CLOSE
+
+    async def _fetch_market_analysis(self, underlying_scrip: int) -> Dict[str, Any]:
+        """Fetch the option chain and build a fresh market analysis."""
         try:
             # Get current option chain data
-            expiries = self.api_client.get_option_expiry_list(underlying_scrip)
+            expiries = await self._run_blocking(self.api_client.get_option_expiry_list, underlying_scrip)
             if not expiries:
                 return {"error": "No expiry data available"}
             
             # Use the nearest expiry for analysis
             nearest_expiry = expiries[0]
-            # Force fresh data for AI analysis to ensure live data access
-            option_chain = self.market_data_manager.get_option_chain(
-                underlying_scrip, "IDX_I", nearest_expiry, use_cache=False
+            # Force fresh data for AI analysis while the market is live;
+            # after close the cached chain is as good as a new fetch
+            option_chain = await self._run_blocking(
+                self.market_data_manager.get_option_chain,
+                underlying_scrip, "IDX_I", nearest_expiry, use_cache=not self._is_market_open()
             )
             
             # Prepare market data for analysis
@@ -76,147 +306,172 @@ class TradingAdvisor:
             logger.error(f"Error analyzing current market: {e}")
             return {"error": str(e)}
     
-    def _prepare_market_data(self, option_chain: OptionChain) -> Dict[str, Any]:
-        """Prepare option chain data for AI analysis."""
-        strikes_data = []
-        atm_strikes = []
-        
+    def _chain_to_soa(self, option_chain: OptionChain) -> Dict[str, Any]:
+        """Get the option chain's per-strike arrays (built once per chain)."""
+        return option_chain.as_soa()
+
+    def _scan_chain(self, option_chain: OptionChain) -> ScanResult:
+        """
+        Scan an option chain once for everything market data preparation needs.
+
+        Args:
+            option_chain: Option chain to scan
+
+        Returns:
+            ScanResult with distances, the ATM window, ATM strike index,
+            CE/PE volume and OI totals and high-volume strikes
+        """
+        soa = self._chain_to_soa(option_chain)
         underlying_price = option_chain.underlying_price
-        
-        # Handle both dictionary and list structures for strikes
-        strikes_to_process = []
-        if isinstance(option_chain.strikes, dict):
-            # Dictionary structure: {strike_price: strike_data}
-            strikes_to_process = [(float(strike_price), strike_data) for strike_price, strike_data in option_chain.strikes.items()]
-        elif isinstance(option_chain.strikes, list):
-            # List structure: [strike_data_with_strike_field]
-            strikes_to_process = [(strike_data.strike, strike_data) for strike_data in option_chain.strikes]
-
-        for strike_float, strike_data in strikes_to_process:
-            # Focus on ATM and near-ATM strikes (within 5% of underlying)
-            if abs(strike_float - underlying_price) / underlying_price <= 0.05:
-                strike_info = {
-                    "strike": strike_float,
-                    "distance_from_atm": abs(strike_float - underlying_price),
-                    "call_data": self._extract_option_data(strike_data.ce) if strike_data.ce else None,
-                    "put_data": self._extract_option_data(strike_data.pe) if strike_data.pe else None
-                }
-                atm_strikes.append(strike_info)
-
-            # Collect all strikes for broader analysis
-            strikes_data.append({
-                "strike": strike_float,
-                "call_data": self._extract_option_data(strike_data.ce) if strike_data.ce else None,
-                "put_data": self._extract_option_data(strike_data.pe) if strike_data.pe else None
-            })
-        
-        # Find ATM strike and analyze volume patterns
-        atm_strike = self._find_atm_strike(underlying_price, strikes_to_process)
-        volume_analysis = self._analyze_volume_patterns(strikes_to_process, underlying_price)
 
-        # Filter and prioritize liquid strikes for AI analysis
-        liquid_strikes = [strike for strike in strikes_data if
-                         (strike["call_data"] and strike["call_data"]["volume"] > 0) or
-                         (strike["put_data"] and strike["put_data"]["volume"] > 0)]
+        # Focus on ATM and near-ATM strikes (within 5% of underlying), flagging 1M+ volume
+        dist, atm_mask, ce_high, pe_high, totals = scan_atm_window(
+            soa["strike"], soa["ce_volume"], soa["ce_oi"], soa["pe_volume"], soa["pe_oi"],
+            float(underlying_price), 0.05, 1000000
+        )
+        ce_volume_total, pe_volume_total, ce_oi_total, pe_oi_total = totals.tolist()
 
-        # Sort by distance from underlying price and take most relevant strikes
-        relevant_strikes = sorted(strikes_data,
-                                key=lambda x: abs(x["strike"] - underlying_price))[:30]
+        high_volume_strikes = []
+        for i in np.flatnonzero(ce_high | pe_high).tolist():
+            strike_float = float(soa["strike"][i])
+            for is_high, option, option_type in ((ce_high[i], soa["ce"][i], "CE"),
+                                                 (pe_high[i], soa["pe"][i], "PE")):
+                if is_high:
+                    high_volume_strikes.append({
+                        "strike": strike_float,
+                        "type": option_type,
+                        "volume": option.volume,
+                        "oi": option.oi,
+                        "last_price": option.last_price
+                    })
 
-        return {
-            "liquid_strikes": liquid_strikes[:15],  # Top 15 liquid strikes
-            "relevant_strikes": relevant_strikes,   # 30 strikes closest to current price
-            "atm_strikes": sorted(atm_strikes, key=lambda x: x["distance_from_atm"])[:10],
-            "underlying_price": underlying_price,
-            "atm_strike": atm_strike,
-            "volume_analysis": volume_analysis,
+        return ScanResult(
+            soa=soa,
+            dist=dist,
+            atm_mask=atm_mask,
+            # argmin returns the first closest strike, as the scalar scan did
+            atm_index=int(dist.argmin()) if dist.size else None,
+            # Only consider strikes within 5% of underlying for sentiment analysis
+            ce_volume_total=ce_volume_total,
+            pe_volume_total=pe_volume_total,
+            ce_oi_total=ce_oi_total,
+            pe_oi_total=pe_oi_total,
+            high_volume_strikes=high_volume_strikes
+        )
+
+    def _prepare_market_data(self, option_chain: OptionChain) -> Dict[str, Any]:
+        """
+        Prepare option chain data for AI analysis.
+
+        The result is reused while the same option chain object is passed in;
+        every fetch builds a new OptionChain, so fresh data is always prepared.
+        """
+        cached = self._prepared_cache
+        if cached is not None and cached[0] is option_chain:
+            return cached[1]
+
+        scan = self._scan_chain(option_chain)
+        soa = scan.soa
+        dist = scan.dist
+
+        # Only the strikes actually returned are materialized as dicts
+        liquid_idx = np.flatnonzero((soa["ce_volume"] > 0) | (soa["pe_volume"] > 0))[:15]
+        relevant_idx = _nearest_indices(dist, 30)
+        atm_idx = np.flatnonzero(scan.atm_mask)
+        atm_idx = atm_idx[_nearest_indices(dist[atm_idx], 10)]
+
+        strike_entries = {}
+        for i in np.union1d(liquid_idx, relevant_idx).tolist():
+            call_data, put_data = self._strike_option_data(scan, i)
+            strike_entries[i] = {
+                "strike": float(soa["strike"][i]),
+                "call_data": call_data,
+                "put_data": put_data
+            }
+
+        atm_strikes = []
+        for i in atm_idx.tolist():
+            call_data, put_data = self._strike_option_data(scan, i)
+            atm_strikes.append({
+                "strike": float(soa["strike"][i]),
+                "distance_from_atm": float(dist[i]),
+                "call_data": call_data,
+                "put_data": put_data
+            })
+
+        market_data = {
+            "liquid_strikes": [strike_entries[i] for i in liquid_idx.tolist()],  # Top 15 liquid strikes
+            "relevant_strikes": [strike_entries[i] for i in relevant_idx.tolist()],  # 30 strikes closest to current price
+            "atm_strikes": atm_strikes,
+            "underlying_price": option_chain.underlying_price,
+            "atm_strike": self._find_atm_strike(scan),
+            "volume_analysis": self._analyze_volume_patterns(scan),
             "data_quality": self._assess_data_quality(option_chain)
         }
-    
+
+        self._prepared_cache = (option_chain, market_data)
+        return market_data
+
+    def _strike_option_data(self, scan: ScanResult, i: int) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Extract CE/PE data for a strike, at most once per scan."""
+        cached = scan.option_data.get(i)
+        if cached is None:
+            ce = scan.soa["ce"][i]
+            pe = scan.soa["pe"][i]
+            cached = (
+                self._extract_option_data(ce) if ce else None,
+                self._extract_option_data(pe) if pe else None
+            )
+            scan.option_data[i] = cached
+        return cached
+
     def _extract_option_data(self, option_data) -> Dict[str, Any]:
         """Extract relevant option data for analysis."""
         if not option_data:
             return None
 
+        greeks = option_data.greeks
         return {
             "last_price": option_data.last_price,
             "implied_volatility": option_data.implied_volatility,
             "volume": option_data.volume,
             "open_interest": option_data.oi,  # OptionData uses 'oi' not 'open_interest'
             "greeks": {
-                "delta": option_data.greeks.delta if option_data.greeks else None,
-                "gamma": option_data.greeks.gamma if option_data.greeks else None,
-                "theta": option_data.greeks.theta if option_data.greeks else None,
-                "vega": option_data.greeks.vega if option_data.greeks else None
-            } if option_data.greeks else None
+                "delta": greeks.delta,
+                "gamma": greeks.gamma,
+                "theta": greeks.theta,
+                "vega": greeks.vega
+            } if greeks else None
         }
 
-    def _find_atm_strike(self, underlying_price: float, strikes_to_process: List) -> Dict[str, Any]:
+    def _find_atm_strike(self, scan: ScanResult) -> Dict[str, Any]:
         """Find the at-the-money strike and nearby strikes."""
-        closest_strike = None
-        min_distance = float('inf')
-
-        for strike_float, strike_data in strikes_to_process:
-            distance = abs(strike_float - underlying_price)
-            if distance < min_distance:
-                min_distance = distance
-                closest_strike = {
-                    "strike": strike_float,
-                    "distance": distance,
-                    "ce_data": self._extract_option_data(strike_data.ce) if strike_data.ce else None,
-                    "pe_data": self._extract_option_data(strike_data.pe) if strike_data.pe else None
-                }
-
-        return closest_strike
-
-    def _analyze_volume_patterns(self, strikes_to_process: List, underlying_price: float) -> Dict[str, Any]:
-        """Analyze volume patterns to identify market sentiment."""
-        ce_volume_total = 0
-        pe_volume_total = 0
-        ce_oi_total = 0
-        pe_oi_total = 0
+        i = scan.atm_index
+        if i is None:
+            return None
 
-        high_volume_strikes = []
+        ce_data, pe_data = self._strike_option_data(scan, i)
+        return {
+            "strike": float(scan.soa["strike"][i]),
+            "distance": float(scan.dist[i]),
+            "ce_data": ce_data,
+            "pe_data": pe_data
+        }
 
-        for strike_float, strike_data in strikes_to_process:
-            # Only consider strikes within 5% of underlying for sentiment analysis
-            if abs(strike_float - underlying_price) / underlying_price <= 0.05:
-                if strike_data.ce:
-                    ce_volume_total += strike_data.ce.volume
-                    ce_oi_total += strike_data.ce.oi
-
-                    if strike_data.ce.volume > 1000000:  # 1M+ volume
-                        high_volume_strikes.append({
-                            "strike": strike_float,
-                            "type": "CE",
-                            "volume": strike_data.ce.volume,
-                            "oi": strike_data.ce.oi,
-                            "last_price": strike_data.ce.last_price
-                        })
-
-                if strike_data.pe:
-                    pe_volume_total += strike_data.pe.volume
-                    pe_oi_total += strike_data.pe.oi
-
-                    if strike_data.pe.volume > 1000000:  # 1M+ volume
-                        high_volume_strikes.append({
-                            "strike": strike_float,
-                            "type": "PE",
-                            "volume": strike_data.pe.volume,
-                            "oi": strike_data.pe.oi,
-                            "last_price": strike_data.pe.last_price
-                        })
+    def _analyze_volume_patterns(self, scan: ScanResult) -> Dict[str, Any]:
+        """Analyze volume patterns to identify market sentiment."""
+        ce_volume_total = scan.ce_volume_total
+        pe_volume_total = scan.pe_volume_total
+        ce_oi_total = scan.ce_oi_total
+        pe_oi_total = scan.pe_oi_total
+        high_volume_strikes = scan.high_volume_strikes
 
         # Calculate PCR (Put-Call Ratio)
         pcr_volume = pe_volume_total / ce_volume_total if ce_volume_total > 0 else 0
         pcr_oi = pe_oi_total / ce_oi_total if ce_oi_total > 0 else 0
 
-        # Determine market sentiment
-        sentiment = "neutral"
-        if pcr_volume < 0.7:
-            sentiment = "bullish"
-        elif pcr_volume > 1.3:
-            sentiment = "bearish"
+        # Determine market sentiment: < 0.7 bullish, > 1.3 bearish
+        sentiment = _PCR_SENTIMENTS[bisect_right(_PCR_SENTIMENT_BOUNDS, pcr_volume)]
 
         return {
             "ce_volume_total": ce_volume_total,
@@ -226,29 +481,29 @@ class TradingAdvisor:
             "pcr_volume": pcr_volume,
             "pcr_oi": pcr_oi,
             "market_sentiment": sentiment,
-            "high_volume_strikes": sorted(high_volume_strikes, key=lambda x: x["volume"], reverse=True)[:5]
+            "high_volume_strikes": heapq.nlargest(5, high_volume_strikes, key=lambda x: x["volume"])
         }
 
-    async def get_trading_recommendation(self, user_query: str) -> str:
+    async def get_trading_recommendation(self, user_query: str, underlying_scrip: int = 13) -> str:
         """
         Get AI-powered trading recommendation based on user query.
         
         Args:
             user_query: User's trading question or request
+            underlying_scrip: Security ID (default: 13 for NIFTY)
             
         Returns:
             AI-generated recommendation
         """
         try:
             # Check cache first
-            cache_key = f"recommendation_{hash(user_query)}"
-            if cache_key in self.analysis_cache:
-                cached_time, cached_result = self.analysis_cache[cache_key]
-                if datetime.now() - cached_time < self.cache_duration:
-                    return cached_result
+            cache_key = self._recommendation_cache_key(user_query, underlying_scrip)
+            cached_result = self._get_cached_analysis(cache_key)
+            if cached_result is not None:
+                return cached_result
             
             # Get current market data
-            market_analysis = await self.analyze_current_market()
+            market_analysis = await self.analyze_current_market(underlying_scrip)
             
             if "error" in market_analysis:
                 return f"Unable to analyze market: {market_analysis['error']}"
@@ -264,7 +519,7 @@ class TradingAdvisor:
             )
             
             # Cache the result
-            self.analysis_cache[cache_key] = (datetime.now(), recommendation)
+            self._store_cached_analysis(cache_key, recommendation)
             
             return recommendation
             
@@ -272,6 +527,47 @@ class TradingAdvisor:
             logger.error(f"Error getting trading recommendation: {e}")
             return f"Sorry, I encountered an error processing your request: {str(e)}"
 
+    def _get_cached_analysis(self, cache_key: str) -> Optional[str]:
+        """Return a cached analysis if it hasn't expired, dropping it otherwise."""
+        entry = self.analysis_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        cached_time, cached_result = entry
+        if time.monotonic() - cached_time >= self.cache_duration.total_seconds():
+            del self.analysis_cache[cache_key]
+            return None
+
+        self.analysis_cache.move_to_end(cache_key)
+        return cached_result
+
+    def _store_cached_analysis(self, cache_key: str, result: str) -> None:
+        """Cache an analysis, evicting expired and least recently used entries."""
+        now = time.monotonic()
+        ttl = self.cache_duration.total_seconds()
+
+        self.analysis_cache[cache_key] = (now, result)
+        self.analysis_cache.move_to_end(cache_key)
+
+        # Drop expired entries from the least recently used end, then trim to size
+        while self.analysis_cache:
+            oldest_time, _ = next(iter(self.analysis_cache.values()))
+            if now - oldest_time < ttl and len(self.analysis_cache) <= self.cache_max_size:
+                break
+            self.analysis_cache.popitem(last=False)
+
+    @staticmethod
+    def _recommendation_cache_key(user_query: str, underlying_scrip: int = 13) -> str:
+        """
+        Build a stable cache key for a user query about one underlying.
+
+        Queries differing only in case or whitespace share a key, and the
+        digest is the same across processes unlike the built-in hash().
+        """
+        normalized = " ".join(user_query.lower().split())
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+        return f"recommendation_{underlying_scrip}_{digest}"
+
     async def get_specific_oi_data(self, strike_price: float, expiry: str = None) -> str:
         """Get specific open interest data for a strike price."""
         try:
@@ -299,21 +595,15 @@ class TradingAdvisor:
                 return f"No option data found for strike price {strike_price}"
 
             # Format the response with real-time data
-            response = f"📊 **Real-time Open Interest Data for {strike_price} Strike:**\n\n"
+            parts = [f"📊 **Real-time Open Interest Data for {strike_price} Strike:**\n\n"]
 
             if ce_data:
-                response += f"**Call Options (CE):**\n"
-                response += f"• Open Interest: {ce_data.get('open_interest', 'N/A'):,}\n"
-                response += f"• Volume: {ce_data.get('volume', 'N/A'):,}\n"
-                response += f"• LTP: ₹{ce_data.get('ltp', 'N/A')}\n"
-                response += f"• Change: {ce_data.get('change', 'N/A')}%\n\n"
+                parts.append(_OI_CALL_HEADER)
+                self._append_option_oi_lines(parts, ce_data)
 
             if pe_data:
-                response += f"**Put Options (PE):**\n"
-                response += f"• Open Interest: {pe_data.get('open_interest', 'N/A'):,}\n"
-                response += f"• Volume: {pe_data.get('volume', 'N/A'):,}\n"
-                response += f"• LTP: ₹{pe_data.get('ltp', 'N/A')}\n"
-                response += f"• Change: {pe_data.get('change', 'N/A')}%\n\n"
+                parts.append(_OI_PUT_HEADER)
+                self._append_option_oi_lines(parts, pe_data)
 
             # Add analysis
             if ce_data and pe_data:
@@ -321,27 +611,51 @@ class TradingAdvisor:
                 pe_oi = pe_data.get('open_interest', 0)
                 if ce_oi and pe_oi:
                     ratio = pe_oi / ce_oi if ce_oi > 0 else 0
-                    response += f"**Analysis:**\n"
-                    response += f"• Put/Call OI Ratio: {ratio:.2f}\n"
-                    if ratio > 1.5:
-                        response += f"• Signal: Bullish (High Put OI suggests support)\n"
-                    elif ratio < 0.7:
-                        response += f"• Signal: Bearish (High Call OI suggests resistance)\n"
-                    else:
-                        response += f"• Signal: Neutral\n"
-
-            response += f"\n*Data as of {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
-            return response
+                    parts.append(_OI_ANALYSIS_HEADER)
+                    parts.append(f"• Put/Call OI Ratio: {ratio:.2f}\n")
+                    # > 1.5 bullish, < 0.7 bearish
+                    parts.append(_OI_RATIO_SIGNALS[bisect_right(_OI_RATIO_SIGNAL_BOUNDS, ratio)])
+
+            parts.append(f"\n*Data as of {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+            return "".join(parts)
 
         except Exception as e:
             logger.error(f"Error getting specific OI data: {e}")
             return f"Error fetching OI data for strike {strike_price}: {str(e)}"
 
+    @staticmethod
+    def _append_option_oi_lines(parts: List[str], option: Dict[str, Any]) -> None:
+        """Append the OI, volume, LTP and change lines for one option leg."""
+        parts.append(f"• Open Interest: {option.get('open_interest', 'N/A'):,}\n")
+        parts.append(f"• Volume: {option.get('volume', 'N/A'):,}\n")
+        parts.append(f"• LTP: ₹{option.get('ltp', 'N/A')}\n")
+        parts.append(f"• Change: {option.get('change', 'N/A')}%\n\n")
+
+    @staticmethod
+    def _oi_change_arrays(oi_changes: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorize OI changes for one option side.
+
+        Args:
+            oi_changes: OI change per strike, None where unavailable
+
+        Returns:
+            Tuple of (absolute changes, significance mask)
+        """
+        n = len(oi_changes)
+        absolute = np.fromiter((c.absolute_change if c else 0 for c in oi_changes), dtype=np.int64, count=n)
+        percentage = np.fromiter((c.percentage_change if c else 0.0 for c in oi_changes), dtype=np.float64, count=n)
+
+        # Consider changes > 15% or > 100K contracts as significant
+        significant = (np.abs(percentage) > 15) | (np.abs(absolute) > 100000)
+        return absolute, significant
+
     async def analyze_oi_changes(self, underlying_scrip: int = 13, expiry: str = None) -> str:
         """Analyze OI changes across the option chain for trading insights."""
         try:
             # Get option chain with OI changes
-            option_chain = self.market_data_manager.get_option_chain_with_oi_changes(
+            option_chain = await self._run_blocking(
+                self.market_data_manager.get_option_chain_with_oi_changes,
                 underlying_scrip=underlying_scrip,
                 expiry=expiry
             )
@@ -350,94 +664,82 @@ class TradingAdvisor:
                 return "Unable to fetch option chain data for OI change analysis"
 
             # Analyze significant OI changes
+            strike_keys = list(option_chain.strikes)
+            strike_objects = list(option_chain.strikes.values())
+            ce_oi_changes = [sd.ce.oi_change if sd.ce else None for sd in strike_objects]
+            pe_oi_changes = [sd.pe.oi_change if sd.pe else None for sd in strike_objects]
+
+            ce_abs, ce_significant = self._oi_change_arrays(ce_oi_changes)
+            pe_abs, pe_significant = self._oi_change_arrays(pe_oi_changes)
+
+            total_ce_oi_change = int(ce_abs.sum())
+            total_pe_oi_change = int(pe_abs.sum())
+
+            ce_idx = np.flatnonzero(ce_significant)
+            pe_idx = np.flatnonzero(pe_significant)
+            ce_significant_count = len(ce_idx)
+            pe_significant_count = len(pe_idx)
+
+            # Rank by absolute change; ties keep chain order with CE before PE
+            order = np.concatenate((2 * ce_idx, 2 * pe_idx + 1))
+            sizes = np.abs(np.concatenate((ce_abs[ce_idx], pe_abs[pe_idx])))
+            top = order[np.lexsort((order, -sizes))[:10]]
+
+            # Only the top changes are materialized
             significant_changes = []
-            total_ce_oi_change = 0
-            total_pe_oi_change = 0
-
-            for strike_price, strike_data in option_chain.strikes.items():
-                strike = float(strike_price)
-
-                # Analyze CE OI changes
-                if strike_data.ce and strike_data.ce.oi_change:
-                    oi_change = strike_data.ce.oi_change
-                    total_ce_oi_change += oi_change.absolute_change
-
-                    # Consider changes > 15% or > 100K contracts as significant
-                    if abs(oi_change.percentage_change) > 15 or abs(oi_change.absolute_change) > 100000:
-                        significant_changes.append({
-                            'strike': strike,
-                            'type': 'CE',
-                            'change': oi_change.absolute_change,
-                            'percentage': oi_change.percentage_change,
-                            'current_oi': oi_change.current_oi,
-                            'previous_oi': oi_change.previous_oi
-                        })
-
-                # Analyze PE OI changes
-                if strike_data.pe and strike_data.pe.oi_change:
-                    oi_change = strike_data.pe.oi_change
-                    total_pe_oi_change += oi_change.absolute_change
-
-                    # Consider changes > 15% or > 100K contracts as significant
-                    if abs(oi_change.percentage_change) > 15 or abs(oi_change.absolute_change) > 100000:
-                        significant_changes.append({
-                            'strike': strike,
-                            'type': 'PE',
-                            'change': oi_change.absolute_change,
-                            'percentage': oi_change.percentage_change,
-                            'current_oi': oi_change.current_oi,
-                            'previous_oi': oi_change.previous_oi
-                        })
+            for key in top.tolist():
+                i, is_put = divmod(key, 2)
+                oi_change = pe_oi_changes[i] if is_put else ce_oi_changes[i]
+                significant_changes.append({
+                    'strike': float(strike_keys[i]),
+                    'type': 'PE' if is_put else 'CE',
+                    'change': oi_change.absolute_change,
+                    'percentage': oi_change.percentage_change,
+                    'current_oi': oi_change.current_oi,
+                    'previous_oi': oi_change.previous_oi
+                })
 
             # Generate analysis
-            response = f"📊 **Open Interest Change Analysis:**\n\n"
-
-            # Overall OI flow
-            response += f"**Overall OI Flow:**\n"
-            response += f"• Total CE OI Change: {total_ce_oi_change:+,}\n"
-            response += f"• Total PE OI Change: {total_pe_oi_change:+,}\n"
+            parts = [
+                _OI_CHANGE_HEADER,
+                # Overall OI flow
+                f"• Total CE OI Change: {total_ce_oi_change:+,}\n",
+                f"• Total PE OI Change: {total_pe_oi_change:+,}\n"
+            ]
 
             if total_ce_oi_change > total_pe_oi_change:
-                response += f"• **Bias: Bearish** (More Call writing/Put unwinding)\n\n"
+                parts.append(_OI_BIAS_BEARISH)
             elif total_pe_oi_change > total_ce_oi_change:
-                response += f"• **Bias: Bullish** (More Put writing/Call unwinding)\n\n"
+                parts.append(_OI_BIAS_BULLISH)
             else:
-                response += f"• **Bias: Neutral** (Balanced OI changes)\n\n"
+                parts.append(_OI_BIAS_NEUTRAL)
 
             # Significant changes
             if significant_changes:
-                response += f"**Significant OI Changes (>15% or >100K contracts):**\n"
-
-                # Sort by absolute change
-                significant_changes.sort(key=lambda x: abs(x['change']), reverse=True)
+                parts.append(_OI_SIGNIFICANT_HEADER)
 
-                for change in significant_changes[:10]:  # Top 10
+                for change in significant_changes:  # Top 10
                     change_type = "📈 Build-up" if change['change'] > 0 else "📉 Unwinding"
-                    response += f"• **{change['strike']} {change['type']}**: {change_type}\n"
-                    response += f"  - Change: {change['change']:+,} ({change['percentage']:+.1f}%)\n"
-                    response += f"  - OI: {change['previous_oi']:,} → {change['current_oi']:,}\n\n"
+                    parts.append(f"• **{change['strike']} {change['type']}**: {change_type}\n")
+                    parts.append(f"  - Change: {change['change']:+,} ({change['percentage']:+.1f}%)\n")
+                    parts.append(f"  - OI: {change['previous_oi']:,} → {change['current_oi']:,}\n\n")
             else:
-                response += f"**No significant OI changes detected.**\n\n"
+                parts.append(_OI_NO_SIGNIFICANT)
 
             # Trading implications
-            response += f"**Trading Implications:**\n"
+            parts.append(_OI_IMPLICATIONS_HEADER)
             if len(significant_changes) > 0:
-                ce_changes = [c for c in significant_changes if c['type'] == 'CE']
-                pe_changes = [c for c in significant_changes if c['type'] == 'PE']
+                if ce_significant_count > pe_significant_count:
+                    parts.append(_OI_IMPLICATION_CALLS)
+                elif pe_significant_count > ce_significant_count:
+                    parts.append(_OI_IMPLICATION_PUTS)
 
-                if len(ce_changes) > len(pe_changes):
-                    response += f"• High Call activity suggests resistance levels or bearish sentiment\n"
-                elif len(pe_changes) > len(ce_changes):
-                    response += f"• High Put activity suggests support levels or bullish sentiment\n"
-
-                response += f"• Monitor these strikes for potential support/resistance\n"
-                response += f"• Consider contrarian trades if OI build-up is excessive\n"
+                parts.append(_OI_IMPLICATIONS_ACTIVE)
             else:
-                response += f"• Limited institutional activity detected\n"
-                response += f"• Market may be in consolidation phase\n"
+                parts.append(_OI_IMPLICATIONS_QUIET)
 
-            response += f"\n*Analysis based on OI changes from previous trading session*"
-            return response
+            parts.append(_OI_CHANGE_FOOTER)
+            return "".join(parts)
 
         except Exception as e:
             logger.error(f"Error analyzing OI changes: {e}")
@@ -472,19 +774,25 @@ class TradingAdvisor:
             logger.error(f"Error analyzing option chain: {e}")
             return f"Sorry, I encountered an error analyzing the option chain: {str(e)}"
     
-    async def suggest_strategies(self, market_outlook: str = "neutral", risk_tolerance: str = "moderate") -> str:
+    async def suggest_strategies(
+        self,
+        market_outlook: str = "neutral",
+        risk_tolerance: str = "moderate",
+        underlying_scrip: int = 13
+    ) -> str:
         """
         Suggest option trading strategies based on current market conditions.
         
         Args:
             market_outlook: bullish/bearish/neutral
             risk_tolerance: low/moderate/high
+            underlying_scrip: Security ID (default: 13 for NIFTY)
             
         Returns:
             Strategy suggestions
         """
         try:
-            market_analysis = await self.analyze_current_market()
+            market_analysis = await self.analyze_current_market(underlying_scrip)
             
             if "error" in market_analysis:
                 return f"Unable to suggest strategies: {market_analysis['error']}"
@@ -510,8 +818,10 @@ class TradingAdvisor:
         """Get user's portfolio context for personalized advice."""
         try:
             # Get current positions and funds
-            positions = self.api_client.get_positions()
-            fund_limit = self.api_client.get_fund_limit()
+            positions, fund_limit = await asyncio.gather(
+                self._run_blocking(self.api_client.get_positions),
+                self._run_blocking(self.api_client.get_fund_limit)
+            )
             
             return {
                 "available_balance": fund_limit.available_balance,
@@ -551,8 +861,8 @@ class TradingAdvisor:
         """
         try:
             # Get OI-based recommendation
-            recommendation = self.oi_recommendation_service.get_oi_recommendation(
-                underlying_scrip, expiry
+            recommendation = await self._run_blocking(
+                self.oi_recommendation_service.get_oi_recommendation, underlying_scrip, expiry
             )
 
             # Format the basic recommendation
@@ -608,7 +918,9 @@ class TradingAdvisor:
             Dictionary with quick signal data
         """
         try:
-            recommendation = self.oi_recommendation_service.get_oi_recommendation(underlying_scrip)
+            recommendation = await self._run_blocking(
+                self.oi_recommendation_service.get_oi_recommendation, underlying_scrip
+            )
 
             return {
                 "signal": recommendation.signal,
@@ -632,17 +944,23 @@ class TradingAdvisor:
                 "timestamp": datetime.now().isoformat()
             }
     
-    async def detect_unusual_activity(self) -> str:
+    async def detect_unusual_activity(self, underlying_scrip: int = 13) -> str:
         """Detect unusual option activity and opportunities."""
         try:
-            market_analysis = await self.analyze_current_market()
+            market_analysis = await self.analyze_current_market(underlying_scrip)
             
             if "error" in market_analysis:
                 return f"Unable to detect unusual activity: {market_analysis['error']}"
             
-            # Focus on volume and OI data
+            # Focus on volume and OI data of the strikes near the money and
+            # the most liquid ones, each strike once
+            market_data = market_analysis["market_data"]
             option_data = []
-            for strike_data in market_analysis["market_data"]["all_strikes"]:
+            seen_strikes = set()
+            for strike_data in chain(market_data["relevant_strikes"], market_data["liquid_strikes"]):
+                if strike_data["strike"] in seen_strikes:
+                    continue
+                seen_strikes.add(strike_data["strike"])
                 if strike_data["call_data"]:
                     option_data.append({
                         "type": "CALL",
@@ -672,45 +990,21 @@ class TradingAdvisor:
         """Assess the quality of option chain data for analysis."""
         try:
             if not option_chain or not hasattr(option_chain, 'strikes'):
-                return {
-                    "total_strikes": 0,
-                    "liquid_strikes": 0,
-                    "liquidity_ratio": 0,
-                    "total_volume": 0,
-                    "total_oi": 0,
-                    "quality_issues": ["No option chain data available"],
-                    "is_reliable": False
-                }
-
-            # Handle both dictionary and list structures for strikes
-            strikes_to_process = []
-            if isinstance(option_chain.strikes, dict):
-                strikes_to_process = list(option_chain.strikes.values())
-                total_strikes = len(option_chain.strikes)
-            elif isinstance(option_chain.strikes, list):
-                strikes_to_process = option_chain.strikes
-                total_strikes = len(option_chain.strikes)
-            else:
-                total_strikes = 0
-
-            liquid_strikes = 0
-            total_volume = 0
-            total_oi = 0
-
-            for strike_data in strikes_to_process:
-                # Check call data
-                if strike_data.ce and hasattr(strike_data.ce, 'volume') and hasattr(strike_data.ce, 'oi'):
-                    if strike_data.ce.volume > 0 or strike_data.ce.oi > 0:
-                        liquid_strikes += 1
-                        total_volume += strike_data.ce.volume
-                        total_oi += strike_data.ce.oi
-
-                # Check put data
-                if strike_data.pe and hasattr(strike_data.pe, 'volume') and hasattr(strike_data.pe, 'oi'):
-                    if strike_data.pe.volume > 0 or strike_data.pe.oi > 0:
-                        liquid_strikes += 1
-                        total_volume += strike_data.pe.volume
-                        total_oi += strike_data.pe.oi
+                quality = _EMPTY_DATA_QUALITY.copy()
+                quality["quality_issues"] = ["No option chain data available"]
+                return quality
+
+            # Reuse the strike arrays already extracted for this chain
+            soa = self._chain_to_soa(option_chain)
+            total_strikes = soa["strike"].size
+
+            # An option is liquid if it has any volume or OI
+            ce_liquid = (soa["ce_volume"] > 0) | (soa["ce_oi"] > 0)
+            pe_liquid = (soa["pe_volume"] > 0) | (soa["pe_oi"] > 0)
+
+            liquid_strikes = int(ce_liquid.sum() + pe_liquid.sum())
+            total_volume = int(soa["ce_volume"][ce_liquid].sum() + soa["pe_volume"][pe_liquid].sum())
+            total_oi = int(soa["ce_oi"][ce_liquid].sum() + soa["pe_oi"][pe_liquid].sum())
 
             liquidity_ratio = liquid_strikes / (total_strikes * 2) if total_strikes > 0 else 0
 
@@ -734,12 +1028,6 @@ class TradingAdvisor:
 
         except Exception as e:
             logger.error(f"Error assessing data quality: {e}")
-            return {
-                "total_strikes": 0,
-                "liquid_strikes": 0,
-                "liquidity_ratio": 0,
-                "total_volume": 0,
-                "total_oi": 0,
-                "quality_issues": [f"Error assessing data quality: {str(e)}"],
-                "is_reliable": False
-            }
+            quality = _EMPTY_DATA_QUALITY.copy()
+            quality["quality_issues"] = [f"Error assessing data quality: {str(e)}"]
+            return quality
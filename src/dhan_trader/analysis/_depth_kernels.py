@@ -0,0 +1,159 @@
+"""Numeric kernels for 20-level market depth analysis.
+
+Numba is an optional dependency. When it is not installed the kernels run as
+plain Python functions with the same results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on optional dependency
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True)
+def depth_scores(
+    prices: np.ndarray,
+    quantities: np.ndarray,
+    orders: np.ndarray,
+    n_bid: int
+) -> Tuple[float, float, float, float]:
+    """
+    Score one book snapshot.
+
+    Written with whole-array expressions so the same code runs, and stays
+    fast, with or without numba. fastmath is left off so the scores match
+    the plain NumPy reductions exactly.
+
+    Args:
+        prices: Level prices, bids followed by asks
+        quantities: Level quantities in the same order
+        orders: Level order counts in the same order
+        n_bid: Number of leading bid levels
+
+    Returns:
+        Tuple of (order flow imbalance, price impact, liquidity score,
+        market efficiency)
+    """
+    bid_qty = quantities[:n_bid]
+    ask_qty = quantities[n_bid:]
+
+    # Order flow imbalance
+    total_bid_qty = bid_qty.sum()
+    total_ask_qty = ask_qty.sum()
+    total_qty = total_bid_qty + total_ask_qty
+    order_flow_imbalance = (total_bid_qty - total_ask_qty) / total_qty if total_qty > 0 else 0.0
+
+    if n_bid == 0 or n_bid == prices.shape[0]:
+        return order_flow_imbalance, 0.0, 0.0, 50.0
+
+    # Price impact: simple model based on spread and top 5 depth
+    spread = prices[n_bid] - prices[0]
+    avg_top_5_qty = (bid_qty[:5].sum() + ask_qty[:5].sum()) / 10
+    price_impact = spread / avg_top_5_qty * 1000 if avg_top_5_qty > 0 else spread
+    price_impact = min(price_impact, 1.0)
+
+    # Liquidity score (0-100): total quantity, order count and distribution
+    qty_score = min(total_qty / 10000, 1.0) * 50
+    order_score = min(orders.sum() / 1000, 1.0) * 30
+    avg_qty = quantities.mean()
+    distribution_score = max(0.0, 20 - quantities.std() / avg_qty * 10) if avg_qty > 0 else 0.0
+    liquidity_score = min(qty_score + order_score + distribution_score, 100.0)
+
+    # Market efficiency: more consistent price gaps indicate higher efficiency
+    bid_gaps = np.abs(np.diff(prices[:n_bid]))
+    ask_gaps = np.abs(np.diff(prices[n_bid:]))
+    efficiency = 50.0
+    if bid_gaps.shape[0] > 0 and ask_gaps.shape[0] > 0:
+        avg_bid_gap = bid_gaps.mean()
+        avg_ask_gap = ask_gaps.mean()
+        bid_consistency = 1.0 - (bid_gaps.max() - bid_gaps.min()) / avg_bid_gap if avg_bid_gap > 0 else 1.0
+        ask_consistency = 1.0 - (ask_gaps.max() - ask_gaps.min()) / avg_ask_gap if avg_ask_gap > 0 else 1.0
+        efficiency = (bid_consistency + ask_consistency) / 2 * 100
+    market_efficiency = max(0.0, min(efficiency, 100.0))
+
+    return order_flow_imbalance, price_impact, liquidity_score, market_efficiency
+
+
+@njit(cache=True)
+def impact_curve(prices: np.ndarray, quantities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the market impact curve of a book.
+
+    Levels are walked in ascending price order. Equal prices keep their book
+    order, so the stable merge sort matches sorting the level list by price.
+
+    Args:
+        prices: Level prices, bids followed by asks
+        quantities: Level quantities in the same order
+
+    Returns:
+        Tuple of (cumulative quantity, relative distance from the median
+        price) per level in price order
+    """
+    order = np.argsort(prices, kind="mergesort")
+    sorted_prices = prices[order]
+    cum_qty = np.cumsum(quantities[order])
+
+    impact = np.zeros(sorted_prices.shape[0], dtype=np.float64)
+    if sorted_prices.shape[0] > 0:
+        base_price = sorted_prices[sorted_prices.shape[0] // 2]  # Mid price
+        if base_price > 0:
+            impact = np.abs(sorted_prices - base_price) / base_price
+
+    return cum_qty, impact
+
+
+@njit(cache=True, parallel=True)
+def fragmentation_scores(quantities: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Score the liquidity fragmentation of many snapshots at once.
+
+    Each score is the coefficient of variation of one snapshot's level
+    quantities, as a percentage capped at 100. Snapshots are scored in
+    parallel when numba is available.
+
+    Args:
+        quantities: Level quantities, one snapshot per row, left-aligned
+        counts: Number of levels used in each row
+
+    Returns:
+        Fragmentation score per snapshot
+    """
+    n = quantities.shape[0]
+    scores = np.zeros(n, dtype=np.float64)
+
+    for i in prange(n):
+        count = counts[i]
+        if count == 0:
+            continue
+
+        total = 0.0
+        for j in range(count):
+            total += quantities[i, j]
+        mean = total / count
+        if mean <= 0:
+            continue
+
+        sq_dev = 0.0
+        for j in range(count):
+            dev = quantities[i, j] - mean
+            sq_dev += dev * dev
+        cv = np.sqrt(sq_dev / count) / mean
+
+        scores[i] = min(cv * 100, 100.0)
+
+    return scores
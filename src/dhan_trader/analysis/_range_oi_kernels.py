@@ -0,0 +1,69 @@
+"""Numeric kernels for strike range OI analysis.
+
+Numba is an optional dependency. When it is not installed the kernels run as
+plain Python functions with the same results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on optional dependency
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# Code -> label lookup for the dominant side returned by reduce_range
+DOMINANT_SIDE_LABELS = ("NEUTRAL", "CALL", "CALL_NEGATIVE", "PUT", "PUT_NEGATIVE")
+
+
+@njit(cache=True, fastmath=True)
+def reduce_range(
+    call_oi: np.ndarray,
+    put_oi: np.ndarray,
+    call_oi_change: np.ndarray,
+    put_oi_change: np.ndarray
+) -> Tuple[int, int, int, int, int]:
+    """
+    Total the OI columns of a strike range and pick the dominant side in one pass.
+
+    Args:
+        call_oi: Call open interest per strike
+        put_oi: Put open interest per strike
+        call_oi_change: Call OI change per strike
+        put_oi_change: Put OI change per strike
+
+    Returns:
+        Tuple of (total call OI, total put OI, total call OI change,
+        total put OI change, dominant side code). The code indexes into
+        DOMINANT_SIDE_LABELS.
+    """
+    total_call_oi = 0
+    total_put_oi = 0
+    total_call_oi_change = 0
+    total_put_oi_change = 0
+
+    for i in range(call_oi.shape[0]):
+        total_call_oi += call_oi[i]
+        total_put_oi += put_oi[i]
+        total_call_oi_change += call_oi_change[i]
+        total_put_oi_change += put_oi_change[i]
+
+    # Dominant side based on OI changes, with a 10% threshold
+    if abs(total_call_oi_change) > abs(total_put_oi_change) * 1.1:
+        dominant_side = 1 if total_call_oi_change > 0 else 2
+    elif abs(total_put_oi_change) > abs(total_call_oi_change) * 1.1:
+        dominant_side = 3 if total_put_oi_change > 0 else 4
+    else:
+        dominant_side = 0
+
+    return total_call_oi, total_put_oi, total_call_oi_change, total_put_oi_change, dominant_side
@@ -1,20 +1,39 @@
 """Advanced market depth analysis for trading insights."""
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from collections import deque
 
-from ..api.models import MarketDepth20Response, MarketDepthLevel
+import numpy as np
+
+from ..api.models import MarketDepth20Response
 from ..exceptions import AnalysisError
+from ._depth_kernels import depth_scores, fragmentation_scores, impact_curve
 
 logger = logging.getLogger(__name__)
 
+# Columns per snapshot in the history ring buffers: 20 bid levels then 20 ask levels
+_HISTORY_LEVELS = 40
+
+
+class _DepthMetrics(NamedTuple):
+    """Snapshot scores computed together in one pass over the book arrays."""
+    order_flow_imbalance: float
+    price_impact: float
+    liquidity_score: float
+    market_efficiency: float
+
 
 @dataclass
 class MarketMicrostructure:
     """Market microstructure analysis results."""
+    __slots__ = (
+        "order_flow_imbalance", "price_impact_estimate", "liquidity_score",
+        "market_efficiency", "volatility_estimate",
+    )
+
     order_flow_imbalance: float  # Positive = buying pressure, Negative = selling pressure
     price_impact_estimate: float  # Estimated price impact of large orders
     liquidity_score: float  # 0-100 score of market liquidity
@@ -25,6 +44,11 @@ class MarketMicrostructure:
 @dataclass
 class TradingSignal:
     """Trading signal based on market depth analysis."""
+    __slots__ = (
+        "signal_type", "strength", "confidence", "reasoning", "target_levels",
+        "stop_loss", "time_horizon",
+    )
+
     signal_type: str  # "BUY", "SELL", "HOLD"
     strength: float  # 0-100 signal strength
     confidence: float  # 0-100 confidence level
@@ -37,9 +61,14 @@ class TradingSignal:
 @dataclass
 class LiquidityAnalysis:
     """Liquidity analysis results."""
+    __slots__ = (
+        "total_liquidity", "liquidity_distribution", "market_impact_curve",
+        "optimal_order_size", "fragmentation_score",
+    )
+
     total_liquidity: int  # Total quantity available
     liquidity_distribution: Dict[str, float]  # Distribution across price levels
-    market_impact_curve: List[Tuple[int, float]]  # (quantity, price_impact) pairs
+    market_impact_curve: Tuple[np.ndarray, np.ndarray]  # (cumulative quantity, price impact) arrays
     optimal_order_size: int  # Optimal order size to minimize impact
     fragmentation_score: float  # How fragmented the liquidity is
 
@@ -55,6 +84,14 @@ class MarketDepthAnalyzer:
         """
         self.history_size = history_size
         self.depth_history = deque(maxlen=history_size)
+        
+        # Book arrays of the same snapshots, one row each, written round-robin
+        self._price_ring = np.zeros((history_size, _HISTORY_LEVELS), dtype=np.float64)
+        self._qty_ring = np.zeros((history_size, _HISTORY_LEVELS), dtype=np.int64)
+        self._level_counts = np.zeros(history_size, dtype=np.int64)
+        self._bid_counts = np.zeros(history_size, dtype=np.int64)
+        self._ring_pos = 0  # Next row to write
+        self._ring_len = 0
         self.analysis_cache = {}
         self.cache_duration = timedelta(seconds=5)
         
@@ -68,10 +105,37 @@ class MarketDepthAnalyzer:
         """
         self.depth_history.append(depth_data)
         
+        soa = depth_data.as_soa()
+        n = min(soa["price"].size, _HISTORY_LEVELS)
+        row = self._ring_pos
+        
+        self._price_ring[row, :n] = soa["price"][:n]
+        self._price_ring[row, n:] = 0
+        self._qty_ring[row, :n] = soa["quantity"][:n]
+        self._qty_ring[row, n:] = 0
+        self._level_counts[row] = n
+        self._bid_counts[row] = min(soa["n_bid"], n)
+        
+        self._ring_pos = (row + 1) % self.history_size
+        self._ring_len = min(self._ring_len + 1, self.history_size)
+        
         # Clear cache for this security
         cache_key = f"{depth_data.security_id}_{depth_data.exchange_segment}"
         self.analysis_cache.pop(cache_key, None)
     
+    def analyze_history_fragmentation(self) -> np.ndarray:
+        """Calculate the fragmentation score of every snapshot in the history.
+        
+        Returns:
+            Fragmentation scores, oldest snapshot first
+        """
+        rows = self._history_rows()
+        return fragmentation_scores(self._qty_ring[rows], self._level_counts[rows])
+    
+    def _history_rows(self) -> np.ndarray:
+        """Get the ring buffer rows holding the history, oldest snapshot first."""
+        return (self._ring_pos - self._ring_len + np.arange(self._ring_len)) % self.history_size
+    
     def analyze_market_microstructure(self, depth_data: MarketDepth20Response) -> MarketMicrostructure:
         """Analyze market microstructure from depth data.
         
@@ -81,36 +145,16 @@ class MarketDepthAnalyzer:
         Returns:
             Market microstructure analysis
         """
-        bid_levels = depth_data.bid_depth.levels
-        ask_levels = depth_data.ask_depth.levels
-        
-        # Calculate order flow imbalance
-        total_bid_qty = sum(level.quantity for level in bid_levels)
-        total_ask_qty = sum(level.quantity for level in ask_levels)
-        total_qty = total_bid_qty + total_ask_qty
-        
-        if total_qty > 0:
-            order_flow_imbalance = (total_bid_qty - total_ask_qty) / total_qty
-        else:
-            order_flow_imbalance = 0.0
-        
-        # Estimate price impact
-        price_impact = self._calculate_price_impact(bid_levels, ask_levels)
-        
-        # Calculate liquidity score
-        liquidity_score = self._calculate_liquidity_score(bid_levels, ask_levels)
-        
-        # Estimate market efficiency
-        market_efficiency = self._calculate_market_efficiency(bid_levels, ask_levels)
+        metrics = self._compute_all_metrics(depth_data.as_soa())
         
         # Estimate volatility
         volatility_estimate = self._estimate_volatility(depth_data)
         
         return MarketMicrostructure(
-            order_flow_imbalance=order_flow_imbalance,
-            price_impact_estimate=price_impact,
-            liquidity_score=liquidity_score,
-            market_efficiency=market_efficiency,
+            order_flow_imbalance=metrics.order_flow_imbalance,
+            price_impact_estimate=metrics.price_impact,
+            liquidity_score=metrics.liquidity_score,
+            market_efficiency=metrics.market_efficiency,
             volatility_estimate=volatility_estimate
         )
     
@@ -126,24 +170,29 @@ class MarketDepthAnalyzer:
         microstructure = self.analyze_market_microstructure(depth_data)
         zones = depth_data.detect_demand_supply_zones()
         
-        # Analyze signal components
-        signal_components = []
+        # Analyze signal components as running (count, strength sum) per side
+        buy_count, buy_strength = 0, 0
+        sell_count, sell_strength = 0, 0
         reasoning = []
         
         # Order flow analysis
         if microstructure.order_flow_imbalance > 0.3:
-            signal_components.append(("BUY", 70))
+            buy_count += 1
+            buy_strength += 70
             reasoning.append(f"Strong buying pressure (OFI: {microstructure.order_flow_imbalance:.2f})")
         elif microstructure.order_flow_imbalance < -0.3:
-            signal_components.append(("SELL", 70))
+            sell_count += 1
+            sell_strength += 70
             reasoning.append(f"Strong selling pressure (OFI: {microstructure.order_flow_imbalance:.2f})")
         
         # Demand/supply zone analysis
         if len(zones["demand_zones"]) > len(zones["supply_zones"]) + 2:
-            signal_components.append(("BUY", 60))
+            buy_count += 1
+            buy_strength += 60
             reasoning.append(f"Multiple demand zones detected ({len(zones['demand_zones'])} vs {len(zones['supply_zones'])})")
         elif len(zones["supply_zones"]) > len(zones["demand_zones"]) + 2:
-            signal_components.append(("SELL", 60))
+            sell_count += 1
+            sell_strength += 60
             reasoning.append(f"Multiple supply zones detected ({len(zones['supply_zones'])} vs {len(zones['demand_zones'])})")
         
         # Liquidity analysis
@@ -157,21 +206,18 @@ class MarketDepthAnalyzer:
             reasoning.append("Market showing inefficiencies - potential arbitrage opportunities")
         
         # Combine signals
-        if not signal_components:
+        if not buy_count and not sell_count:
             signal_type = "HOLD"
             strength = 0
             confidence = 50
         else:
             # Aggregate signals
-            buy_signals = [s for s in signal_components if s[0] == "BUY"]
-            sell_signals = [s for s in signal_components if s[0] == "SELL"]
-            
-            if len(buy_signals) > len(sell_signals):
+            if buy_count > sell_count:
                 signal_type = "BUY"
-                strength = sum(s[1] for s in buy_signals) / len(buy_signals)
-            elif len(sell_signals) > len(buy_signals):
+                strength = buy_strength / buy_count
+            elif sell_count > buy_count:
                 signal_type = "SELL"
-                strength = sum(s[1] for s in sell_signals) / len(sell_signals)
+                strength = sell_strength / sell_count
             else:
                 signal_type = "HOLD"
                 strength = 0
@@ -210,16 +256,18 @@ class MarketDepthAnalyzer:
         Returns:
             Liquidity analysis results
         """
-        bid_levels = depth_data.bid_depth.levels
-        ask_levels = depth_data.ask_depth.levels
-        
-        # Calculate total liquidity
-        total_liquidity = sum(level.quantity for level in bid_levels + ask_levels)
+        soa = depth_data.as_soa()
+        quantities = soa["quantity"]
+        bid_qty = quantities[:soa["n_bid"]]
+        ask_qty = quantities[soa["n_bid"]:]
         
         # Calculate liquidity distribution
-        top_5_liquidity = sum(level.quantity for level in bid_levels[:5] + ask_levels[:5])
-        mid_10_liquidity = sum(level.quantity for level in bid_levels[5:15] + ask_levels[5:15])
-        bottom_5_liquidity = sum(level.quantity for level in bid_levels[15:] + ask_levels[15:])
+        top_5_liquidity = int(bid_qty[:5].sum() + ask_qty[:5].sum())
+        mid_10_liquidity = int(bid_qty[5:15].sum() + ask_qty[5:15].sum())
+        bottom_5_liquidity = int(bid_qty[15:].sum() + ask_qty[15:].sum())
+        
+        # Calculate total liquidity
+        total_liquidity = top_5_liquidity + mid_10_liquidity + bottom_5_liquidity
         
         if total_liquidity > 0:
             distribution = {
@@ -231,13 +279,13 @@ class MarketDepthAnalyzer:
             distribution = {"top_5_levels": 0, "mid_10_levels": 0, "bottom_5_levels": 0}
         
         # Calculate market impact curve
-        impact_curve = self._calculate_market_impact_curve(bid_levels, ask_levels)
+        impact_curve = self._calculate_market_impact_curve(soa)
         
         # Calculate optimal order size
-        optimal_size = self._calculate_optimal_order_size(impact_curve)
+        optimal_size = self._calculate_optimal_order_size(*impact_curve)
         
         # Calculate fragmentation score
-        fragmentation_score = self._calculate_fragmentation_score(bid_levels, ask_levels)
+        fragmentation_score = self._calculate_fragmentation_score(soa)
         
         return LiquidityAnalysis(
             total_liquidity=total_liquidity,
@@ -247,96 +295,35 @@ class MarketDepthAnalyzer:
             fragmentation_score=fragmentation_score
         )
     
-    def _calculate_price_impact(self, bid_levels: List[MarketDepthLevel], ask_levels: List[MarketDepthLevel]) -> float:
-        """Calculate estimated price impact."""
-        if not bid_levels or not ask_levels:
-            return 0.0
-        
-        best_bid = bid_levels[0].price
-        best_ask = ask_levels[0].price
-        spread = best_ask - best_bid
-        
-        # Simple price impact model based on spread and depth
-        avg_top_5_qty = sum(level.quantity for level in bid_levels[:5] + ask_levels[:5]) / 10
-        if avg_top_5_qty > 0:
-            impact = spread / avg_top_5_qty * 1000  # Normalized impact
-        else:
-            impact = spread
-        
-        return min(impact, 1.0)  # Cap at 1.0
-    
-    def _calculate_liquidity_score(self, bid_levels: List[MarketDepthLevel], ask_levels: List[MarketDepthLevel]) -> float:
-        """Calculate liquidity score (0-100)."""
-        if not bid_levels or not ask_levels:
-            return 0.0
-        
-        # Factors: total quantity, distribution, and order count
-        total_qty = sum(level.quantity for level in bid_levels + ask_levels)
-        total_orders = sum(level.orders for level in bid_levels + ask_levels)
-        
-        # Normalize based on typical market values
-        qty_score = min(total_qty / 10000, 1.0) * 50  # Max 50 points for quantity
-        order_score = min(total_orders / 1000, 1.0) * 30  # Max 30 points for order count
-        
-        # Distribution score - prefer even distribution
-        quantities = [level.quantity for level in bid_levels + ask_levels]
-        if quantities:
-            std_dev = (sum((q - sum(quantities)/len(quantities))**2 for q in quantities) / len(quantities))**0.5
-            avg_qty = sum(quantities) / len(quantities)
-            distribution_score = max(0, 20 - (std_dev / avg_qty * 10)) if avg_qty > 0 else 0
-        else:
-            distribution_score = 0
-        
-        return min(qty_score + order_score + distribution_score, 100)
-    
-    def _calculate_market_efficiency(self, bid_levels: List[MarketDepthLevel], ask_levels: List[MarketDepthLevel]) -> float:
-        """Calculate market efficiency score."""
-        if not bid_levels or not ask_levels:
-            return 50.0
-        
-        # Check for price gaps and irregularities
-        bid_prices = [level.price for level in bid_levels]
-        ask_prices = [level.price for level in ask_levels]
-        
-        # Calculate price consistency
-        bid_gaps = [abs(bid_prices[i] - bid_prices[i+1]) for i in range(len(bid_prices)-1)]
-        ask_gaps = [abs(ask_prices[i+1] - ask_prices[i]) for i in range(len(ask_prices)-1)]
-        
-        if bid_gaps and ask_gaps:
-            avg_bid_gap = sum(bid_gaps) / len(bid_gaps)
-            avg_ask_gap = sum(ask_gaps) / len(ask_gaps)
-            
-            # More consistent gaps indicate higher efficiency
-            bid_consistency = 1.0 - (max(bid_gaps) - min(bid_gaps)) / avg_bid_gap if avg_bid_gap > 0 else 1.0
-            ask_consistency = 1.0 - (max(ask_gaps) - min(ask_gaps)) / avg_ask_gap if avg_ask_gap > 0 else 1.0
-            
-            efficiency = (bid_consistency + ask_consistency) / 2 * 100
-        else:
-            efficiency = 50.0
+    def _compute_all_metrics(self, soa: Dict[str, Any]) -> _DepthMetrics:
+        """Calculate order flow imbalance, price impact, liquidity score and market efficiency.
         
-        return max(0, min(efficiency, 100))
+        All four scores are derived from the same book arrays, so they are
+        computed together in one kernel call.
+        """
+        scores = depth_scores(soa["price"], soa["quantity"], soa["orders"], soa["n_bid"])
+        return _DepthMetrics(*(float(score) for score in scores))
     
     def _estimate_volatility(self, depth_data: MarketDepth20Response) -> float:
         """Estimate short-term volatility from depth data."""
-        if len(self.depth_history) < 2:
+        # Mid prices of the last 10 snapshots with both book sides
+        rows = self._history_rows()
+        n_bid = self._bid_counts[rows]
+        two_sided = (n_bid > 0) & (n_bid < self._level_counts[rows])
+        rows = rows[two_sided][-10:]
+        n_bid = n_bid[two_sided][-10:]
+        
+        if rows.size < 2:
             return 0.5  # Default moderate volatility
         
         # Calculate price changes from recent history
-        recent_snapshots = list(self.depth_history)[-10:]  # Last 10 snapshots
-        price_changes = []
-        
-        for i in range(1, len(recent_snapshots)):
-            prev_mid = (recent_snapshots[i-1].bid_depth.levels[0].price + 
-                       recent_snapshots[i-1].ask_depth.levels[0].price) / 2
-            curr_mid = (recent_snapshots[i].bid_depth.levels[0].price + 
-                       recent_snapshots[i].ask_depth.levels[0].price) / 2
-            
-            if prev_mid > 0:
-                change = abs(curr_mid - prev_mid) / prev_mid
-                price_changes.append(change)
+        mids = (self._price_ring[rows, 0] + self._price_ring[rows, n_bid]) / 2
+        prev_mids = mids[:-1]
+        valid = prev_mids > 0
+        price_changes = np.abs(np.diff(mids))[valid] / prev_mids[valid]
         
-        if price_changes:
-            volatility = sum(price_changes) / len(price_changes)
+        if price_changes.size:
+            volatility = float(price_changes.mean())
             return min(volatility * 100, 1.0)  # Normalize to 0-1
         
         return 0.5
@@ -395,56 +382,33 @@ class MarketDepthAnalyzer:
         
         return None
     
-    def _calculate_market_impact_curve(self, bid_levels: List[MarketDepthLevel], ask_levels: List[MarketDepthLevel]) -> List[Tuple[int, float]]:
+    def _calculate_market_impact_curve(self, soa: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
         """Calculate market impact curve."""
-        curve = []
-        cumulative_qty = 0
-        
-        # Combine and sort all levels by price
-        all_levels = [(level.price, level.quantity, 'bid') for level in bid_levels] + \
-                    [(level.price, level.quantity, 'ask') for level in ask_levels]
-        all_levels.sort(key=lambda x: x[0])
-        
-        if not all_levels:
-            return curve
-        
-        base_price = all_levels[len(all_levels)//2][0]  # Mid price
-        
-        for price, quantity, side in all_levels:
-            cumulative_qty += quantity
-            impact = abs(price - base_price) / base_price if base_price > 0 else 0
-            curve.append((cumulative_qty, impact))
-        
-        return curve
+        return impact_curve(soa["price"], soa["quantity"])
     
-    def _calculate_optimal_order_size(self, impact_curve: List[Tuple[int, float]]) -> int:
+    def _calculate_optimal_order_size(self, cum_qty: np.ndarray, impact: np.ndarray) -> int:
         """Calculate optimal order size to minimize market impact."""
-        if not impact_curve:
+        if cum_qty.size == 0:
             return 0
         
         # Find the point where impact starts increasing significantly
-        for i in range(1, len(impact_curve)):
-            prev_qty, prev_impact = impact_curve[i-1]
-            curr_qty, curr_impact = impact_curve[i]
-            
-            if curr_impact > prev_impact * 1.5:  # 50% increase in impact
-                return prev_qty
+        jumps = impact[1:] > impact[:-1] * 1.5  # 50% increase in impact
+        if jumps.any():
+            return int(cum_qty[int(jumps.argmax())])
         
         # If no significant increase found, return 25% of total liquidity
-        total_qty = impact_curve[-1][0] if impact_curve else 0
-        return int(total_qty * 0.25)
+        return int(cum_qty[-1] * 0.25)
     
-    def _calculate_fragmentation_score(self, bid_levels: List[MarketDepthLevel], ask_levels: List[MarketDepthLevel]) -> float:
+    def _calculate_fragmentation_score(self, soa: Dict[str, Any]) -> float:
         """Calculate liquidity fragmentation score."""
-        all_quantities = [level.quantity for level in bid_levels + ask_levels]
+        quantities = soa["quantity"]
         
-        if not all_quantities:
+        if quantities.size == 0:
             return 0.0
         
         # Calculate coefficient of variation
-        mean_qty = sum(all_quantities) / len(all_quantities)
-        variance = sum((q - mean_qty)**2 for q in all_quantities) / len(all_quantities)
-        std_dev = variance**0.5
+        mean_qty = float(quantities.mean())
+        std_dev = float(quantities.std())
         
         if mean_qty > 0:
             cv = std_dev / mean_qty
@@ -5,20 +5,44 @@ This service provides comprehensive analysis of Open Interest changes
 across a specified strike price range with detailed calculations and metrics.
 """
 
+import functools
+import hashlib
 import logging
-from datetime import datetime, timedelta
+import os
+import pickle
+import time
+from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from ..market_data.manager import MarketDataManager
+from ._range_oi_kernels import DOMINANT_SIDE_LABELS, reduce_range
 
 logger = logging.getLogger(__name__)
 
+# Per-leg values for a strike with no CE or PE option: (oi, volume, oi change, oi change %)
+_EMPTY_LEG = (0, 0, 0, 0.0)
+
+# Below this many strikes the compiled kernel's dispatch overhead outweighs
+# the loop, so the plain Python version of reduce_range is used instead
+_KERNEL_MIN_STRIKES = 20
+_reduce_range_py = getattr(reduce_range, "py_func", reduce_range)
+
 
 @dataclass
 class StrikeOIData:
     """Individual strike OI data."""
+    __slots__ = (
+        "strike", "call_oi", "put_oi", "call_oi_change", "put_oi_change",
+        "call_oi_change_pct", "put_oi_change_pct", "call_volume", "put_volume",
+        "timestamp",
+    )
+
     strike: float
     call_oi: int
     put_oi: int
@@ -34,6 +58,13 @@ class StrikeOIData:
 @dataclass
 class RangeOIMetrics:
     """Calculated metrics for the range."""
+    __slots__ = (
+        "total_call_oi", "total_put_oi", "total_call_oi_change", "total_put_oi_change",
+        "average_call_oi", "average_put_oi", "average_call_oi_change",
+        "average_put_oi_change", "strike_count", "call_put_ratio", "net_oi_change",
+        "dominant_side",
+    )
+
     total_call_oi: int
     total_put_oi: int
     total_call_oi_change: int
@@ -63,15 +94,52 @@ class RangeOIAnalysis:
     
     # Time series data for charts
     historical_data: Optional[List[Dict[str, Any]]] = None
+    
+    # The strikes_data fields as parallel NumPy arrays, in the same order
+    strike_arrays: Optional[Dict[str, np.ndarray]] = None
 
 
 class RangeOIAnalyzer:
     """Service for analyzing OI changes across a strike price range."""
     
-    def __init__(self, market_data_manager: MarketDataManager):
-        """Initialize the range OI analyzer."""
+    def __init__(
+        self,
+        market_data_manager: MarketDataManager,
+        cache_dir: Optional[str] = None,
+        cache_max_entries: int = 500,
+        cache_min_compute_ms: float = 50.0
+    ):
+        """
+        Initialize the range OI analyzer.
+        
+        Args:
+            market_data_manager: Source of option chain data
+            cache_dir: Directory for the on-disk analysis cache, disabled if None
+            cache_max_entries: Number of cached analyses kept on disk
+            cache_min_compute_ms: Only analyses slower than this are cached
+        """
         self.market_data_manager = market_data_manager
         
+        # Short-lived option chain cache shared by concurrent callers
+        # (scrip, segment, expiry) -> (monotonic time, option chain)
+        self._chain_cache: Dict[Tuple[int, str, Optional[str]], Tuple[float, Any]] = {}
+        self._chain_locks: Dict[Tuple[int, str, Optional[str]], asyncio.Lock] = {}
+        self._chain_cache_ttl = 2.0  # seconds
+        
+        # Bounded pool for the blocking option chain fetches, so they don't
+        # queue behind unrelated work in the loop's default executor
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="range-oi")
+        
+        # Completed analyses persisted per minute, so chart reloads within
+        # the same minute skip the fetch and computation
+        self._disk_cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._disk_cache_max_entries = cache_max_entries
+        self._disk_cache_min_compute_ms = cache_min_compute_ms
+        
+    def close(self) -> None:
+        """Shut down the option chain fetch pool."""
+        self._executor.shutdown(wait=False)
+        
     async def analyze_range_oi(
         self,
         expiry: str,
@@ -98,21 +166,33 @@ class RangeOIAnalyzer:
         try:
             logger.info(f"Starting range OI analysis: {range_start}-{range_end}, expiry: {expiry}")
             
+            cache_path = None
+            if self._disk_cache_dir is not None:
+                cache_path = self._disk_cache_path(
+                    underlying_scrip, underlying_segment, expiry,
+                    range_start, range_end, interval, int(time.time() // 60)
+                )
+                cached = self._load_cached_analysis(cache_path)
+                if cached is not None:
+                    logger.info(f"Range OI analysis served from disk cache: {cached.total_strikes_analyzed} strikes")
+                    return cached
+            started = time.perf_counter()
+            
             # Get option chain data
-            option_chain = self.market_data_manager.get_option_chain_with_oi_changes(
-                underlying_scrip, underlying_segment, expiry, use_cache=False
-            )
+            option_chain = await self._get_option_chain(underlying_scrip, underlying_segment, expiry)
             
             # Extract strikes in the specified range
             strikes_in_range = self._get_strikes_in_range(
-                option_chain.strikes, range_start, range_end
+                option_chain, range_start, range_end
             )
             
-            # Process strike data
-            strikes_data = self._process_strikes_data(strikes_in_range)
+            # Process strike data, stamped with a single analysis time
+            analysis_time = datetime.now()
+            strike_arrays = self._extract_strike_arrays(strikes_in_range)
+            strikes_data = self._process_strikes_data(strike_arrays, analysis_time)
             
             # Calculate metrics
-            metrics = self._calculate_range_metrics(strikes_data)
+            metrics = self._calculate_range_metrics(strike_arrays)
             
             # Create analysis result
             analysis = RangeOIAnalysis(
@@ -122,11 +202,16 @@ class RangeOIAnalyzer:
                 interval=interval,
                 strikes_data=strikes_data,
                 metrics=metrics,
-                analysis_time=datetime.now(),
+                analysis_time=analysis_time,
                 underlying_price=option_chain.underlying_price,
-                total_strikes_analyzed=len(strikes_data)
+                total_strikes_analyzed=len(strikes_data),
+                strike_arrays=strike_arrays
             )
             
+            compute_ms = (time.perf_counter() - started) * 1000
+            if cache_path is not None and compute_ms >= self._disk_cache_min_compute_ms:
+                self._store_cached_analysis(cache_path, analysis)
+            
             logger.info(f"Range OI analysis completed: {len(strikes_data)} strikes analyzed")
             return analysis
             
@@ -134,88 +219,194 @@ class RangeOIAnalyzer:
             logger.error(f"Error in range OI analysis: {e}")
             raise
     
+    async def analyze_ranges(self, specs: List[Dict[str, Any]]) -> List[RangeOIAnalysis]:
+        """
+        Analyze several strike ranges concurrently, e.g. weekly and monthly expiries.
+        
+        Ranges on the same expiry share one option chain fetch.
+        
+        Args:
+            specs: Keyword arguments for analyze_range_oi, one dict per range
+            
+        Returns:
+            RangeOIAnalysis per spec, in the same order
+        """
+        return list(await asyncio.gather(*(self.analyze_range_oi(**spec) for spec in specs)))
+    
+    async def _get_option_chain(
+        self,
+        underlying_scrip: int,
+        underlying_segment: str,
+        expiry: Optional[str]
+    ) -> Any:
+        """
+        Get the option chain with OI changes, cached briefly per expiry.
+
+        Concurrent callers for the same chain share a single fetch.
+        """
+        key = (underlying_scrip, underlying_segment, expiry)
+        cached = self._get_cached_chain(key)
+        if cached is not None:
+            return cached
+        
+        lock = self._chain_locks.get(key)
+        if lock is None:
+            lock = self._chain_locks[key] = asyncio.Lock()
+        
+        async with lock:
+            # Another caller may have fetched the chain while we waited
+            cached = self._get_cached_chain(key)
+            if cached is not None:
+                return cached
+            
+            # The manager call is blocking, run it off the event loop so
+            # fetches for different expiries overlap
+            loop = asyncio.get_running_loop()
+            option_chain = await loop.run_in_executor(
+                self._executor,
+                functools.partial(
+                    self.market_data_manager.get_option_chain_with_oi_changes,
+                    underlying_scrip, underlying_segment, expiry, use_cache=False
+                )
+            )
+            self._chain_cache[key] = (time.monotonic(), option_chain)
+            return option_chain
+    
+    def _disk_cache_path(self, *key: Any) -> Path:
+        """Get the disk cache file for an analysis key."""
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return self._disk_cache_dir / f"{digest}.pkl"
+    
+    def _load_cached_analysis(self, path: Path) -> Optional[RangeOIAnalysis]:
+        """Load a cached analysis from disk, or None on a miss."""
+        try:
+            with open(path, "rb") as f:
+                analysis = pickle.load(f)
+            os.utime(path)  # Mark as recently used for eviction
+            return analysis
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable range OI cache entry {path.name}: {e}")
+            return None
+    
+    def _store_cached_analysis(self, path: Path, analysis: RangeOIAnalysis) -> None:
+        """Write an analysis to the disk cache and evict the least recently used entries."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(analysis, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            
+            entries = list(path.parent.glob("*.pkl"))
+            if len(entries) > self._disk_cache_max_entries:
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in entries[:len(entries) - self._disk_cache_max_entries]:
+                    entry.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Failed to write range OI cache entry: {e}")
+    
+    def _get_cached_chain(self, key: Tuple[int, str, Optional[str]]) -> Any:
+        """Return the cached option chain if it is still fresh."""
+        entry = self._chain_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._chain_cache_ttl:
+            return entry[1]
+        return None
+    
     def _get_strikes_in_range(
         self,
-        all_strikes: Dict[str, Any],
+        option_chain: Any,
         range_start: float,
         range_end: float
     ) -> Dict[str, Any]:
         """Filter strikes within the specified range."""
-        strikes_in_range = {}
+        all_strikes = option_chain.strikes
+        strike_prices, strike_keys = option_chain.sorted_strikes()
+        if len(strike_keys) < len(all_strikes):
+            logger.warning(f"Skipped {len(all_strikes) - len(strike_keys)} strikes with invalid price format")
         
-        for strike_key, strike_data in all_strikes.items():
-            try:
-                strike_price = float(strike_key)
-                if range_start <= strike_price <= range_end:
-                    strikes_in_range[strike_key] = strike_data
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid strike price format: {strike_key}")
-                continue
+        # Binary search the sorted prices for the inclusive range
+        lo = int(np.searchsorted(strike_prices, range_start, side="left"))
+        hi = int(np.searchsorted(strike_prices, range_end, side="right"))
+        strikes_in_range = {key: all_strikes[key] for key in strike_keys[lo:hi]}
         
         logger.info(f"Found {len(strikes_in_range)} strikes in range {range_start}-{range_end}")
         return strikes_in_range
     
-    def _process_strikes_data(self, strikes: Dict[str, Any]) -> List[StrikeOIData]:
-        """Process strike data into structured format."""
-        strikes_data = []
-        
-        for strike_key, strike_data in strikes.items():
-            try:
-                strike_price = float(strike_key)
-                
-                # Extract Call data
-                call_oi = 0
-                call_volume = 0
-                call_oi_change = 0
-                call_oi_change_pct = 0.0
-
-                if hasattr(strike_data, 'ce') and strike_data.ce:
-                    call_oi = getattr(strike_data.ce, 'oi', 0)
-                    call_volume = getattr(strike_data.ce, 'volume', 0)
-                    if hasattr(strike_data.ce, 'oi_change') and strike_data.ce.oi_change:
-                        call_oi_change = getattr(strike_data.ce.oi_change, 'absolute_change', 0)
-                        call_oi_change_pct = getattr(strike_data.ce.oi_change, 'percentage_change', 0.0)
+    def _extract_strike_arrays(self, strikes: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Extract strike OI data into parallel NumPy arrays sorted by strike price.
 
-                # Extract Put data
-                put_oi = 0
-                put_volume = 0
-                put_oi_change = 0
-                put_oi_change_pct = 0.0
+        Args:
+            strikes: Option chain strikes keyed by strike price
 
-                if hasattr(strike_data, 'pe') and strike_data.pe:
-                    put_oi = getattr(strike_data.pe, 'oi', 0)
-                    put_volume = getattr(strike_data.pe, 'volume', 0)
-                    if hasattr(strike_data.pe, 'oi_change') and strike_data.pe.oi_change:
-                        put_oi_change = getattr(strike_data.pe.oi_change, 'absolute_change', 0)
-                        put_oi_change_pct = getattr(strike_data.pe.oi_change, 'percentage_change', 0.0)
-                
-                # Create strike OI data
-                strike_oi_data = StrikeOIData(
-                    strike=strike_price,
-                    call_oi=call_oi,
-                    put_oi=put_oi,
-                    call_oi_change=call_oi_change,
-                    put_oi_change=put_oi_change,
-                    call_oi_change_pct=call_oi_change_pct,
-                    put_oi_change_pct=put_oi_change_pct,
-                    call_volume=call_volume,
-                    put_volume=put_volume,
-                    timestamp=datetime.now()
-                )
-                
-                strikes_data.append(strike_oi_data)
-                
-            except Exception as e:
-                logger.error(f"Error processing strike {strike_key}: {e}")
-                continue
+        Returns:
+            Dictionary of arrays named like the StrikeOIData fields
+        """
+        n = len(strikes)
+        strike = np.fromiter(map(float, strikes), dtype=np.float64, count=n)
+        
+        # One (oi, volume, oi change, oi change %) row per leg, then split into columns
+        calls = np.array([self._leg_values(strike_data.ce) for strike_data in strikes.values()], dtype=np.float64).reshape(n, 4)
+        puts = np.array([self._leg_values(strike_data.pe) for strike_data in strikes.values()], dtype=np.float64).reshape(n, 4)
         
-        # Sort by strike price
-        strikes_data.sort(key=lambda x: x.strike)
-        return strikes_data
+        # Stable sort, so duplicate strikes keep chain order
+        order = np.argsort(strike, kind="stable")
+        calls = calls[order]
+        puts = puts[order]
+        
+        return {
+            "strike": strike[order],
+            "call_oi": calls[:, 0].astype(np.int64),
+            "put_oi": puts[:, 0].astype(np.int64),
+            "call_oi_change": calls[:, 2].astype(np.int64),
+            "put_oi_change": puts[:, 2].astype(np.int64),
+            "call_oi_change_pct": calls[:, 3],
+            "put_oi_change_pct": puts[:, 3],
+            "call_volume": calls[:, 1].astype(np.int64),
+            "put_volume": puts[:, 1].astype(np.int64),
+        }
+    
+    @staticmethod
+    def _leg_values(option) -> Tuple[int, int, int, float]:
+        """Get (oi, volume, oi change, oi change %) for one CE or PE option."""
+        if not option:
+            return _EMPTY_LEG
+        oi_change = option.oi_change
+        if oi_change:
+            return option.oi, option.volume, oi_change.absolute_change, oi_change.percentage_change
+        return option.oi, option.volume, 0, 0.0
     
-    def _calculate_range_metrics(self, strikes_data: List[StrikeOIData]) -> RangeOIMetrics:
+    def _process_strikes_data(
+        self,
+        strike_arrays: Dict[str, np.ndarray],
+        timestamp: datetime
+    ) -> List[StrikeOIData]:
+        """Process strike arrays into structured format, all stamped with timestamp."""
+        return [
+            StrikeOIData(
+                strike=strike_price,
+                call_oi=call_oi,
+                put_oi=put_oi,
+                call_oi_change=call_oi_change,
+                put_oi_change=put_oi_change,
+                call_oi_change_pct=call_oi_change_pct,
+                put_oi_change_pct=put_oi_change_pct,
+                call_volume=call_volume,
+                put_volume=put_volume,
+                timestamp=timestamp
+            )
+            for (
+                strike_price, call_oi, put_oi, call_oi_change, put_oi_change,
+                call_oi_change_pct, put_oi_change_pct, call_volume, put_volume
+            ) in zip(*(column.tolist() for column in strike_arrays.values()))
+        ]
+    
+    def _calculate_range_metrics(self, strike_arrays: Dict[str, np.ndarray]) -> RangeOIMetrics:
         """Calculate comprehensive metrics for the range."""
-        if not strikes_data:
+        strike_count = strike_arrays["strike"].size
+        if strike_count == 0:
             return RangeOIMetrics(
                 total_call_oi=0, total_put_oi=0, total_call_oi_change=0, total_put_oi_change=0,
                 average_call_oi=0.0, average_put_oi=0.0, average_call_oi_change=0.0, 
@@ -223,32 +414,26 @@ class RangeOIAnalyzer:
                 net_oi_change=0, dominant_side="NEUTRAL"
             )
         
-        # Calculate totals
-        total_call_oi = sum(strike.call_oi for strike in strikes_data)
-        total_put_oi = sum(strike.put_oi for strike in strikes_data)
-        total_call_oi_change = sum(strike.call_oi_change for strike in strikes_data)
-        total_put_oi_change = sum(strike.put_oi_change for strike in strikes_data)
-        
-        strike_count = len(strikes_data)
+        # Calculate totals and dominance (based on OI changes) in one pass
+        reduce = reduce_range if strike_count >= _KERNEL_MIN_STRIKES else _reduce_range_py
+        (
+            total_call_oi, total_put_oi, total_call_oi_change, total_put_oi_change, dominant_code
+        ) = map(int, reduce(
+            strike_arrays["call_oi"], strike_arrays["put_oi"],
+            strike_arrays["call_oi_change"], strike_arrays["put_oi_change"]
+        ))
+        dominant_side = DOMINANT_SIDE_LABELS[dominant_code]
         
         # Calculate averages
-        average_call_oi = total_call_oi / strike_count if strike_count > 0 else 0.0
-        average_put_oi = total_put_oi / strike_count if strike_count > 0 else 0.0
-        average_call_oi_change = total_call_oi_change / strike_count if strike_count > 0 else 0.0
-        average_put_oi_change = total_put_oi_change / strike_count if strike_count > 0 else 0.0
+        average_call_oi = total_call_oi / strike_count
+        average_put_oi = total_put_oi / strike_count
+        average_call_oi_change = total_call_oi_change / strike_count
+        average_put_oi_change = total_put_oi_change / strike_count
         
-        # Calculate ratios and dominance
+        # Calculate ratios
         call_put_ratio = total_call_oi / total_put_oi if total_put_oi > 0 else float('inf')
         net_oi_change = total_call_oi_change - total_put_oi_change
         
-        # Determine dominant side based on OI changes
-        if abs(total_call_oi_change) > abs(total_put_oi_change) * 1.1:  # 10% threshold
-            dominant_side = "CALL" if total_call_oi_change > 0 else "CALL_NEGATIVE"
-        elif abs(total_put_oi_change) > abs(total_call_oi_change) * 1.1:
-            dominant_side = "PUT" if total_put_oi_change > 0 else "PUT_NEGATIVE"
-        else:
-            dominant_side = "NEUTRAL"
-        
         return RangeOIMetrics(
             total_call_oi=total_call_oi,
             total_put_oi=total_put_oi,
@@ -279,19 +464,24 @@ class RangeOIAnalyzer:
         """
         # For now, return mock historical data
         # In production, this would query a time-series database
-        historical_data = []
+        offsets = np.arange(lookback_minutes, 0, -5, dtype=np.int64)  # Every 5 minutes
+        timestamps = np.datetime64(datetime.now(), "us") - offsets.astype("timedelta64[m]")
         
-        current_time = datetime.now()
-        for i in range(lookback_minutes, 0, -5):  # Every 5 minutes
-            timestamp = current_time - timedelta(minutes=i)
-            
-            # Mock data - in production, fetch real historical data
-            historical_data.append({
+        # Mock data - in production, fetch real historical data
+        historical_data = [
+            {
                 "timestamp": timestamp.isoformat(),
-                "total_call_oi_change": 1000000 + (i * 50000),  # Mock increasing trend
-                "total_put_oi_change": 800000 + (i * 30000),
-                "net_oi_change": 200000 + (i * 20000)
-            })
+                "total_call_oi_change": call_oi_change,  # Mock increasing trend
+                "total_put_oi_change": put_oi_change,
+                "net_oi_change": net_oi_change
+            }
+            for timestamp, call_oi_change, put_oi_change, net_oi_change in zip(
+                timestamps.tolist(),
+                (1000000 + offsets * 50000).tolist(),
+                (800000 + offsets * 30000).tolist(),
+                (200000 + offsets * 20000).tolist()
+            )
+        ]
         
         return historical_data
     
@@ -1,10 +1,12 @@
 """Dhan API integration module."""
 
 from .client import DhanAPIClient
+from .client_async import AsyncDhanAPIClient
 from .websocket import DhanWebSocketClient
 from .models import *
 
 __all__ = [
     "DhanAPIClient",
+    "AsyncDhanAPIClient",
     "DhanWebSocketClient",
 ]
\ No newline at end of file
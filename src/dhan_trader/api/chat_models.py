@@ -1,16 +1,12 @@
 """Pydantic models for chat API endpoints."""
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
-from enum import Enum
 
 
-class ChatMessageType(str, Enum):
-    """Types of chat messages."""
-    USER = "user"
-    ASSISTANT = "assistant"
-    SYSTEM = "system"
+# Types of chat messages, validated as plain strings
+ChatMessageType = Literal["user", "assistant", "system"]
 
 
 class ChatMessage(BaseModel):
@@ -119,11 +115,6 @@ class RangeOIResponse(BaseModel):
     reasoning: str
     timestamp: datetime
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class OIRecommendationRequest(BaseModel):
     """Request model for OI-based trading recommendations."""
@@ -146,11 +137,6 @@ class OIRecommendationResponse(BaseModel):
     ai_enhancement: Optional[str] = Field(None, description="AI-enhanced strategy suggestions")
     timestamp: datetime = Field(default_factory=datetime.now, description="Analysis timestamp")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class QuickOISignalResponse(BaseModel):
     """Response model for quick OI signal."""
@@ -189,11 +175,6 @@ class DynamicOIAnalysisModel(BaseModel):
     key_levels: List[float] = Field(..., description="Key support/resistance levels")
     statistical_summary: Dict[str, Any] = Field(..., description="Statistical summary of OI data")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class EnhancedChatRequest(BaseModel):
     """Request model for enhanced chat with dynamic OI analysis."""
@@ -212,3 +193,9 @@ class EnhancedChatResponse(BaseModel):
     oi_analysis: Optional[DynamicOIAnalysisModel] = Field(None, description="Dynamic OI analysis if performed")
     confidence_score: Optional[float] = Field(None, description="Overall confidence score")
     market_data_used: bool = Field(False, description="Whether real-time market data was used")
+
+
+# Validators/serializers built once at import for the hot response paths
+ENHANCED_CHAT_RESPONSE_ADAPTER = TypeAdapter(EnhancedChatResponse)
+DYNAMIC_OI_ANALYSIS_ADAPTER = TypeAdapter(DynamicOIAnalysisModel)
+RANGE_OI_RESPONSE_ADAPTER = TypeAdapter(RangeOIResponse)
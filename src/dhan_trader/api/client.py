@@ -3,12 +3,21 @@
 import time
 import json
 import logging
-from typing import Dict, List, Optional, Any, Union
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, date
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
+
 from ..config import config
 from ..exceptions import (
     APIError,
@@ -18,6 +27,7 @@ from ..exceptions import (
 )
 from .models import (
     UserProfile,
+    AccountSnapshot,
     OptionChain,
     OptionChainStrike,
     OptionData,
@@ -37,49 +47,157 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Profiles shared by every client in the process
+# access token -> (monotonic time, profile)
+_PROFILE_CACHE: Dict[str, Tuple[float, UserProfile]] = {}
+_PROFILE_CACHE_TTL = 300.0  # seconds, profile data changes at most daily
+
+_EXPIRY_LIST_CACHE_TTL = 3600.0  # seconds, expiries change at most daily
+_HOLDINGS_CACHE_TTL = 60.0  # seconds, also invalidated when an order is placed
+
+# Value -> member lookups for the enums parsed from every order and position row
+_EXCHANGE_SEGMENTS = {member.value: member for member in ExchangeSegment}
+_ORDER_TYPES = {member.value: member for member in OrderType}
+_ORDER_STATUSES = {member.value: member for member in OrderStatus}
+_TRANSACTION_TYPES = {member.value: member for member in TransactionType}
+_PRODUCT_TYPES = {member.value: member for member in ProductType}
+
+
+def _to_enum(lookup: Dict[Any, Any], enum_cls: Any, value: Any) -> Any:
+    """Get the enum member for value, falling back to the enum itself for errors."""
+    member = lookup.get(value)
+    return member if member is not None else enum_cls(value)
+
+
+# Exchange segments accepted by the market quote endpoint
+_QUOTE_SEGMENTS = ("NSE_EQ", "NSE_FNO", "BSE_EQ", "BSE_FNO", "MCX_COMM", "NSE_CURR", "BSE_CURR")
+
+# Greeks values of an option chain entry, in Greeks field order
+_GREEK_FIELDS = itemgetter("delta", "gamma", "theta", "vega")
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson on the raw bytes when it is installed."""
+    if orjson is None:
+        return response.json()
+    return _loads(response.content)
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a raw JSON body, using orjson when it is installed."""
+    try:
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    except ValueError as e:
+        raise APIError(f"Request failed: Invalid JSON response: {e}")
+
+
+# Status codes worth retrying, and the methods retried on each endpoint
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_IDEMPOTENT_RETRY_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+_RETRY_METHODS = _IDEMPOTENT_RETRY_METHODS | {"POST"}
+# Up to this many seconds of random extra backoff, so clients that failed
+# together do not all retry at the same moment
+_RETRY_BACKOFF_JITTER = 0.3
+
+
+def _build_retry(allowed_methods: frozenset) -> Retry:
+    """Build the retry policy, honouring Retry-After and adding backoff jitter."""
+    options = dict(
+        total=config.api.max_retries,
+        backoff_factor=config.api.retry_delay,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=allowed_methods,
+        respect_retry_after_header=True,
+    )
+    try:
+        return Retry(backoff_jitter=_RETRY_BACKOFF_JITTER, **options)
+    except TypeError:  # pragma: no cover - urllib3 < 2.0 has no backoff_jitter
+        return Retry(**options)
+
+
+# Rolling rate limit windows: (limit name, window length in seconds)
+_RATE_LIMIT_WINDOWS = (
+    ('per_second', 1),
+    ('per_minute', 60),
+    ('per_hour', 3600),
+    ('per_day', 86400),
+)
+
 
 class RateLimiter:
     """Rate limiter for API requests."""
     
     def __init__(self):
-        self.requests = {}
         self.limits = {
             'order': {'per_second': 25, 'per_minute': 250, 'per_hour': 1000, 'per_day': 7000},
             'data': {'per_second': 5, 'per_minute': None, 'per_hour': None, 'per_day': 100000},
             'quote': {'per_second': 1, 'per_minute': None, 'per_hour': None, 'per_day': None},
             'non_trading': {'per_second': 20, 'per_minute': None, 'per_hour': None, 'per_day': None},
         }
+        # endpoint_type -> [(window seconds, limit, request times in window)],
+        # one entry per enabled limit
+        self.windows: Dict[str, List[Tuple[int, int, Deque[float]]]] = {}
+        # The client is called from worker threads; one lock per endpoint
+        # type, so unrelated endpoints never wait on each other
+        self._locks: Dict[str, threading.Lock] = {}
+    
+    def _get_windows(self, endpoint_type: str) -> Tuple[threading.Lock, List[Tuple[int, int, Deque[float]]]]:
+        """Get the lock and rolling windows for an endpoint type, creating them on first use."""
+        windows = self.windows.get(endpoint_type)
+        if windows is None:
+            limits = self.limits.get(endpoint_type, self.limits['non_trading'])
+            # setdefault is atomic, so racing threads end up sharing one entry
+            self._locks.setdefault(endpoint_type, threading.Lock())
+            windows = self.windows.setdefault(endpoint_type, [
+                (seconds, limits[name], deque())
+                for name, seconds in _RATE_LIMIT_WINDOWS
+                if limits[name] is not None
+            ])
+        return self._locks[endpoint_type], windows
+    
+    @staticmethod
+    def _has_capacity(windows: List[Tuple[int, int, Deque[float]]], now: float) -> bool:
+        """Drop expired requests and check every window is under its limit."""
+        for seconds, limit, request_times in windows:
+            while request_times and now - request_times[0] >= seconds:
+                request_times.popleft()
+            if len(request_times) >= limit:
+                return False
+        return True
     
     def can_make_request(self, endpoint_type: str) -> bool:
         """Check if request can be made based on rate limits."""
-        now = time.time()
-        
-        if endpoint_type not in self.requests:
-            self.requests[endpoint_type] = []
-        
-        # Clean old requests
-        self.requests[endpoint_type] = [
-            req_time for req_time in self.requests[endpoint_type]
-            if now - req_time < 86400  # Keep last 24 hours
-        ]
-        
-        limits = self.limits.get(endpoint_type, self.limits['non_trading'])
-        
-        # Check per second limit
-        recent_requests = [
-            req_time for req_time in self.requests[endpoint_type]
-            if now - req_time < 1
-        ]
-        if len(recent_requests) >= limits['per_second']:
-            return False
-        
-        return True
+        lock, windows = self._get_windows(endpoint_type)
+        with lock:
+            return self._has_capacity(windows, time.monotonic())
     
     def record_request(self, endpoint_type: str):
         """Record a request for rate limiting."""
-        if endpoint_type not in self.requests:
-            self.requests[endpoint_type] = []
-        self.requests[endpoint_type].append(time.time())
+        lock, windows = self._get_windows(endpoint_type)
+        with lock:
+            now = time.monotonic()
+            for _, _, request_times in windows:
+                request_times.append(now)
+    
+    def acquire(self, endpoint_type: str) -> bool:
+        """Check the rate limits and record the request in one step.
+        
+        Unlike can_make_request followed by record_request, concurrent
+        callers cannot both pass the check for the last free slot.
+        
+        Returns:
+            True if the request may be made, False if a limit is reached
+        """
+        lock, windows = self._get_windows(endpoint_type)
+        with lock:
+            now = time.monotonic()
+            if not self._has_capacity(windows, now):
+                return False
+            for _, _, request_times in windows:
+                request_times.append(now)
+            return True
 
 
 class DhanAPIClient:
@@ -100,27 +218,46 @@ class DhanAPIClient:
         if not self.access_token:
             raise AuthenticationError("Access token is required")
         
-        # Setup session with retry strategy
+        # Setup session with retry strategy. Option chain and quote requests
+        # are POSTs but only read data, so they are retried too.
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=config.api.max_retries,
-            backoff_factor=config.api.retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
+        # All requests go to one host, so keep a single pool with room for
+        # concurrent callers; connections are reused instead of re-handshaking
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=_build_retry(_RETRY_METHODS),
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        # Never resend an order: a failed reply does not mean it was not placed
+        order_adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=_build_retry(_IDEMPOTENT_RETRY_METHODS),
+        )
+        self.session.mount(f"{self.base_url}/v2/orders", order_adapter)
         
         # Rate limiter
         self.rate_limiter = RateLimiter()
         
+        # Short-lived response caches, (monotonic time, value)
+        self._expiry_list_cache: Dict[Tuple[int, str], Tuple[float, List[str]]] = {}
+        self._holdings_cache: Optional[Tuple[float, List[Holding]]] = None
+        
+        # Request headers are fixed per client, so build them once
+        self._headers = self._get_headers()
+        
         # Get client ID from profile if not provided
         if not self.client_id:
             profile = self.get_user_profile()
             self.client_id = profile.dhan_client_id
+            self._headers = self._get_headers()
     
     def _get_headers(self) -> Dict[str, str]:
-        """Get request headers."""
+        """Build request headers."""
         headers = {
             "access-token": self.access_token,
             "Content-Type": "application/json",
@@ -152,11 +289,11 @@ class DhanAPIClient:
             APIError: If API request fails
         """
         # Check rate limits
-        if not self.rate_limiter.can_make_request(endpoint_type):
+        if not self.rate_limiter.acquire(endpoint_type):
             raise RateLimitError(f"Rate limit exceeded for {endpoint_type} endpoints")
         
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
+        headers = self._headers
         
         try:
             logger.debug(f"Making {method} request to {url}")
@@ -168,9 +305,6 @@ class DhanAPIClient:
                     method, url, headers=headers, json=data, timeout=self.timeout
                 )
             
-            # Record request for rate limiting
-            self.rate_limiter.record_request(endpoint_type)
-            
             # Handle response
             if response.status_code == 401:
                 raise AuthenticationError("Invalid or expired access token")
@@ -178,13 +312,13 @@ class DhanAPIClient:
                 raise RateLimitError("Rate limit exceeded")
             elif not response.ok:
                 try:
-                    error_data = response.json()
+                    error_data = _decode_json(response)
                     error_msg = error_data.get("errorMessage", f"HTTP {response.status_code}")
                 except:
                     error_msg = f"HTTP {response.status_code}: {response.text}"
                 raise APIError(error_msg, response.status_code, error_data if 'error_data' in locals() else None)
             
-            return response.json()
+            return _decode_json(response)
             
         except requests.exceptions.Timeout:
             raise APIError("Request timeout")
@@ -193,15 +327,25 @@ class DhanAPIClient:
         except requests.exceptions.RequestException as e:
             raise APIError(f"Request failed: {str(e)}")
     
-    def get_user_profile(self) -> UserProfile:
+    def get_user_profile(self, force: bool = False) -> UserProfile:
         """Get user profile information.
         
+        Profiles are cached per access token for a few minutes.
+        
+        Args:
+            force: Fetch from the API even if a cached profile is fresh
+        
         Returns:
             User profile data
         """
+        if not force:
+            cached = _PROFILE_CACHE.get(self.access_token)
+            if cached is not None and time.monotonic() - cached[0] < _PROFILE_CACHE_TTL:
+                return cached[1]
+        
         response = self._make_request("GET", "/v2/profile", endpoint_type="non_trading")
         
-        return UserProfile(
+        profile = UserProfile(
             dhan_client_id=response["dhanClientId"],
             token_validity=response["tokenValidity"],
             active_segment=response["activeSegment"],
@@ -210,6 +354,8 @@ class DhanAPIClient:
             data_plan=response["dataPlan"],
             data_validity=response["dataValidity"],
         )
+        _PROFILE_CACHE[self.access_token] = (time.monotonic(), profile)
+        return profile
     
     def get_option_chain(
         self,
@@ -235,68 +381,54 @@ class DhanAPIClient:
             data["Expiry"] = expiry
         
         response = self._make_request("POST", "/v2/optionchain", data, endpoint_type="data")
-        
-        # Parse option chain data
+        return self._parse_option_chain(response, underlying_scrip, underlying_segment, expiry)
+    
+    @staticmethod
+    def _parse_option_chain(
+        response: Dict[str, Any],
+        underlying_scrip: int,
+        underlying_segment: str,
+        expiry: Optional[str],
+    ) -> OptionChain:
+        """Parse an option chain response."""
+        chain_data = response["data"]
+        parse_option = DhanAPIClient._parse_option_data
         strikes = {}
-        for strike_price, strike_data in response["data"]["oc"].items():
-            strike = OptionChainStrike(strike=float(strike_price))
-            
-            # Parse call option data
-            if "ce" in strike_data:
-                ce_data = strike_data["ce"]
-                strike.ce = OptionData(
-                    greeks=Greeks(
-                        delta=ce_data["greeks"]["delta"],
-                        gamma=ce_data["greeks"]["gamma"],
-                        theta=ce_data["greeks"]["theta"],
-                        vega=ce_data["greeks"]["vega"],
-                    ),
-                    implied_volatility=ce_data["implied_volatility"],
-                    last_price=ce_data["last_price"],
-                    oi=ce_data["oi"],
-                    previous_close_price=ce_data["previous_close_price"],
-                    previous_oi=ce_data["previous_oi"],
-                    previous_volume=ce_data["previous_volume"],
-                    top_ask_price=ce_data["top_ask_price"],
-                    top_ask_quantity=ce_data["top_ask_quantity"],
-                    top_bid_price=ce_data["top_bid_price"],
-                    top_bid_quantity=ce_data["top_bid_quantity"],
-                    volume=ce_data["volume"],
-                )
-            
-            # Parse put option data
-            if "pe" in strike_data:
-                pe_data = strike_data["pe"]
-                strike.pe = OptionData(
-                    greeks=Greeks(
-                        delta=pe_data["greeks"]["delta"],
-                        gamma=pe_data["greeks"]["gamma"],
-                        theta=pe_data["greeks"]["theta"],
-                        vega=pe_data["greeks"]["vega"],
-                    ),
-                    implied_volatility=pe_data["implied_volatility"],
-                    last_price=pe_data["last_price"],
-                    oi=pe_data["oi"],
-                    previous_close_price=pe_data["previous_close_price"],
-                    previous_oi=pe_data["previous_oi"],
-                    previous_volume=pe_data["previous_volume"],
-                    top_ask_price=pe_data["top_ask_price"],
-                    top_ask_quantity=pe_data["top_ask_quantity"],
-                    top_bid_price=pe_data["top_bid_price"],
-                    top_bid_quantity=pe_data["top_bid_quantity"],
-                    volume=pe_data["volume"],
-                )
-            
-            strikes[strike_price] = strike
+        for strike_price, strike_data in chain_data["oc"].items():
+            ce_data = strike_data.get("ce")
+            pe_data = strike_data.get("pe")
+            strikes[strike_price] = OptionChainStrike(
+                strike=float(strike_price),
+                ce=parse_option(ce_data) if ce_data is not None else None,
+                pe=parse_option(pe_data) if pe_data is not None else None,
+            )
         
         return OptionChain(
-            underlying_price=response["data"]["last_price"],
+            underlying_price=chain_data["last_price"],
             strikes=strikes,
             expiry=expiry or "",
             underlying_scrip=underlying_scrip,
             underlying_segment=underlying_segment,
         )
     
+    @staticmethod
+    def _parse_option_data(option_data: Dict[str, Any]) -> OptionData:
+        """Parse one CE or PE entry of an option chain response."""
+        return OptionData(
+            greeks=Greeks(*_GREEK_FIELDS(option_data["greeks"])),
+            implied_volatility=option_data["implied_volatility"],
+            last_price=option_data["last_price"],
+            oi=option_data["oi"],
+            previous_close_price=option_data["previous_close_price"],
+            previous_oi=option_data["previous_oi"],
+            previous_volume=option_data["previous_volume"],
+            top_ask_price=option_data["top_ask_price"],
+            top_ask_quantity=option_data["top_ask_quantity"],
+            top_bid_price=option_data["top_bid_price"],
+            top_bid_quantity=option_data["top_bid_quantity"],
+            volume=option_data["volume"],
+        )
+    
     def get_option_expiry_list(
         self, underlying_scrip: int, underlying_segment: str = "IDX_I"
     ) -> List[str]:
@@ -309,13 +441,20 @@ class DhanAPIClient:
         Returns:
             List of expiry dates in YYYY-MM-DD format
         """
+        key = (underlying_scrip, underlying_segment)
+        cached = self._expiry_list_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _EXPIRY_LIST_CACHE_TTL:
+            return list(cached[1])
+        
         data = {
             "UnderlyingScrip": underlying_scrip,
             "UnderlyingSeg": underlying_segment,
         }
         
         response = self._make_request("POST", "/v2/optionchain/expirylist", data, endpoint_type="data")
-        return response["data"]
+        expiries = response["data"]
+        self._expiry_list_cache[key] = (time.monotonic(), list(expiries))
+        return expiries
 
     def get_market_quote(self, security_id: str, exchange_segment: str) -> MarketQuote:
         """Get market quote for an instrument.
@@ -327,21 +466,53 @@ class DhanAPIClient:
         Returns:
             Market quote data
         """
-        data = {
-            "NSE_EQ": [security_id] if exchange_segment == "NSE_EQ" else [],
-            "NSE_FNO": [security_id] if exchange_segment == "NSE_FNO" else [],
-            "BSE_EQ": [security_id] if exchange_segment == "BSE_EQ" else [],
-            "BSE_FNO": [security_id] if exchange_segment == "BSE_FNO" else [],
-            "MCX_COMM": [security_id] if exchange_segment == "MCX_COMM" else [],
-            "NSE_CURR": [security_id] if exchange_segment == "NSE_CURR" else [],
-            "BSE_CURR": [security_id] if exchange_segment == "BSE_CURR" else [],
-        }
+        quotes = self.get_market_quotes({exchange_segment: [security_id]})
+        return quotes[(exchange_segment, security_id)]
 
-        response = self._make_request("POST", "/v2/marketfeed/quote", data, endpoint_type="quote")
+    def get_market_quotes(
+        self, ids_by_segment: Dict[str, List[str]]
+    ) -> Dict[Tuple[str, str], MarketQuote]:
+        """Get market quotes for several instruments in one request.
 
-        # Parse response (assuming single instrument)
-        quote_data = response["data"][exchange_segment][security_id]
+        Args:
+            ids_by_segment: Security IDs to quote, keyed by exchange segment
 
+        Returns:
+            Market quotes keyed by (exchange segment, security ID). Instruments
+            missing from the response are left out.
+        """
+        data = self._quote_request(ids_by_segment)
+        response = self._make_request("POST", "/v2/marketfeed/quote", data, endpoint_type="quote")
+        return self._parse_market_quotes(response, ids_by_segment)
+
+    @staticmethod
+    def _quote_request(ids_by_segment: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Build a market quote request body, listing every segment."""
+        data: Dict[str, List[str]] = {segment: [] for segment in _QUOTE_SEGMENTS}
+        for exchange_segment, security_ids in ids_by_segment.items():
+            data[exchange_segment] = list(security_ids)
+        return data
+
+    @staticmethod
+    def _parse_market_quotes(
+        response: Dict[str, Any], ids_by_segment: Dict[str, List[str]]
+    ) -> Dict[Tuple[str, str], MarketQuote]:
+        """Parse a market quote response for the requested instruments."""
+        quotes = {}
+        for exchange_segment, segment_quotes in response["data"].items():
+            for security_id in ids_by_segment.get(exchange_segment, ()):
+                quote_data = segment_quotes.get(security_id)
+                if quote_data is not None:
+                    quotes[(exchange_segment, security_id)] = DhanAPIClient._parse_market_quote(
+                        security_id, exchange_segment, quote_data
+                    )
+        return quotes
+
+    @staticmethod
+    def _parse_market_quote(
+        security_id: str, exchange_segment: str, quote_data: Dict[str, Any]
+    ) -> MarketQuote:
+        """Parse one instrument of a market quote response."""
         return MarketQuote(
             security_id=security_id,
             exchange_segment=exchange_segment,
@@ -416,6 +587,7 @@ class DhanAPIClient:
             data["boStopLossValue"] = bo_stop_loss_value
 
         response = self._make_request("POST", "/v2/orders", data, endpoint_type="order")
+        self.invalidate_holdings()
         return response["data"]["orderId"]
 
     def get_orders(self) -> List[Order]:
@@ -426,24 +598,7 @@ class DhanAPIClient:
         """
         response = self._make_request("GET", "/v2/orders", endpoint_type="non_trading")
 
-        # Log the actual response structure for debugging
-        logger.debug(f"Orders API response: {response}")
-
-        # Dhan API returns direct array, not wrapped in "data"
-        orders_data = response if isinstance(response, list) else response.get("data", [])
-        if not isinstance(orders_data, list):
-            logger.warning(f"Expected list but got {type(orders_data)}: {orders_data}")
-            return []
-
-        orders = []
-        for order_data in orders_data:
-            try:
-                orders.append(self._parse_order(order_data))
-            except Exception as e:
-                logger.error(f"Error parsing order data {order_data}: {e}")
-                continue
-
-        return orders
+        return self._parse_list(response, "Orders", "order", self._parse_order)
 
     def get_positions(self) -> List[Position]:
         """Get all positions.
@@ -453,52 +608,31 @@ class DhanAPIClient:
         """
         response = self._make_request("GET", "/v2/positions", endpoint_type="non_trading")
 
-        # Log the actual response structure for debugging
-        logger.debug(f"Positions API response: {response}")
-
-        # Dhan API returns direct array, not wrapped in "data"
-        positions_data = response if isinstance(response, list) else response.get("data", [])
-        if not isinstance(positions_data, list):
-            logger.warning(f"Expected list but got {type(positions_data)}: {positions_data}")
-            return []
-
-        positions = []
-        for pos_data in positions_data:
-            try:
-                positions.append(self._parse_position(pos_data))
-            except Exception as e:
-                logger.error(f"Error parsing position data {pos_data}: {e}")
-                continue
-
-        return positions
+        return self._parse_list(response, "Positions", "position", self._parse_position)
 
     def get_holdings(self) -> List[Holding]:
         """Get all holdings.
 
+        Holdings are cached briefly, and the cache is cleared whenever an
+        order is placed.
+
         Returns:
             List of holdings
         """
-        response = self._make_request("GET", "/v2/holdings", endpoint_type="non_trading")
+        cached = self._holdings_cache
+        if cached is not None and time.monotonic() - cached[0] < _HOLDINGS_CACHE_TTL:
+            return list(cached[1])
 
-        # Log the actual response structure for debugging
-        logger.debug(f"Holdings API response: {response}")
-
-        # Dhan API returns direct array, not wrapped in "data"
-        holdings_data = response if isinstance(response, list) else response.get("data", [])
-        if not isinstance(holdings_data, list):
-            logger.warning(f"Expected list but got {type(holdings_data)}: {holdings_data}")
-            return []
-
-        holdings = []
-        for holding_data in holdings_data:
-            try:
-                holdings.append(self._parse_holding(holding_data))
-            except Exception as e:
-                logger.error(f"Error parsing holding data {holding_data}: {e}")
-                continue
+        response = self._make_request("GET", "/v2/holdings", endpoint_type="non_trading")
+        holdings = self._parse_list(response, "Holdings", "holding", self._parse_holding)
 
+        self._holdings_cache = (time.monotonic(), list(holdings))
         return holdings
 
+    def invalidate_holdings(self) -> None:
+        """Drop cached holdings so the next get_holdings call refetches them."""
+        self._holdings_cache = None
+
     def get_fund_limit(self) -> FundLimit:
         """Get fund limit information.
 
@@ -506,9 +640,15 @@ class DhanAPIClient:
             Fund limit data
         """
         response = self._make_request("GET", "/v2/fundlimit", endpoint_type="non_trading")
+        return self._parse_fund_limit(response)
 
-        # Log the actual response structure for debugging
-        logger.debug(f"Fund limit API response: {response}")
+    @staticmethod
+    def _parse_fund_limit(response: Any) -> FundLimit:
+        """Parse a fund limit response."""
+        # Log the actual response structure for debugging (formatting a large
+        # response is costly, so only when enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Fund limit API response: {response}")
 
         # Dhan API returns direct object, not wrapped in "data"
         data = response if isinstance(response, dict) and "dhanClientId" in response else response.get("data", {})
@@ -525,16 +665,73 @@ class DhanAPIClient:
             exposure_margin=data.get("blockedPayoutAmount", 0.0),  # Map to closest field
         )
 
-    def _parse_order(self, order_data: Dict[str, Any]) -> Order:
+    def get_account_snapshot(self) -> AccountSnapshot:
+        """Get orders, positions, holdings and fund limit concurrently.
+
+        The four requests are independent, so the snapshot takes about as
+        long as the slowest of them.
+
+        Returns:
+            Account snapshot
+        """
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="dhan-account") as executor:
+            orders = executor.submit(self.get_orders)
+            positions = executor.submit(self.get_positions)
+            holdings = executor.submit(self.get_holdings)
+            fund_limit = executor.submit(self.get_fund_limit)
+
+            return AccountSnapshot(
+                orders=orders.result(),
+                positions=positions.result(),
+                holdings=holdings.result(),
+                fund_limit=fund_limit.result(),
+            )
+
+    @staticmethod
+    def _parse_list(response: Any, name: str, label: str, parse: Callable[[Dict[str, Any]], Any]) -> list:
+        """Parse a list response, skipping entries that fail to parse.
+
+        Args:
+            response: Decoded API response
+            name: Response name for the debug log
+            label: Entry name for error logs
+            parse: Parser for one entry
+
+        Returns:
+            Parsed entries
+        """
+        # Log the actual response structure for debugging (formatting a large
+        # response is costly, so only when enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{name} API response: {response}")
+
+        # Dhan API returns direct array, not wrapped in "data"
+        items = response if isinstance(response, list) else response.get("data", [])
+        if not isinstance(items, list):
+            logger.warning(f"Expected list but got {type(items)}: {items}")
+            return []
+
+        parsed = []
+        for item in items:
+            try:
+                parsed.append(parse(item))
+            except Exception as e:
+                logger.error(f"Error parsing {label} data {item}: {e}")
+                continue
+
+        return parsed
+
+    @staticmethod
+    def _parse_order(order_data: Dict[str, Any]) -> Order:
         """Parse order data from API response."""
         return Order(
             order_id=order_data["orderId"],
             dhan_client_id=order_data["dhanClientId"],
-            order_status=OrderStatus(order_data["orderStatus"]),
-            transaction_type=TransactionType(order_data["transactionType"]),
-            exchange_segment=ExchangeSegment(order_data["exchangeSegment"]),
-            product_type=ProductType(order_data["productType"]),
-            order_type=OrderType(order_data["orderType"]),
+            order_status=_to_enum(_ORDER_STATUSES, OrderStatus, order_data["orderStatus"]),
+            transaction_type=_to_enum(_TRANSACTION_TYPES, TransactionType, order_data["transactionType"]),
+            exchange_segment=_to_enum(_EXCHANGE_SEGMENTS, ExchangeSegment, order_data["exchangeSegment"]),
+            product_type=_to_enum(_PRODUCT_TYPES, ProductType, order_data["productType"]),
+            order_type=_to_enum(_ORDER_TYPES, OrderType, order_data["orderType"]),
             security_id=order_data["securityId"],
             quantity=order_data["quantity"],
             disclosed_quantity=order_data["disclosedQuantity"],
@@ -549,12 +746,13 @@ class DhanAPIClient:
             bo_stop_loss_value=order_data.get("boStopLossValue"),
         )
 
-    def _parse_position(self, pos_data: Dict[str, Any]) -> Position:
+    @staticmethod
+    def _parse_position(pos_data: Dict[str, Any]) -> Position:
         """Parse position data from API response."""
         return Position(
             dhan_client_id=pos_data["dhanClientId"],
-            exchange_segment=ExchangeSegment(pos_data["exchangeSegment"]),
-            product_type=ProductType(pos_data["productType"]),
+            exchange_segment=_to_enum(_EXCHANGE_SEGMENTS, ExchangeSegment, pos_data["exchangeSegment"]),
+            product_type=_to_enum(_PRODUCT_TYPES, ProductType, pos_data["productType"]),
             security_id=pos_data["securityId"],
             net_quantity=pos_data["netQty"],
             buy_avg=pos_data["buyAvg"],
@@ -569,7 +767,8 @@ class DhanAPIClient:
             unrealized_pnl=pos_data["unrealizedPnl"],
         )
 
-    def _parse_holding(self, holding_data: Dict[str, Any]) -> Holding:
+    @staticmethod
+    def _parse_holding(holding_data: Dict[str, Any]) -> Holding:
         """Parse holding data from API response."""
         # Map API fields to our model fields
         # API uses "exchange" instead of "exchangeSegment"
@@ -577,8 +776,8 @@ class DhanAPIClient:
         return Holding(
             isin=holding_data["isin"],
             security_id=holding_data["securityId"],
-            exchange_segment=ExchangeSegment("NSE_EQ"),  # Default since API uses "exchange" field
-            product_type=ProductType("CNC"),  # Default since API doesn't provide this
+            exchange_segment=ExchangeSegment.NSE_EQ,  # Default since API uses "exchange" field
+            product_type=ProductType.CNC,  # Default since API doesn't provide this
             quantity=holding_data.get("totalQty", 0),  # API uses "totalQty"
             avg_cost_price=holding_data["avgCostPrice"],
             last_price=0.0,  # API doesn't provide this in holdings
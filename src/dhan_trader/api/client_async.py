@@ -0,0 +1,394 @@
+"""Asynchronous Dhan API client implementation."""
+
+import asyncio
+import random
+import time
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from ..config import config
+from ..exceptions import (
+    APIError,
+    AuthenticationError,
+    RateLimitError,
+)
+from .client import (
+    DhanAPIClient,
+    RateLimiter,
+    _EXPIRY_LIST_CACHE_TTL,
+    _HOLDINGS_CACHE_TTL,
+    _PROFILE_CACHE,
+    _PROFILE_CACHE_TTL,
+    _RETRY_BACKOFF_JITTER,
+    _RETRY_STATUSES,
+    _loads,
+)
+from .models import (
+    UserProfile,
+    AccountSnapshot,
+    OptionChain,
+    MarketQuote,
+    Order,
+    Position,
+    Holding,
+    FundLimit,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDhanAPIClient:
+    """Asynchronous Dhan API client for market data and account queries.
+
+    Mirrors the read methods of DhanAPIClient, so many option chains or
+    quotes can be polled from one event loop without a thread per request.
+    Responses are parsed by the same code as the sync client.
+
+    Use as an async context manager, or call close() when done::
+
+        async with AsyncDhanAPIClient() as client:
+            chain = await client.get_option_chain(13)
+    """
+
+    def __init__(self, access_token: Optional[str] = None, client_id: Optional[str] = None):
+        """Initialize async Dhan API client.
+
+        Args:
+            access_token: Dhan access token (defaults to config)
+            client_id: Dhan client ID (defaults to config)
+        """
+        self.access_token = access_token or config.api.token
+        self.client_id = client_id
+        self.base_url = config.api.base_url
+        self.timeout = config.api.timeout
+        self.max_retries = config.api.max_retries
+        self.retry_delay = config.api.retry_delay
+
+        if not self.access_token:
+            raise AuthenticationError("Access token is required")
+
+        # Created on first use, since aiohttp sessions belong to a running loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Rate limiter
+        self.rate_limiter = RateLimiter()
+
+        # Short-lived response caches, (monotonic time, value)
+        self._expiry_list_cache: Dict[Tuple[int, str], Tuple[float, List[str]]] = {}
+        self._holdings_cache: Optional[Tuple[float, List[Holding]]] = None
+
+        self._headers = self._get_headers()
+
+    async def __aenter__(self) -> "AsyncDhanAPIClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Open the HTTP session and look up the client ID if it was not given."""
+        self._get_session()
+        if not self.client_id:
+            profile = await self.get_user_profile()
+            self.client_id = profile.dhan_client_id
+            self._headers = self._get_headers()
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Build request headers."""
+        headers = {
+            "access-token": self.access_token,
+            "Content-Type": "application/json",
+        }
+        if self.client_id:
+            headers["client-id"] = self.client_id
+        return headers
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # All requests go to one host; keep room for concurrent callers
+            # so connections are reused instead of re-handshaking
+            connector = aiohttp.TCPConnector(limit=32, limit_per_host=32)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        endpoint_type: str = "non_trading",
+    ) -> Dict[str, Any]:
+        """Make API request with error handling and rate limiting.
+
+        Failed requests are retried as in the sync client: on the same status
+        codes, with jittered exponential backoff or the server's Retry-After
+        delay, and never for order placement.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Request data
+            endpoint_type: Type of endpoint for rate limiting
+
+        Returns:
+            API response data
+
+        Raises:
+            RateLimitError: If rate limit exceeded
+            APIError: If API request fails
+        """
+        # Check rate limits
+        if not self.rate_limiter.acquire(endpoint_type):
+            raise RateLimitError(f"Rate limit exceeded for {endpoint_type} endpoints")
+
+        url = f"{self.base_url}{endpoint}"
+        is_get = method.upper() == "GET"
+        # Never resend an order: a failed reply does not mean it was not placed
+        retryable = is_get or endpoint_type != "order"
+        session = self._get_session()
+
+        try:
+            logger.debug(f"Making {method} request to {url}")
+
+            attempt = 0
+            while True:
+                if is_get:
+                    request = session.get(url, headers=self._headers, params=data)
+                else:
+                    request = session.request(method, url, headers=self._headers, json=data)
+
+                async with request as response:
+                    status = response.status
+                    if retryable and status in _RETRY_STATUSES and attempt < self.max_retries:
+                        attempt += 1
+                        await asyncio.sleep(self._retry_delay(attempt, response.headers.get("Retry-After")))
+                        continue
+
+                    body = await response.read()
+
+                # Handle response
+                if status == 401:
+                    raise AuthenticationError("Invalid or expired access token")
+                elif status == 429:
+                    raise RateLimitError("Rate limit exceeded")
+                elif status >= 400:
+                    error_data = None
+                    try:
+                        error_data = _loads(body)
+                        error_msg = error_data.get("errorMessage", f"HTTP {status}")
+                    except Exception:
+                        error_msg = f"HTTP {status}: {body.decode(errors='replace')}"
+                    raise APIError(error_msg, status, error_data)
+
+                return _loads(body)
+
+        except asyncio.TimeoutError:
+            raise APIError("Request timeout")
+        except aiohttp.ClientConnectionError:
+            raise APIError("Connection error")
+        except aiohttp.ClientError as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Get the wait before a retry, preferring the server's Retry-After seconds."""
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return self.retry_delay * (2 ** (attempt - 1)) + random.uniform(0, _RETRY_BACKOFF_JITTER)
+
+    async def get_user_profile(self, force: bool = False) -> UserProfile:
+        """Get user profile information.
+
+        Profiles are cached per access token for a few minutes, shared with
+        the sync client.
+
+        Args:
+            force: Fetch from the API even if a cached profile is fresh
+
+        Returns:
+            User profile data
+        """
+        if not force:
+            cached = _PROFILE_CACHE.get(self.access_token)
+            if cached is not None and time.monotonic() - cached[0] < _PROFILE_CACHE_TTL:
+                return cached[1]
+
+        response = await self._make_request("GET", "/v2/profile", endpoint_type="non_trading")
+
+        profile = UserProfile(
+            dhan_client_id=response["dhanClientId"],
+            token_validity=response["tokenValidity"],
+            active_segment=response["activeSegment"],
+            ddpi=response["ddpi"],
+            mtf=response["mtf"],
+            data_plan=response["dataPlan"],
+            data_validity=response["dataValidity"],
+        )
+        _PROFILE_CACHE[self.access_token] = (time.monotonic(), profile)
+        return profile
+
+    async def get_option_chain(
+        self,
+        underlying_scrip: int,
+        underlying_segment: str = "IDX_I",
+        expiry: Optional[str] = None,
+    ) -> OptionChain:
+        """Get option chain data.
+
+        Args:
+            underlying_scrip: Security ID of underlying instrument
+            underlying_segment: Exchange segment of underlying
+            expiry: Expiry date (YYYY-MM-DD format)
+
+        Returns:
+            Option chain data
+        """
+        data = {
+            "UnderlyingScrip": underlying_scrip,
+            "UnderlyingSeg": underlying_segment,
+        }
+        if expiry:
+            data["Expiry"] = expiry
+
+        response = await self._make_request("POST", "/v2/optionchain", data, endpoint_type="data")
+        return DhanAPIClient._parse_option_chain(response, underlying_scrip, underlying_segment, expiry)
+
+    async def get_option_expiry_list(
+        self, underlying_scrip: int, underlying_segment: str = "IDX_I"
+    ) -> List[str]:
+        """Get list of option expiry dates.
+
+        Args:
+            underlying_scrip: Security ID of underlying instrument
+            underlying_segment: Exchange segment of underlying
+
+        Returns:
+            List of expiry dates in YYYY-MM-DD format
+        """
+        key = (underlying_scrip, underlying_segment)
+        cached = self._expiry_list_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _EXPIRY_LIST_CACHE_TTL:
+            return list(cached[1])
+
+        data = {
+            "UnderlyingScrip": underlying_scrip,
+            "UnderlyingSeg": underlying_segment,
+        }
+
+        response = await self._make_request("POST", "/v2/optionchain/expirylist", data, endpoint_type="data")
+        expiries = response["data"]
+        self._expiry_list_cache[key] = (time.monotonic(), list(expiries))
+        return expiries
+
+    async def get_market_quote(self, security_id: str, exchange_segment: str) -> MarketQuote:
+        """Get market quote for an instrument.
+
+        Args:
+            security_id: Security ID of the instrument
+            exchange_segment: Exchange segment
+
+        Returns:
+            Market quote data
+        """
+        quotes = await self.get_market_quotes({exchange_segment: [security_id]})
+        return quotes[(exchange_segment, security_id)]
+
+    async def get_market_quotes(
+        self, ids_by_segment: Dict[str, List[str]]
+    ) -> Dict[Tuple[str, str], MarketQuote]:
+        """Get market quotes for several instruments in one request.
+
+        Args:
+            ids_by_segment: Security IDs to quote, keyed by exchange segment
+
+        Returns:
+            Market quotes keyed by (exchange segment, security ID). Instruments
+            missing from the response are left out.
+        """
+        data = DhanAPIClient._quote_request(ids_by_segment)
+        response = await self._make_request("POST", "/v2/marketfeed/quote", data, endpoint_type="quote")
+        return DhanAPIClient._parse_market_quotes(response, ids_by_segment)
+
+    async def get_orders(self) -> List[Order]:
+        """Get all orders.
+
+        Returns:
+            List of orders
+        """
+        response = await self._make_request("GET", "/v2/orders", endpoint_type="non_trading")
+        return DhanAPIClient._parse_list(response, "Orders", "order", DhanAPIClient._parse_order)
+
+    async def get_positions(self) -> List[Position]:
+        """Get all positions.
+
+        Returns:
+            List of positions
+        """
+        response = await self._make_request("GET", "/v2/positions", endpoint_type="non_trading")
+        return DhanAPIClient._parse_list(response, "Positions", "position", DhanAPIClient._parse_position)
+
+    async def get_holdings(self) -> List[Holding]:
+        """Get all holdings.
+
+        Holdings are cached briefly; call invalidate_holdings() after placing
+        an order.
+
+        Returns:
+            List of holdings
+        """
+        cached = self._holdings_cache
+        if cached is not None and time.monotonic() - cached[0] < _HOLDINGS_CACHE_TTL:
+            return list(cached[1])
+
+        response = await self._make_request("GET", "/v2/holdings", endpoint_type="non_trading")
+        holdings = DhanAPIClient._parse_list(response, "Holdings", "holding", DhanAPIClient._parse_holding)
+
+        self._holdings_cache = (time.monotonic(), list(holdings))
+        return holdings
+
+    def invalidate_holdings(self) -> None:
+        """Drop cached holdings so the next get_holdings call refetches them."""
+        self._holdings_cache = None
+
+    async def get_fund_limit(self) -> FundLimit:
+        """Get fund limit information.
+
+        Returns:
+            Fund limit data
+        """
+        response = await self._make_request("GET", "/v2/fundlimit", endpoint_type="non_trading")
+        return DhanAPIClient._parse_fund_limit(response)
+
+    async def get_account_snapshot(self) -> AccountSnapshot:
+        """Get orders, positions, holdings and fund limit concurrently.
+
+        Returns:
+            Account snapshot
+        """
+        orders, positions, holdings, fund_limit = await asyncio.gather(
+            self.get_orders(),
+            self.get_positions(),
+            self.get_holdings(),
+            self.get_fund_limit(),
+        )
+        return AccountSnapshot(
+            orders=orders,
+            positions=positions,
+            holdings=holdings,
+            fund_limit=fund_limit,
+        )
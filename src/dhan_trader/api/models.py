@@ -1,9 +1,35 @@
 """Data models for Dhan API responses."""
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, fields
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 from datetime import datetime
+from itertools import chain
+
+import numpy as np
+
+# Greeks row for a missing option leg in OptionChain.option_arrays()
+_NO_GREEKS = (np.nan, np.nan, np.nan, np.nan)
+
+
+def _with_slots(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+
+    Equivalent to dataclass(slots=True), which needs Python 3.10. Used for
+    models created per strike in every option chain or per depth level,
+    where dropping the instance __dict__ saves memory and speeds up
+    attribute access.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    # Defaults live in the generated __init__; class attributes would clash with the slots
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
 
 
 class ExchangeSegment(Enum):
@@ -64,6 +90,7 @@ class UserProfile:
     data_validity: str
 
 
+@_with_slots
 @dataclass
 class Greeks:
     """Options Greeks."""
@@ -73,6 +100,7 @@ class Greeks:
     vega: float
 
 
+@_with_slots
 @dataclass
 class OIChangeData:
     """Open Interest change data."""
@@ -83,6 +111,7 @@ class OIChangeData:
     timestamp: datetime  # When the change was calculated
 
 
+@_with_slots
 @dataclass
 class OptionData:
     """Option contract data."""
@@ -101,6 +130,7 @@ class OptionData:
     oi_change: Optional[OIChangeData] = None  # OI change data
 
 
+@_with_slots
 @dataclass
 class OptionChainStrike:
     """Option chain data for a specific strike."""
@@ -118,6 +148,123 @@ class OptionChain:
     underlying_scrip: int
     underlying_segment: str
 
+    def as_soa(self) -> Dict[str, Any]:
+        """
+        Get the strikes as parallel NumPy arrays (structure of arrays).
+
+        Built on first use and kept on the instance, so every analyzer
+        working on the same chain shares one extraction. Missing CE/PE
+        legs contribute zero volume and OI.
+
+        Returns:
+            Dictionary with "strike", "ce_volume", "ce_oi", "pe_volume" and
+            "pe_oi" arrays plus the "ce"/"pe" option objects, in chain order
+        """
+        try:
+            return self._soa
+        except AttributeError:
+            pass
+
+        # Handle both dictionary and list structures for strikes
+        if isinstance(self.strikes, dict):
+            # Dictionary structure: {strike_price: strike_data}; keys are parsed straight into the array
+            strike_prices = map(float, self.strikes)
+            strike_objects = self.strikes.values()
+        elif isinstance(self.strikes, list):
+            # List structure: [strike_data_with_strike_field]
+            strike_objects = self.strikes
+            strike_prices = (strike_data.strike for strike_data in strike_objects)
+        else:
+            strike_prices, strike_objects = (), ()
+
+        n = len(strike_objects)
+        ce = [strike_data.ce for strike_data in strike_objects]
+        pe = [strike_data.pe for strike_data in strike_objects]
+
+        self._soa = {
+            "strike": np.fromiter(strike_prices, dtype=np.float64, count=n),
+            "ce_volume": np.fromiter((o.volume if o else 0 for o in ce), dtype=np.int64, count=n),
+            "ce_oi": np.fromiter((o.oi if o else 0 for o in ce), dtype=np.int64, count=n),
+            "pe_volume": np.fromiter((o.volume if o else 0 for o in pe), dtype=np.int64, count=n),
+            "pe_oi": np.fromiter((o.oi if o else 0 for o in pe), dtype=np.int64, count=n),
+            "ce": ce,
+            "pe": pe
+        }
+        return self._soa
+
+    def option_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Get option prices, implied volatility and greeks as parallel arrays.
+
+        Complements as_soa(), in the same chain order, for IV surface and
+        greek aggregates. Kept separate so callers that only need volume
+        and OI do not pay for these. Built on first use and kept on the
+        instance. Missing CE/PE legs are NaN.
+
+        Returns:
+            Dictionary with "last_price", "iv", "delta", "gamma", "theta"
+            and "vega" arrays for each of the "ce_" and "pe_" prefixes
+        """
+        try:
+            return self._option_arrays
+        except AttributeError:
+            pass
+
+        soa = self.as_soa()
+        n = soa["strike"].shape[0]
+        arrays = {}
+        for side in ("ce", "pe"):
+            options = soa[side]
+            arrays[f"{side}_last_price"] = np.fromiter(
+                (o.last_price if o else np.nan for o in options), dtype=np.float64, count=n
+            )
+            arrays[f"{side}_iv"] = np.fromiter(
+                (o.implied_volatility if o else np.nan for o in options), dtype=np.float64, count=n
+            )
+            greeks = np.array(
+                [(o.greeks.delta, o.greeks.gamma, o.greeks.theta, o.greeks.vega) if o else _NO_GREEKS
+                 for o in options],
+                dtype=np.float64,
+            ).reshape(n, 4)
+            arrays[f"{side}_delta"] = greeks[:, 0]
+            arrays[f"{side}_gamma"] = greeks[:, 1]
+            arrays[f"{side}_theta"] = greeks[:, 2]
+            arrays[f"{side}_vega"] = greeks[:, 3]
+
+        self._option_arrays = arrays
+        return self._option_arrays
+
+    def sorted_strikes(self) -> Tuple[np.ndarray, List[str]]:
+        """
+        Get the strike prices in ascending order with their keys in strikes.
+
+        Built on first use and kept on the instance, so range lookups can
+        binary search the prices instead of parsing every key. Keys that are
+        not numbers are left out. Equal prices keep chain order.
+
+        Returns:
+            Tuple of (sorted strike prices, matching strike keys)
+        """
+        try:
+            return self._sorted_strikes
+        except AttributeError:
+            pass
+
+        keys = []
+        prices = []
+        if isinstance(self.strikes, dict):
+            for key in self.strikes:
+                try:
+                    prices.append(float(key))
+                except (ValueError, TypeError):
+                    continue
+                keys.append(key)
+
+        prices = np.array(prices, dtype=np.float64)
+        order = np.argsort(prices, kind="stable")
+        self._sorted_strikes = (prices[order], [keys[i] for i in order.tolist()])
+        return self._sorted_strikes
+
 
 @dataclass
 class MarketQuote:
@@ -210,6 +357,15 @@ class FundLimit:
     exposure_margin: float
 
 
+@dataclass
+class AccountSnapshot:
+    """Orders, positions, holdings and fund limit fetched together."""
+    orders: List[Order]
+    positions: List[Position]
+    holdings: List[Holding]
+    fund_limit: FundLimit
+
+
 @dataclass
 class HistoricalData:
     """Historical price data."""
@@ -222,6 +378,7 @@ class HistoricalData:
     oi: Optional[int] = None
 
 
+@_with_slots
 @dataclass
 class MarketDepthLevel:
     """Single level of market depth data."""
@@ -249,6 +406,34 @@ class MarketDepth20Response:
     ask_depth: MarketDepth20Level
     timestamp: datetime
 
+    def as_soa(self) -> Dict[str, Any]:
+        """
+        Get both sides of the book as parallel NumPy arrays (structure of arrays).
+
+        Bid levels come first, followed by ask levels, each in book order.
+        Built on first use and kept on the instance.
+
+        Returns:
+            Dictionary with "price", "quantity" and "orders" arrays and
+            "n_bid", the number of leading bid levels
+        """
+        try:
+            return self._soa
+        except AttributeError:
+            pass
+
+        bid_levels = self.bid_depth.levels
+        ask_levels = self.ask_depth.levels
+        n = len(bid_levels) + len(ask_levels)
+
+        self._soa = {
+            "price": np.fromiter((level.price for level in chain(bid_levels, ask_levels)), dtype=np.float64, count=n),
+            "quantity": np.fromiter((level.quantity for level in chain(bid_levels, ask_levels)), dtype=np.int64, count=n),
+            "orders": np.fromiter((level.orders for level in chain(bid_levels, ask_levels)), dtype=np.int64, count=n),
+            "n_bid": len(bid_levels)
+        }
+        return self._soa
+
     def get_total_bid_quantity(self) -> int:
         """Get total bid quantity across all levels."""
         return sum(level.quantity for level in self.bid_depth.levels)
@@ -265,7 +450,19 @@ class MarketDepth20Response:
         return self.get_total_bid_quantity() / total_ask
 
     def detect_demand_supply_zones(self, threshold_multiplier: float = 2.0) -> Dict[str, List[int]]:
-        """Detect significant demand/supply zones based on quantity concentration."""
+        """
+        Detect significant demand/supply zones based on quantity concentration.
+
+        Results are kept on the instance per threshold, so the depth manager
+        and the analyzer share one detection per snapshot.
+        """
+        try:
+            return self._zones[threshold_multiplier]
+        except AttributeError:
+            self._zones = {}
+        except KeyError:
+            pass
+
         avg_bid_qty = self.get_total_bid_quantity() / len(self.bid_depth.levels) if self.bid_depth.levels else 0
         avg_ask_qty = self.get_total_ask_quantity() / len(self.ask_depth.levels) if self.ask_depth.levels else 0
 
@@ -282,10 +479,11 @@ class MarketDepth20Response:
             if level.quantity > avg_ask_qty * threshold_multiplier:
                 supply_zones.append(i)
 
-        return {
+        self._zones[threshold_multiplier] = {
             "demand_zones": demand_zones,
             "supply_zones": supply_zones
         }
+        return self._zones[threshold_multiplier]
 
 
 @dataclass
@@ -3,14 +3,20 @@
 import asyncio
 import logging
 import time
+from dataclasses import asdict
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
 
 from ..config import config
 from ..api.client import DhanAPIClient
@@ -30,15 +36,39 @@ from .chat_models import (
     StrategyRequest, StrategyResponse, QuickAnalysisRequest, QuickAnalysisResponse,
     RangeOIRequest, RangeOIResponse, OIRecommendationRequest, OIRecommendationResponse,
     QuickOISignalResponse, EnhancedChatRequest, EnhancedChatResponse,
-    DynamicOIAnalysisModel, OIPatternModel
+    DynamicOIAnalysisModel, ENHANCED_CHAT_RESPONSE_ADAPTER,
+    DYNAMIC_OI_ANALYSIS_ADAPTER, RANGE_OI_RESPONSE_ADAPTER
 )
 from .models import (
     EnhancedOIRecommendationResponse, RangeOIResponse as RangeOIResponseModel,
-    IndividualStrikeResponse, RangeOIAnalysisResponse, RangeStrikeOIData, RangeOIMetricsData
+    IndividualStrikeResponse, RangeOIAnalysisResponse
 )
 
 logger = logging.getLogger(__name__)
 
+
+def _json_response(content: Any) -> Response:
+    """
+    Serialize plain JSON data straight into a response.
+
+    Returning a Response skips FastAPI's response_model validation, which
+    otherwise re-checks every item of large payloads. Uses orjson when it
+    is installed.
+    """
+    if orjson is not None:
+        return Response(content=orjson.dumps(content), media_type="application/json")
+    return JSONResponse(content=content)
+
+
+def _adapter_response(adapter: TypeAdapter, data: Dict[str, Any]) -> Response:
+    """
+    Validate response data once and serialize it with a prebuilt adapter.
+
+    Skips the second validation pass FastAPI runs against response_model.
+    """
+    return Response(content=adapter.dump_json(adapter.validate_python(data)), media_type="application/json")
+
+
 # Global instances
 api_client: Optional[DhanAPIClient] = None
 market_data_manager: Optional[MarketDataManager] = None
@@ -219,7 +249,13 @@ async def lifespan(app: FastAPI):
         logger.info("Enhanced chat service with dynamic OI analysis initialized")
 
         # Initialize range OI analyzer
-        range_oi_analyzer = RangeOIAnalyzer(market_data_manager)
+        range_oi_cache = config.get("analytics.range_oi_cache", {})
+        range_oi_analyzer = RangeOIAnalyzer(
+            market_data_manager,
+            cache_dir=range_oi_cache.get("directory") if range_oi_cache.get("enabled") else None,
+            cache_max_entries=range_oi_cache.get("max_entries", 500),
+            cache_min_compute_ms=range_oi_cache.get("min_compute_ms", 50.0)
+        )
         logger.info("Range OI analyzer initialized")
 
         # Initialize OI strategy
@@ -247,6 +283,8 @@ async def lifespan(app: FastAPI):
         # Cleanup
         if market_data_manager:
             market_data_manager.stop_live_feed()
+        if range_oi_analyzer:
+            range_oi_analyzer.close()
         logger.info("Application shutdown complete")
 
 
@@ -1088,45 +1126,15 @@ async def send_enhanced_chat_message(
 
         processing_time = time.time() - start_time
 
-        # Convert internal models to API models
-        oi_analysis_model = None
-        if response.oi_analysis:
-            patterns = [
-                OIPatternModel(
-                    pattern_type=p.pattern_type,
-                    confidence=p.confidence,
-                    description=p.description,
-                    strikes_involved=p.strikes_involved,
-                    magnitude=p.magnitude,
-                    direction=p.direction,
-                    time_horizon=p.time_horizon,
-                    risk_level=p.risk_level
-                )
-                for p in response.oi_analysis.patterns
-            ]
-
-            oi_analysis_model = DynamicOIAnalysisModel(
-                timestamp=response.oi_analysis.timestamp,
-                underlying_price=response.oi_analysis.underlying_price,
-                patterns=patterns,
-                overall_sentiment=response.oi_analysis.overall_sentiment,
-                confidence_score=response.oi_analysis.confidence_score,
-                recommendation=response.oi_analysis.recommendation,
-                reasoning=response.oi_analysis.reasoning,
-                risk_assessment=response.oi_analysis.risk_assessment,
-                key_levels=response.oi_analysis.key_levels,
-                statistical_summary=response.oi_analysis.statistical_summary
-            )
-
-        return EnhancedChatResponse(
-            message=response.message,
-            session_id=response.message.id,  # Use message ID as session ID for now
-            processing_time=processing_time,
-            analysis_type=response.analysis_type,
-            oi_analysis=oi_analysis_model,
-            confidence_score=response.confidence_score,
-            market_data_used=request.use_market_data
-        )
+        return _adapter_response(ENHANCED_CHAT_RESPONSE_ADAPTER, {
+            "message": response.message,
+            "session_id": response.message.id,  # Use message ID as session ID for now
+            "processing_time": processing_time,
+            "analysis_type": response.analysis_type,
+            "oi_analysis": asdict(response.oi_analysis) if response.oi_analysis else None,
+            "confidence_score": response.confidence_score,
+            "market_data_used": request.use_market_data
+        })
 
     except Exception as e:
         logger.error(f"Error processing enhanced chat message: {e}")
@@ -1146,33 +1154,7 @@ async def get_dynamic_oi_analysis(
             expiry=expiry
         )
 
-        # Convert internal model to API model
-        patterns = [
-            OIPatternModel(
-                pattern_type=p.pattern_type,
-                confidence=p.confidence,
-                description=p.description,
-                strikes_involved=p.strikes_involved,
-                magnitude=p.magnitude,
-                direction=p.direction,
-                time_horizon=p.time_horizon,
-                risk_level=p.risk_level
-            )
-            for p in analysis.patterns
-        ]
-
-        return DynamicOIAnalysisModel(
-            timestamp=analysis.timestamp,
-            underlying_price=analysis.underlying_price,
-            patterns=patterns,
-            overall_sentiment=analysis.overall_sentiment,
-            confidence_score=analysis.confidence_score,
-            recommendation=analysis.recommendation,
-            reasoning=analysis.reasoning,
-            risk_assessment=analysis.risk_assessment,
-            key_levels=analysis.key_levels,
-            statistical_summary=analysis.statistical_summary
-        )
+        return _adapter_response(DYNAMIC_OI_ANALYSIS_ADAPTER, asdict(analysis))
 
     except Exception as e:
         logger.error(f"Error getting dynamic OI analysis: {e}")
@@ -1228,50 +1210,35 @@ async def get_range_oi_analysis(
             underlying_segment=underlying_segment
         )
 
-        # Convert to response model
+        # Build the response body directly; response_model only documents its schema
         strikes_data = [
-            RangeStrikeOIData(
-                strike=strike.strike,
-                call_oi=strike.call_oi,
-                put_oi=strike.put_oi,
-                call_oi_change=strike.call_oi_change,
-                put_oi_change=strike.put_oi_change,
-                call_oi_change_pct=strike.call_oi_change_pct,
-                put_oi_change_pct=strike.put_oi_change_pct,
-                call_volume=strike.call_volume,
-                put_volume=strike.put_volume,
-                timestamp=strike.timestamp.isoformat()
-            )
+            {
+                "strike": strike.strike,
+                "call_oi": strike.call_oi,
+                "put_oi": strike.put_oi,
+                "call_oi_change": strike.call_oi_change,
+                "put_oi_change": strike.put_oi_change,
+                "call_oi_change_pct": strike.call_oi_change_pct,
+                "put_oi_change_pct": strike.put_oi_change_pct,
+                "call_volume": strike.call_volume,
+                "put_volume": strike.put_volume,
+                "timestamp": strike.timestamp.isoformat()
+            }
             for strike in analysis.strikes_data
         ]
 
-        metrics_data = RangeOIMetricsData(
-            total_call_oi=analysis.metrics.total_call_oi,
-            total_put_oi=analysis.metrics.total_put_oi,
-            total_call_oi_change=analysis.metrics.total_call_oi_change,
-            total_put_oi_change=analysis.metrics.total_put_oi_change,
-            average_call_oi=analysis.metrics.average_call_oi,
-            average_put_oi=analysis.metrics.average_put_oi,
-            average_call_oi_change=analysis.metrics.average_call_oi_change,
-            average_put_oi_change=analysis.metrics.average_put_oi_change,
-            strike_count=analysis.metrics.strike_count,
-            call_put_ratio=analysis.metrics.call_put_ratio,
-            net_oi_change=analysis.metrics.net_oi_change,
-            dominant_side=analysis.metrics.dominant_side
-        )
-
-        return RangeOIAnalysisResponse(
-            expiry=analysis.expiry,
-            range_start=analysis.range_start,
-            range_end=analysis.range_end,
-            interval=analysis.interval,
-            strikes_data=strikes_data,
-            metrics=metrics_data,
-            analysis_time=analysis.analysis_time.isoformat(),
-            underlying_price=analysis.underlying_price,
-            total_strikes_analyzed=analysis.total_strikes_analyzed,
-            historical_data=analysis.historical_data
-        )
+        return _json_response({
+            "expiry": analysis.expiry,
+            "range_start": analysis.range_start,
+            "range_end": analysis.range_end,
+            "interval": analysis.interval,
+            "strikes_data": strikes_data,
+            "metrics": asdict(analysis.metrics),
+            "analysis_time": analysis.analysis_time.isoformat(),
+            "underlying_price": analysis.underlying_price,
+            "total_strikes_analyzed": analysis.total_strikes_analyzed,
+            "historical_data": analysis.historical_data
+        })
 
     except HTTPException:
         raise
@@ -1422,7 +1389,7 @@ async def get_oi_strategy_history(
 async def get_range_oi_analysis(
     request: RangeOIRequest,
     strategy: RangeOIStrategy = Depends(get_range_oi_strategy)
-) -> RangeOIResponse:
+) -> Response:
     """
     Get Range-based OI Strategy analysis.
 
@@ -1440,21 +1407,21 @@ async def get_range_oi_analysis(
             upper_strike=request.upper_strike
         )
 
-        return RangeOIResponse(
-            current_price=analysis.current_price,
-            lower_strike=analysis.lower_strike,
-            upper_strike=analysis.upper_strike,
-            lower_strike_pe_oi=analysis.lower_strike_pe_oi,
-            lower_strike_ce_oi=analysis.lower_strike_ce_oi,
-            upper_strike_pe_oi=analysis.upper_strike_pe_oi,
-            upper_strike_ce_oi=analysis.upper_strike_ce_oi,
-            lower_strike_signal=analysis.lower_strike_signal,
-            upper_strike_signal=analysis.upper_strike_signal,
-            overall_signal=analysis.overall_signal,
-            confidence=analysis.confidence,
-            reasoning=analysis.reasoning,
-            timestamp=analysis.timestamp
-        )
+        return _adapter_response(RANGE_OI_RESPONSE_ADAPTER, {
+            "current_price": analysis.current_price,
+            "lower_strike": analysis.lower_strike,
+            "upper_strike": analysis.upper_strike,
+            "lower_strike_pe_oi": analysis.lower_strike_pe_oi,
+            "lower_strike_ce_oi": analysis.lower_strike_ce_oi,
+            "upper_strike_pe_oi": analysis.upper_strike_pe_oi,
+            "upper_strike_ce_oi": analysis.upper_strike_ce_oi,
+            "lower_strike_signal": analysis.lower_strike_signal,
+            "upper_strike_signal": analysis.upper_strike_signal,
+            "overall_signal": analysis.overall_signal,
+            "confidence": analysis.confidence,
+            "reasoning": analysis.reasoning,
+            "timestamp": analysis.timestamp
+        })
 
     except Exception as e:
         logger.error(f"Error in Range OI analysis: {e}")
@@ -1733,8 +1700,8 @@ async def get_enhanced_oi_recommendation(
                         "signal": recommendation.signal,
                         "confidence": recommendation.confidence,
                         "current_price": recommendation.current_price,
-                        "range_analysis": recommendation.range_analysis.__dict__,
-                        "individual_strikes": [strike.__dict__ for strike in recommendation.individual_strikes[:3]]
+                        "range_analysis": asdict(recommendation.range_analysis),
+                        "individual_strikes": [asdict(strike) for strike in recommendation.individual_strikes[:3]]
                     },
                     portfolio_context=None
                 )
@@ -2,12 +2,17 @@
 
 import pytest
 import os
-from unittest.mock import Mock, patch
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, Mock, patch
 
 from src.dhan_trader.config import Config
-from src.dhan_trader.api.client import DhanAPIClient
-from src.dhan_trader.api.models import UserProfile
-from src.dhan_trader.exceptions import AuthenticationError
+from src.dhan_trader.api.client import DhanAPIClient, RateLimiter, _PROFILE_CACHE
+from src.dhan_trader.api.client_async import AsyncDhanAPIClient
+from src.dhan_trader.api.models import OptionChain, UserProfile
+from src.dhan_trader.ai.trading_advisor import TradingAdvisor
+from src.dhan_trader.exceptions import APIError, AuthenticationError
 
 
 class TestConfig:
@@ -26,6 +31,14 @@ class TestConfig:
             assert config.api.token == "test_token"
 
 
+@pytest.fixture(autouse=True)
+def clear_profile_cache():
+    """Keep user profiles cached by one test from leaking into the next."""
+    _PROFILE_CACHE.clear()
+    yield
+    _PROFILE_CACHE.clear()
+
+
 class TestDhanAPIClient:
     """Test Dhan API client."""
     
@@ -45,6 +58,7 @@ class TestDhanAPIClient:
                 "dataPlan": "Active",
                 "dataValidity": "2024-12-31 23:59"
             }
+            mock_response.content = json.dumps(mock_response.json.return_value).encode()
             mock_session.return_value.get.return_value = mock_response
             
             client = DhanAPIClient()
@@ -73,6 +87,7 @@ class TestDhanAPIClient:
                 "dataPlan": "Active",
                 "dataValidity": "2024-12-31 23:59"
             }
+            mock_response.content = json.dumps(mock_response.json.return_value).encode()
             mock_session.return_value.get.return_value = mock_response
             
             client = DhanAPIClient()
@@ -83,6 +98,154 @@ class TestDhanAPIClient:
             assert profile.active_segment == "Equity, Derivative"
 
 
+class _FakeAsyncResponse:
+    """aiohttp response stand-in that always fails with 503."""
+    
+    status = 503
+    headers = {"Retry-After": "0"}
+    
+    async def read(self):
+        return b""
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class TestRetryPolicy:
+    """Test which requests are retried on transient failures."""
+    
+    def test_orders_are_never_resent(self):
+        """Test POST is retried for read-only endpoints but not for orders."""
+        client = DhanAPIClient(access_token="test_token", client_id="1100000001")
+        
+        def allowed_methods(endpoint):
+            adapter = client.session.get_adapter(f"{client.base_url}{endpoint}")
+            return adapter.max_retries.allowed_methods
+        
+        assert "POST" not in allowed_methods("/v2/orders")
+        assert "POST" not in allowed_methods("/v2/orders/112111182198")
+        assert "GET" in allowed_methods("/v2/orders")
+        assert "POST" in allowed_methods("/v2/optionchain")
+        assert "POST" in allowed_methods("/v2/marketfeed/quote")
+    
+    def test_async_orders_are_never_resent(self):
+        """Test the async client retries a failing data POST but not an order."""
+        client = AsyncDhanAPIClient(access_token="test_token", client_id="1100000001")
+        client.max_retries = 2
+        session = Mock()
+        session.request.side_effect = lambda *args, **kwargs: _FakeAsyncResponse()
+        
+        with patch.object(client, "_get_session", return_value=session):
+            with pytest.raises(APIError):
+                asyncio.run(client._make_request("POST", "/v2/orders", {}, endpoint_type="order"))
+            assert session.request.call_count == 1
+            
+            session.request.reset_mock()
+            with pytest.raises(APIError):
+                asyncio.run(client._make_request("POST", "/v2/optionchain", {}, endpoint_type="data"))
+            assert session.request.call_count == 3
+
+
+class TestRateLimiter:
+    """Test API rate limiting."""
+    
+    @patch('src.dhan_trader.api.client.time')
+    def test_acquire_frees_slot_after_window(self, mock_time):
+        """Test a quote slot is taken by acquire and freed a second later."""
+        mock_time.monotonic.return_value = 1000.0
+        limiter = RateLimiter()
+        
+        assert limiter.acquire("quote")
+        assert not limiter.acquire("quote")
+        
+        mock_time.monotonic.return_value = 1001.0
+        assert limiter.acquire("quote")
+    
+    @patch('src.dhan_trader.api.client.time')
+    def test_acquire_enforces_per_minute_limit(self, mock_time):
+        """Test longer windows still apply once the per-second window frees up."""
+        limiter = RateLimiter()
+        
+        # 25 orders a second for 10 seconds uses up the 250 per minute
+        for second in range(10):
+            mock_time.monotonic.return_value = 1000.0 + second
+            assert all(limiter.acquire("order") for _ in range(25))
+        
+        mock_time.monotonic.return_value = 1010.0
+        assert not limiter.acquire("order")
+        
+        mock_time.monotonic.return_value = 1060.0
+        assert limiter.acquire("order")
+    
+    @patch('src.dhan_trader.api.client.time')
+    def test_acquire_is_atomic_across_threads(self, mock_time):
+        """Test a threaded burst within one second never exceeds the order limit."""
+        mock_time.monotonic.return_value = 1000.0
+        limiter = RateLimiter()
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+        results = []
+        
+        def burst():
+            barrier.wait()
+            granted = [limiter.acquire("order") for _ in range(20)]
+            results.extend(granted)
+        
+        threads = [threading.Thread(target=burst) for _ in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == n_threads * 20
+        assert sum(results) == 25
+
+
+class TestTradingAdvisor:
+    """Test the AI trading advisor."""
+    
+    @patch('src.dhan_trader.ai.trading_advisor.OIRecommendationService')
+    @patch('src.dhan_trader.ai.trading_advisor.GeminiAIClient')
+    def test_multi_analysis_uses_one_underlying(self, mock_ai_client, mock_oi_service):
+        """Test every analysis type runs for the requested underlying."""
+        market_data_manager = Mock()
+        market_data_manager.get_option_chain_with_oi_changes.return_value = OptionChain(
+            underlying_price=48000.0, strikes={}, expiry="2024-01-25",
+            underlying_scrip=25, underlying_segment="IDX_I"
+        )
+        advisor = TradingAdvisor(market_data_manager, Mock())
+        advisor.ai_client = AsyncMock()
+        advisor.ai_client.analyze_option_chain.return_value = "option chain"
+        advisor.ai_client.suggest_option_strategies.return_value = "strategies"
+        advisor.ai_client.analyze_unusual_activity.return_value = "unusual activity"
+        advisor.ai_client.answer_trading_question.return_value = "volatility"
+        
+        option = {"last_price": 120.0, "implied_volatility": 14.0, "volume": 5000,
+                  "open_interest": 80000, "greeks": None}
+        strike = {"strike": 48000.0, "call_data": option, "put_data": option}
+        market_analysis = {
+            "underlying_price": 48000.0,
+            "market_data": {"atm_strikes": [strike], "relevant_strikes": [strike], "liquid_strikes": [strike]},
+        }
+        types = ["option_chain", "strategies", "unusual_activity", "oi_changes", "volatility"]
+        
+        with patch.object(advisor, "analyze_current_market", AsyncMock(return_value=market_analysis)) as analyze:
+            results = asyncio.run(advisor.multi_analysis(types, underlying_scrip=25))
+        
+        assert analyze.await_count > 0
+        assert all(call.args == (25,) for call in analyze.await_args_list)
+        assert market_data_manager.get_option_chain_with_oi_changes.call_args.kwargs["underlying_scrip"] == 25
+        assert results[:3] == ["option chain", "strategies", "unusual activity"]
+        assert results[4] == "volatility"
+        assert not any(result.startswith("Sorry") for result in results)
+        
+        # Each strike is reported once even when it is both near the money and liquid
+        assert len(advisor.ai_client.analyze_unusual_activity.await_args.args[0]) == 2
+
+
 class TestMarketDataModels:
     """Test market data models."""
     